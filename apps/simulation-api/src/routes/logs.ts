@@ -38,6 +38,139 @@ interface FilterParams {
   sessionId?: string;
   searchTerm?: string;
   limit?: string;
+  fields?: string | string[];
+}
+
+/** Filter criteria with dates and search term pre-processed once per query */
+interface FilterCriteria {
+  level?: string;
+  source?: string;
+  component?: string;
+  sessionId?: string;
+  startDateTime: number | null;
+  endDateTime: number | null;
+  searchLower?: string;
+  limit: number;
+}
+
+/**
+ * Parse a `fields` projection: a comma-separated string or an array of
+ * names. Returns null (keep every field) when absent or empty.
+ */
+function parseFields(value: unknown): string[] | null {
+  const names = (Array.isArray(value) ? value : typeof value === 'string' ? value.split(',') : [])
+    .map(name => String(name).trim())
+    .filter(Boolean);
+  return names.length > 0 ? names : null;
+}
+
+/** Keep only the requested fields of an entry (matching always sees the full entry) */
+function projectEntry(entry: LogEntry, fields: string[] | null): Partial<LogEntry> {
+  if (!fields) return entry;
+  const projected: Partial<LogEntry> = {};
+  for (const field of fields) {
+    if (field in entry) projected[field] = entry[field];
+  }
+  return projected;
+}
+
+function projectLogs(logs: LogEntry[], fields: string[] | null): Partial<LogEntry>[] {
+  return fields ? logs.map(entry => projectEntry(entry, fields)) : logs;
+}
+
+/** Content type of the streamed GET /api/logs/filter response: one JSON entry per line */
+const NDJSON = 'application/x-ndjson';
+
+/** Maximum number of queries accepted by POST /api/logs/filter/batch */
+const MAX_BATCH_QUERIES = 20;
+
+function toCriteria(params: FilterParams, defaultLimit: string = '100'): FilterCriteria {
+  const { level, source, component, startDate, endDate, sessionId, searchTerm } = params;
+  const limit = params.limit ?? defaultLimit;
+
+  return {
+    level,
+    source,
+    component,
+    sessionId,
+    // Parse dates for filtering
+    startDateTime: startDate ? new Date(startDate).getTime() : null,
+    endDateTime: endDate ? new Date(endDate).getTime() : null,
+    searchLower: searchTerm ? String(searchTerm).toLowerCase() : undefined,
+    limit: parseInt(String(limit), 10) || 100
+  };
+}
+
+function matchesFilter(entry: LogEntry, criteria: FilterCriteria, searchableContent: () => string): boolean {
+  // Apply filters
+  if (criteria.level && entry.level !== criteria.level) return false;
+  if (criteria.source && entry.source !== criteria.source) return false;
+  if (criteria.component && entry.component !== criteria.component) return false;
+  if (criteria.sessionId && entry.sessionId !== criteria.sessionId) return false;
+
+  // Date range filter
+  if (criteria.startDateTime || criteria.endDateTime) {
+    const entryTime = new Date(entry.timestamp).getTime();
+    if (criteria.startDateTime && entryTime < criteria.startDateTime) return false;
+    if (criteria.endDateTime && entryTime > criteria.endDateTime) return false;
+  }
+
+  // Search term filter (case-insensitive)
+  if (criteria.searchLower && !searchableContent().includes(criteria.searchLower)) return false;
+
+  return true;
+}
+
+/**
+ * Scan the log files once (newest file first) and collect the matches for
+ * every query. Each line is parsed once no matter how many queries there
+ * are; the scan stops as soon as every query has reached its limit.
+ * onMatch, if given, is called with each match as soon as it is found.
+ */
+async function scanLogs(
+  queries: FilterCriteria[],
+  onMatch?: (queryIndex: number, entry: LogEntry) => void
+): Promise<{ results: LogEntry[][]; filesProcessed: number }> {
+  const results: LogEntry[][] = queries.map(() => []);
+  const isFull = (i: number) => results[i].length >= queries[i].limit;
+
+  // Read all log files in the directory
+  const files = await fs.readdir(LOG_DIR);
+  const logFiles = files.filter(file => file.endsWith('.log')).sort().reverse();
+
+  // Process each log file
+  for (const file of logFiles) {
+    if (queries.every((_, i) => isFull(i))) break;
+
+    const filePath = path.join(LOG_DIR, file);
+    const content = await fs.readFile(filePath, 'utf-8');
+    const lines = content.split('\n').filter(line => line.trim());
+
+    for (const line of lines) {
+      if (queries.every((_, i) => isFull(i))) break;
+
+      try {
+        const entry: LogEntry = JSON.parse(line);
+
+        // Lower-cased JSON of the entry, built at most once and only if a
+        // query has a search term
+        let searchable: string | undefined;
+        const searchableContent = () => (searchable ??= JSON.stringify(entry).toLowerCase());
+
+        queries.forEach((criteria, i) => {
+          if (!isFull(i) && matchesFilter(entry, criteria, searchableContent)) {
+            results[i].push(entry);
+            onMatch?.(i, entry);
+          }
+        });
+      } catch (parseError) {
+        // Skip invalid JSON lines
+        continue;
+      }
+    }
+  }
+
+  return { results, filesProcessed: logFiles.length };
 }
 
 /**
@@ -53,9 +186,14 @@ interface FilterParams {
  *   - sessionId: Filter by session ID
  *   - searchTerm: Search in message and metadata
  *   - limit: Maximum number of results (default: 100)
+ *   - fields: Comma-separated entry fields to return (default: all)
+ *
+ * With "Accept: application/x-ndjson" the matching entries are streamed as
+ * they are found, one JSON object per line, instead of one JSON document.
  *
  * Examples:
  *   curl "http://localhost:3001/api/logs/filter?level=error"
+ *   curl -H "Accept: application/x-ndjson" "http://localhost:3001/api/logs/filter?level=error"
  *   curl "http://localhost:3001/api/logs/filter?source=frontend&limit=50"
  *   curl "http://localhost:3001/api/logs/filter?searchTerm=simulation&level=info"
  */
@@ -77,72 +215,40 @@ router.get('/filter', async (req, res) => {
       filters: { level, source, component, startDate, endDate, sessionId, searchTerm, limit }
     });
 
-    const maxLimit = parseInt(limit, 10) || 100;
-    const results: LogEntry[] = [];
-
-    // Read all log files in the directory
-    const files = await fs.readdir(LOG_DIR);
-    const logFiles = files.filter(file => file.endsWith('.log')).sort().reverse();
-
-    // Parse dates for filtering
-    const startDateTime = startDate ? new Date(startDate).getTime() : null;
-    const endDateTime = endDate ? new Date(endDate).getTime() : null;
-
-    // Process each log file
-    for (const file of logFiles) {
-      if (results.length >= maxLimit) break;
-
-      const filePath = path.join(LOG_DIR, file);
-      const content = await fs.readFile(filePath, 'utf-8');
-      const lines = content.split('\n').filter(line => line.trim());
-
-      for (const line of lines) {
-        if (results.length >= maxLimit) break;
-
-        try {
-          const entry: LogEntry = JSON.parse(line);
-
-          // Apply filters
-          if (level && entry.level !== level) continue;
-          if (source && entry.source !== source) continue;
-          if (component && entry.component !== component) continue;
-          if (sessionId && entry.sessionId !== sessionId) continue;
-
-          // Date range filter
-          if (startDateTime || endDateTime) {
-            const entryTime = new Date(entry.timestamp).getTime();
-            if (startDateTime && entryTime < startDateTime) continue;
-            if (endDateTime && entryTime > endDateTime) continue;
-          }
+    const criteria = toCriteria(req.query as FilterParams);
+    const fields = parseFields(req.query.fields);
 
-          // Search term filter (case-insensitive)
-          if (searchTerm) {
-            const searchLower = searchTerm.toLowerCase();
-            const searchableContent = JSON.stringify(entry).toLowerCase();
-            if (!searchableContent.includes(searchLower)) continue;
-          }
+    if (req.accepts(['application/json', NDJSON]) === NDJSON) {
+      res.type(NDJSON);
+      const { results: [results], filesProcessed } = await scanLogs([criteria], (_, entry) => {
+        res.write(JSON.stringify(projectEntry(entry, fields)) + '\n');
+      });
+      res.end();
 
-          results.push(entry);
-        } catch (parseError) {
-          // Skip invalid JSON lines
-          continue;
-        }
-      }
+      logger.info('Log filter completed (streamed)', {
+        component: 'logs-api',
+        filters: { level, source, component, searchTerm },
+        resultsCount: results.length,
+        filesProcessed
+      });
+      return;
     }
 
+    const { results: [results], filesProcessed } = await scanLogs([criteria]);
+
     logger.info('Log filter completed', {
       component: 'logs-api',
       filters: { level, source, component, searchTerm },
       resultsCount: results.length,
-      filesProcessed: logFiles.length
+      filesProcessed
     });
 
     res.json({
       success: true,
       count: results.length,
-      limit: maxLimit,
+      limit: criteria.limit,
       filters: { level, source, component, startDate, endDate, sessionId, searchTerm },
-      logs: results,
+      logs: projectLogs(results, fields),
       timestamp: new Date().toISOString()
     });
   } catch (error) {
@@ -152,6 +258,94 @@ router.get('/filter', async (req, res) => {
       stack: error instanceof Error ? error.stack : undefined
     });
 
+    // A stream that has already started cannot switch to an error response;
+    // cut it off so the client sees an incomplete body rather than a short one
+    if (res.headersSent) {
+      res.destroy();
+      return;
+    }
+
+    res.status(500).json({
+      success: false,
+      error: 'Failed to filter logs',
+      message: error instanceof Error ? error.message : 'Unknown error',
+      timestamp: new Date().toISOString()
+    });
+  }
+});
+
+/**
+ * POST /api/logs/filter/batch
+ * Run several filter queries against a single scan of the log files
+ *
+ * Body:
+ *   - queries: Array of filter objects (same fields as GET /api/logs/filter)
+ *   - limit: Default limit for queries that do not set their own (default: 100)
+ *   - fields: Default entry fields to return for queries that do not set their own (default: all)
+ *
+ * Example:
+ *   curl -X POST http://localhost:3001/api/logs/filter/batch \
+ *     -H "Content-Type: application/json" \
+ *     -d '{"queries": [{"level": "error"}, {"source": "frontend"}], "limit": 50}'
+ */
+router.post('/filter/batch', async (req, res) => {
+  const { queries, limit = '100', fields } = (req.body ?? {}) as {
+    queries?: unknown;
+    limit?: string | number;
+    fields?: string | string[];
+  };
+
+  if (!Array.isArray(queries) || queries.length === 0
+      || queries.some(query => typeof query !== 'object' || query === null || Array.isArray(query))) {
+    return res.status(400).json({
+      success: false,
+      error: 'Invalid request',
+      message: 'Body must contain "queries", a non-empty array of filter objects',
+      timestamp: new Date().toISOString()
+    });
+  }
+
+  if (queries.length > MAX_BATCH_QUERIES) {
+    return res.status(400).json({
+      success: false,
+      error: 'Invalid request',
+      message: `At most ${MAX_BATCH_QUERIES} queries per batch`,
+      timestamp: new Date().toISOString()
+    });
+  }
+
+  try {
+    const filters = queries as FilterParams[];
+    const criteria = filters.map(query => toCriteria(query, String(limit)));
+    const { results, filesProcessed } = await scanLogs(criteria);
+
+    logger.info('Log filter batch completed', {
+      component: 'logs-api',
+      queries: filters.length,
+      resultsCount: results.reduce((sum, logs) => sum + logs.length, 0),
+      filesProcessed
+    });
+
+    res.json({
+      success: true,
+      results: results.map((logs, i) => {
+        const { level, source, component, startDate, endDate, sessionId, searchTerm } = filters[i];
+        return {
+          count: logs.length,
+          limit: criteria[i].limit,
+          filters: { level, source, component, startDate, endDate, sessionId, searchTerm },
+          logs: projectLogs(logs, parseFields(filters[i].fields ?? fields))
+        };
+      }),
+      timestamp: new Date().toISOString()
+    });
+  } catch (error) {
+    logger.error('Error filtering logs (batch)', {
+      component: 'logs-api',
+      error: error instanceof Error ? error.message : 'Unknown error',
+      stack: error instanceof Error ? error.stack : undefined
+    });
+
     res.status(500).json({
       success: false,
       error: 'Failed to filter logs',
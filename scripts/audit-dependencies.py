@@ -7,17 +7,35 @@ Usage:
     python scripts/audit-dependencies.py
     python scripts/audit-dependencies.py --verbose
     python scripts/audit-dependencies.py --output custom-report.md
+    python scripts/audit-dependencies.py --resolve   # list deps via pnpm instead of package.json
 """
 
+import io
 import json
+import mmap
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(data: bytes):
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass
@@ -29,6 +47,7 @@ class DependencyInfo:
     used: bool = False
     usage_locations: List[str] = field(default_factory=list)
     usage_reason: str = ""
+    compiled_patterns: List[re.Pattern] = field(default_factory=list, repr=False)
 
 
 @dataclass
@@ -36,6 +55,8 @@ class WorkspaceInfo:
     """Information about a workspace package."""
     name: str
     path: Path
+    rel_path: str = ""
+    package_data: dict = field(default_factory=dict, repr=False)
     dependencies: List[DependencyInfo] = field(default_factory=list)
     dev_dependencies: List[DependencyInfo] = field(default_factory=list)
 
@@ -43,16 +64,51 @@ class WorkspaceInfo:
 class DependencyAuditor:
     """Main class for auditing dependencies across pnpm workspaces."""
 
-    def __init__(self, project_root: Path, verbose: bool = False):
+    # Seconds before a hung external command (e.g. pnpm) is abandoned
+    COMMAND_TIMEOUT = 60
+
+    # Source files searched for imports; a tuple so str.endswith checks
+    # all extensions in a single C-level call
+    SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+    SOURCE_DIRS = ('src', 'tests', 'test', 'e2e')
+
+    # Usage locations recorded per dependency before its search stops; the
+    # report only lists the first two and notes that there are more
+    MAX_USAGE_LOCATIONS = 3
+
+    # Source files at least this large are memory-mapped rather than read;
+    # below it the mmap setup costs more than a plain read()
+    MMAP_THRESHOLD = 4096
+
+    # Directories never worth descending into (pruned by name, before any stat)
+    SKIP_DIRS = frozenset({
+        'node_modules', '.git', 'dist', 'build', '.next', '.turbo', 'coverage',
+    })
+
+    def __init__(
+        self,
+        project_root: Path,
+        verbose: bool = False,
+        jobs: int = 1,
+        resolve: bool = False
+    ):
         self.project_root = project_root
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        # List installed dependencies via pnpm rather than those declared in package.json
+        self.resolve = resolve
+        # Single timestamp for the whole run, so every date in the report agrees
+        self.run_ts = datetime.now()
         self.workspaces: List[WorkspaceInfo] = []
+        self.pnpm_listing: Dict[Path, Tuple[List[str], List[str]]] = {}
+        # Compiled import patterns by dependency name, shared across workspaces
+        self._pattern_cache: Dict[str, List[re.Pattern]] = {}
 
         # Common patterns for dependency usage
         self.import_patterns = [
             r'import\s+.*?from\s+[\'"]({package})[\'"]',
             r'import\s+[\'"]({package})[\'"]',
-            r'require\([\'"]({package}[\'"]\))',
+            r'require\([\'"]({package})[\'"]\)',
         ]
 
         # Special cases: dependencies used implicitly
@@ -73,7 +129,7 @@ class DependencyAuditor:
         }
 
         # Config files where dependencies might be referenced
-        self.config_files = [
+        self.config_files = (
             'vite.config.ts', 'vite.config.js',
             'vitest.config.ts', 'vitest.config.js',
             'postcss.config.js', 'postcss.config.cjs',
@@ -82,7 +138,7 @@ class DependencyAuditor:
             '.eslintrc.js', '.eslintrc.json',
             'playwright.config.ts', 'playwright.config.js',
             'package.json',
-        ]
+        )
 
     def log(self, message: str):
         """Print message if verbose mode is enabled."""
@@ -90,86 +146,155 @@ class DependencyAuditor:
             print(f"  {message}")
 
     def run_command(self, cmd: List[str], cwd: Path = None) -> Tuple[str, int]:
-        """Run shell command and return output."""
+        """Run command (without a shell) and return output."""
+        # Resolve the executable ourselves so Windows .cmd shims such as
+        # pnpm.cmd are found without going through a shell
+        executable = shutil.which(cmd[0]) or cmd[0]
         try:
             result = subprocess.run(
-                cmd,
+                [executable, *cmd[1:]],
                 cwd=cwd or self.project_root,
                 capture_output=True,
                 text=True,
-                shell=True
+                check=False,
+                timeout=self.COMMAND_TIMEOUT
             )
             return result.stdout, result.returncode
         except Exception as e:
             print(f"Error running command {' '.join(cmd)}: {e}")
             return "", 1
 
-    def find_package_json_files(self) -> List[Path]:
-        """Find all package.json files in the project (excluding node_modules)."""
-        package_files = []
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip node_modules
-            dirs[:] = [d for d in dirs if d != 'node_modules']
+    def get_patterns_for(self, dep_name: str) -> List[re.Pattern]:
+        """Return the (bytes) import patterns for a dependency name, compiling them once."""
+        patterns = self._pattern_cache.get(dep_name)
+        if patterns is None:
+            escaped_name = re.escape(dep_name)
+            patterns = [
+                re.compile(pattern_template.format(package=escaped_name).encode('utf-8'))
+                for pattern_template in self.import_patterns
+            ]
+            self._pattern_cache[dep_name] = patterns
+        return patterns
+
+    @contextmanager
+    def open_source(self, entry: os.DirEntry):
+        """Yield a source file's raw bytes, memory-mapping files above MMAP_THRESHOLD."""
+        with open(entry.path, 'rb') as f:
+            if entry.stat().st_size < self.MMAP_THRESHOLD:
+                yield f.read()
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def iter_files(self, root: Path) -> Iterator[os.DirEntry]:
+        """Walk a directory tree with os.scandir, skipping SKIP_DIRS.
+
+        Files are yielded in the same top-down order as os.walk, but directory
+        entries use the kernel-provided file type instead of a stat per entry.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
 
-            if 'package.json' in files:
-                package_files.append(Path(root) / 'package.json')
+            subdirs = []
+            files = []
+            with it:
+                try:
+                    for entry in it:
+                        if entry.name in self.SKIP_DIRS:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry)
+                except OSError:
+                    # Unreadable directory: skip it, as os.walk would
+                    continue
+
+            yield from files
+
+            stack.extend(reversed(subdirs))
 
+    def find_package_json_files(self) -> List[Path]:
+        """Find all package.json files in the project (excluding node_modules)."""
+        package_files = [
+            Path(entry.path)
+            for entry in self.iter_files(self.project_root)
+            if entry.name == 'package.json'
+        ]
         return sorted(package_files)
 
-    def parse_pnpm_list(self, output: str) -> Tuple[List[str], List[str]]:
-        """Parse pnpm list output to extract dependencies and devDependencies."""
-        dependencies = []
-        dev_dependencies = []
-
-        lines = output.split('\n')
-        current_section = None
-
-        for line in lines:
-            if 'dependencies:' in line.lower() and 'dev' not in line.lower():
-                current_section = 'prod'
-            elif 'devdependencies:' in line.lower():
-                current_section = 'dev'
-            elif line.strip() and current_section:
-                # Extract package name (format: "package-name version")
-                match = re.match(r'^([a-z@][^\s]+)\s+', line.strip())
-                if match:
-                    pkg_name = match.group(1)
-                    if current_section == 'prod':
-                        dependencies.append(pkg_name)
-                    else:
-                        dev_dependencies.append(pkg_name)
-
-        return dependencies, dev_dependencies
+    def parse_pnpm_list(self, output: str) -> Dict[Path, Tuple[List[str], List[str]]]:
+        """Parse `pnpm list --json` output into dependency names keyed by workspace path."""
+        try:
+            entries = load_json(output)
+        except ValueError as e:
+            self.log(f"Could not parse pnpm list output: {e}")
+            return {}
+
+        listing = {}
+        for entry in entries:
+            if 'path' not in entry:
+                continue
+            listing[Path(entry['path']).resolve()] = (
+                list(entry.get('dependencies', {})),
+                list(entry.get('devDependencies', {})),
+            )
+        return listing
+
+    def list_all_workspaces(self) -> Dict[Path, Tuple[List[str], List[str]]]:
+        """List dependencies of every pnpm workspace with a single recursive call."""
+        output, returncode = self.run_command(
+            ['pnpm', '-r', 'list', '--depth', '0', '--json']
+        )
+        if returncode != 0:
+            self.log("pnpm -r list failed, falling back to per-workspace listing")
+            return {}
+        return self.parse_pnpm_list(output)
 
     def get_workspace_dependencies(self, workspace_path: Path) -> WorkspaceInfo:
         """Get dependencies for a specific workspace."""
-        self.log(f"Analyzing workspace: {workspace_path.relative_to(self.project_root)}")
+        rel_path = str(workspace_path.relative_to(self.project_root))
+        self.log(f"Analyzing workspace: {rel_path}")
 
-        # Read package.json to get workspace name
+        # Read package.json to get workspace name and declared dependencies
         package_json_path = workspace_path / 'package.json'
-        with open(package_json_path, 'r', encoding='utf-8') as f:
-            package_data = json.load(f)
-
-        workspace_name = package_data.get('name', workspace_path.name)
-
-        # Run pnpm list
-        output, returncode = self.run_command(
-            ['pnpm', 'list', '--depth', '0'],
-            cwd=workspace_path
+        with open(package_json_path, 'rb') as f:
+            package_data = load_json(f.read())
+
+        workspace = WorkspaceInfo(
+            name=package_data.get('name', workspace_path.name),
+            path=workspace_path,
+            rel_path=rel_path,
+            package_data=package_data
         )
 
-        if returncode != 0:
-            print(f"Warning: pnpm list failed for {workspace_path}")
-            return WorkspaceInfo(name=workspace_name, path=workspace_path)
+        pkg_deps = package_data.get('dependencies', {})
+        pkg_dev_deps = package_data.get('devDependencies', {})
 
-        # Parse dependencies
-        prod_deps, dev_deps = self.parse_pnpm_list(output)
+        if self.resolve:
+            # Reuse the recursive pnpm listing; only packages outside the pnpm
+            # workspace need their own pnpm list call
+            listed = self.pnpm_listing.get(workspace_path.resolve())
+            if listed is None:
+                output, returncode = self.run_command(
+                    ['pnpm', 'list', '--depth', '0', '--json'],
+                    cwd=workspace_path
+                )
+                listed = self.parse_pnpm_list(output).get(workspace_path.resolve())
 
-        workspace = WorkspaceInfo(name=workspace_name, path=workspace_path)
+                if returncode != 0 or listed is None:
+                    print(f"Warning: pnpm list failed for {workspace_path}")
+                    return workspace
 
-        # Extract versions from package.json
-        pkg_deps = package_data.get('dependencies', {})
-        pkg_dev_deps = package_data.get('devDependencies', {})
+            prod_deps, dev_deps = listed
+        else:
+            # At depth 0, the declared dependencies are exactly what pnpm
+            # list would report, without spawning a Node process per workspace
+            prod_deps, dev_deps = list(pkg_deps), list(pkg_dev_deps)
 
         for dep in prod_deps:
             version = pkg_deps.get(dep, 'unknown')
@@ -181,66 +306,138 @@ class DependencyAuditor:
 
         return workspace
 
-    def check_dependency_usage(self, dep: DependencyInfo, workspace: WorkspaceInfo):
-        """Check if a dependency is used in the workspace."""
-        dep_name = dep.name
-        workspace_path = workspace.path
-
-        # Check implicit usage first
-        if dep_name in self.implicit_usage:
-            dep.used = True
-            dep.usage_reason = self.implicit_usage[dep_name]
-            return
-
-        # Check for @types/* packages
-        if dep_name.startswith('@types/'):
-            base_package = dep_name.replace('@types/', '')
-            dep.used = True
-            dep.usage_reason = f"TypeScript types for {base_package}"
-            return
-
-        # Check config files first
+    def read_config_files(self, workspace_path: Path) -> List[Tuple[str, str]]:
+        """Read the workspace config files once, returning (relative path, content) pairs."""
+        config_contents = []
         for config_file in self.config_files:
             config_path = workspace_path / config_file
             if config_path.exists():
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if dep_name in content:
-                        dep.used = True
-                        dep.usage_locations.append(str(config_path.relative_to(self.project_root)))
+                    config_contents.append(
+                        (str(config_path.relative_to(self.project_root)), f.read())
+                    )
+        return config_contents
+
+    def classify(self, dep_name: str) -> str:
+        """Return the reason a dependency counts as used without any file search, or ''.
+
+        Covers tools used implicitly and @types/* packages, in one lookup.
+        """
+        reason = self.implicit_usage.get(dep_name)
+        if reason:
+            return reason
+
+        scope, _, base_package = dep_name.partition('/')
+        if scope == '@types' and base_package:
+            return f"TypeScript types for {base_package}"
+        return ""
+
+    def check_dependency_usage(
+        self,
+        dep: DependencyInfo,
+        config_contents: List[Tuple[str, str]]
+    ):
+        """Check if a dependency is referenced in a config file.
+
+        Implicit usage is resolved beforehand by classify, and imports from
+        source files per workspace by _scan_workspace_sources.
+        """
+        for config_rel_path, content in config_contents:
+            if dep.name in content:
+                dep.used = True
+                dep.usage_locations.append(config_rel_path)
+
+    def iter_source_files(self, workspace: WorkspaceInfo) -> Iterator[os.DirEntry]:
+        """Yield the source files of a workspace that may contain imports."""
+        for src_dir in self.SOURCE_DIRS:
+            src_path = workspace.path / src_dir
+            if not src_path.is_dir():
+                continue
 
-        # Search for imports in source files
-        source_extensions = ['.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs']
-        src_dirs = ['src', 'tests', 'test', 'e2e']
+            for entry in self.iter_files(src_path):
+                if entry.name.endswith(self.SOURCE_EXTENSIONS):
+                    yield entry
+
+    def _scan_workspace_sources(
+        self,
+        workspace: WorkspaceInfo,
+        deps_by_name: Dict[str, List[DependencyInfo]]
+    ):
+        """Scan workspace source files once, matching all dependencies in a single pass.
+
+        A dependency stops being searched for once it has MAX_USAGE_LOCATIONS
+        locations, and the walk ends as soon as no dependency is left.
+        """
+        # name -> (name as bytes, dependencies with that name)
+        pending = {
+            name: (name.encode('utf-8'), deps)
+            for name, deps in deps_by_name.items()
+        }
+
+        for entry in self.iter_source_files(workspace):
+            if not pending:
+                break
+
+            # Patterns run directly on the bytes (or the mapped pages),
+            # so files are never decoded into Python strings
+            try:
+                with self.open_source(entry) as content:
+                    # Only dependencies actually named in the file are candidates:
+                    # a plain substring search rules out almost every (file, dep)
+                    # pair far more cheaply than running the regex engine
+                    matched = [
+                        dep
+                        for needle, deps in pending.values()
+                        if content.find(needle) != -1
+                        for dep in deps
+                        if any(pat.search(content) for pat in dep.compiled_patterns)
+                    ]
+            except (OSError, ValueError) as e:
+                self.log(f"Error reading {entry.path}: {e}")
+                continue
 
-        for src_dir in src_dirs:
-            src_path = workspace_path / src_dir
-            if not src_path.exists():
+            if not matched:
                 continue
 
-            for root, _, files in os.walk(src_path):
-                for file in files:
-                    if not any(file.endswith(ext) for ext in source_extensions):
-                        continue
-
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-
-                            # Escape special regex characters in package name
-                            escaped_name = re.escape(dep_name)
-
-                            # Check various import patterns
-                            for pattern_template in self.import_patterns:
-                                pattern = pattern_template.format(package=escaped_name)
-                                if re.search(pattern, content):
-                                    dep.used = True
-                                    rel_path = file_path.relative_to(self.project_root)
-                                    if str(rel_path) not in dep.usage_locations:
-                                        dep.usage_locations.append(str(rel_path))
-                    except Exception as e:
-                        self.log(f"Error reading {file_path}: {e}")
+            rel_path = str(Path(entry.path).relative_to(self.project_root))
+            for dep in matched:
+                dep.used = True
+                if rel_path not in dep.usage_locations:
+                    dep.usage_locations.append(rel_path)
+
+                if (dep.name in pending and all(
+                    len(d.usage_locations) >= self.MAX_USAGE_LOCATIONS
+                    for d in pending[dep.name][1]
+                )):
+                    del pending[dep.name]
+
+    def analyze_workspace(self, workspace_path: Path) -> WorkspaceInfo:
+        """Collect a workspace's dependencies and determine which ones are used."""
+        workspace = self.get_workspace_dependencies(workspace_path)
+
+        # Settle implicitly used dependencies before touching any file
+        remaining = []
+        for dep in workspace.dependencies + workspace.dev_dependencies:
+            reason = self.classify(dep.name)
+            if reason:
+                dep.used = True
+                dep.usage_reason = reason
+            else:
+                remaining.append(dep)
+
+        # Check config-file usage for the rest
+        config_contents = self.read_config_files(workspace_path) if remaining else []
+        deps_by_name: Dict[str, List[DependencyInfo]] = {}
+        for dep in remaining:
+            self.check_dependency_usage(dep, config_contents)
+            if len(dep.usage_locations) < self.MAX_USAGE_LOCATIONS:
+                dep.compiled_patterns = self.get_patterns_for(dep.name)
+                deps_by_name.setdefault(dep.name, []).append(dep)
+
+        # Search for imports in source files
+        self._scan_workspace_sources(workspace, deps_by_name)
+
+        return workspace
 
     def audit_workspaces(self):
         """Audit all workspaces in the project."""
@@ -250,36 +447,64 @@ class DependencyAuditor:
         print(f"Found {len(package_files)} workspace(s)")
         print()
 
-        for package_file in package_files:
-            workspace_path = package_file.parent
-            workspace = self.get_workspace_dependencies(workspace_path)
+        if self.resolve:
+            self.pnpm_listing = self.list_all_workspaces()
 
-            # Check usage for each dependency
-            all_deps = workspace.dependencies + workspace.dev_dependencies
-            for dep in all_deps:
-                self.check_dependency_usage(dep, workspace)
+        workspace_paths = [package_file.parent for package_file in package_files]
+        jobs = min(self.jobs, len(workspace_paths))
 
-            self.workspaces.append(workspace)
-            print(f"✓ Analyzed {workspace.name}")
+        if jobs <= 1:
+            for workspace in map(self.analyze_workspace, workspace_paths):
+                self.workspaces.append(workspace)
+                print(f"✓ Analyzed {workspace.name}")
+        else:
+            # Workspaces are independent, so scan them concurrently. Fall back
+            # to threads where process pools are unavailable on the platform.
+            try:
+                executor = ProcessPoolExecutor(max_workers=jobs)
+            except (OSError, NotImplementedError):
+                executor = ThreadPoolExecutor(max_workers=jobs)
+
+            with executor:
+                for workspace in executor.map(self.analyze_workspace, workspace_paths):
+                    self.workspaces.append(workspace)
+                    print(f"✓ Analyzed {workspace.name}")
 
         print()
 
+    def _write_dependency_section(self, write, title: str, deps: List[DependencyInfo]):
+        """Write one dependency list (production or dev) of a workspace."""
+        write(f"### {title}\n\n")
+        for dep in sorted(deps, key=lambda d: d.name):
+            status = "✅ USED" if dep.used else "❌ UNUSED"
+            reason = f" - {dep.usage_reason}" if dep.usage_reason else ""
+            locations = ""
+            if dep.usage_locations and not dep.usage_reason:
+                locations = f" ({', '.join(dep.usage_locations[:2])})"
+                if len(dep.usage_locations) > 2:
+                    locations += " +more"
+
+            write(f"- `{dep.name}@{dep.version}` - {status}{reason}{locations}\n")
+        write("\n")
+
     def generate_report(self, output_file: Path):
         """Generate markdown report."""
-        report_lines = []
+        # Stream the report into one buffer instead of collecting line lists
+        buf = io.StringIO()
+        write = buf.write
 
         # Header
-        report_lines.extend([
-            "# Dependency Audit Report",
-            "",
-            f"**Date:** {datetime.now().strftime('%Y-%m-%d')}",
-            f"**Generated by:** scripts/audit-dependencies.py",
-            "",
-            "---",
-            "",
-            "## Summary",
-            "",
-        ])
+        write(
+            "# Dependency Audit Report\n"
+            "\n"
+            f"**Date:** {self.run_ts.strftime('%Y-%m-%d')}\n"
+            "**Generated by:** scripts/audit-dependencies.py\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Summary\n"
+            "\n"
+        )
 
         # Calculate totals
         total_prod = sum(len(ws.dependencies) for ws in self.workspaces)
@@ -292,81 +517,56 @@ class DependencyAuditor:
                 if not dep.used:
                     unused_deps.append((ws.name, dep))
 
-        report_lines.extend([
-            f"- **Total packages audited:** {len(self.workspaces)} workspaces",
-            f"- **Total dependencies:** {total} ({total_prod} production, {total_dev} dev)",
-            f"- **Unused dependencies found:** {len(unused_deps)}",
-            f"- **Status:** {'✅ Clean' if len(unused_deps) == 0 else '⚠️ Needs cleanup'}",
-            "",
-            "---",
-            "",
-        ])
+        write(
+            f"- **Total packages audited:** {len(self.workspaces)} workspaces\n"
+            f"- **Total dependencies:** {total} ({total_prod} production, {total_dev} dev)\n"
+            f"- **Unused dependencies found:** {len(unused_deps)}\n"
+            f"- **Status:** {'✅ Clean' if len(unused_deps) == 0 else '⚠️ Needs cleanup'}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
 
         # Workspace details
         for workspace in self.workspaces:
-            report_lines.extend([
-                f"## Workspace: {workspace.name}",
-                "",
-                f"**Path:** `{workspace.path.relative_to(self.project_root)}`",
-                "",
-            ])
-
-            # Production dependencies
+            write(
+                f"## Workspace: {workspace.name}\n"
+                "\n"
+                f"**Path:** `{workspace.rel_path}`\n"
+                "\n"
+            )
+
             if workspace.dependencies:
-                report_lines.append("### Production Dependencies")
-                report_lines.append("")
-                for dep in sorted(workspace.dependencies, key=lambda d: d.name):
-                    status = "✅ USED" if dep.used else "❌ UNUSED"
-                    reason = f" - {dep.usage_reason}" if dep.usage_reason else ""
-                    locations = ""
-                    if dep.usage_locations and not dep.usage_reason:
-                        locations = f" ({', '.join(dep.usage_locations[:2])})"
-                        if len(dep.usage_locations) > 2:
-                            locations += f" +{len(dep.usage_locations) - 2} more"
-
-                    report_lines.append(f"- `{dep.name}@{dep.version}` - {status}{reason}{locations}")
-                report_lines.append("")
-
-            # Dev dependencies
+                self._write_dependency_section(
+                    write, "Production Dependencies", workspace.dependencies
+                )
+
             if workspace.dev_dependencies:
-                report_lines.append("### Dev Dependencies")
-                report_lines.append("")
-                for dep in sorted(workspace.dev_dependencies, key=lambda d: d.name):
-                    status = "✅ USED" if dep.used else "❌ UNUSED"
-                    reason = f" - {dep.usage_reason}" if dep.usage_reason else ""
-                    locations = ""
-                    if dep.usage_locations and not dep.usage_reason:
-                        locations = f" ({', '.join(dep.usage_locations[:2])})"
-                        if len(dep.usage_locations) > 2:
-                            locations += f" +{len(dep.usage_locations) - 2} more"
-
-                    report_lines.append(f"- `{dep.name}@{dep.version}` - {status}{reason}{locations}")
-                report_lines.append("")
-
-            report_lines.append("---")
-            report_lines.append("")
+                self._write_dependency_section(
+                    write, "Dev Dependencies", workspace.dev_dependencies
+                )
+
+            write("---\n\n")
 
         # Unused dependencies section
         if unused_deps:
-            report_lines.extend([
-                "## ⚠️ Unused Dependencies",
-                "",
-                "The following dependencies are not used and can be removed:",
-                "",
-            ])
+            write(
+                "## ⚠️ Unused Dependencies\n"
+                "\n"
+                "The following dependencies are not used and can be removed:\n"
+                "\n"
+            )
 
             for ws_name, dep in unused_deps:
                 dep_type = "devDependency" if dep.is_dev else "dependency"
-                report_lines.append(
-                    f"- **{dep.name}** in `{ws_name}` ({dep_type})"
-                )
+                write(f"- **{dep.name}** in `{ws_name}` ({dep_type})\n")
 
-            report_lines.extend([
-                "",
-                "### Removal Commands",
-                "",
-                "```bash",
-            ])
+            write(
+                "\n"
+                "### Removal Commands\n"
+                "\n"
+                "```bash\n"
+            )
 
             # Group by workspace
             deps_by_workspace: Dict[str, List[str]] = {}
@@ -375,71 +575,73 @@ class DependencyAuditor:
                     deps_by_workspace[ws_name] = []
                 deps_by_workspace[ws_name].append(dep.name)
 
+            workspaces_by_name = {ws.name: ws for ws in self.workspaces}
             for ws_name, deps in deps_by_workspace.items():
-                ws = next(w for w in self.workspaces if w.name == ws_name)
-                rel_path = ws.path.relative_to(self.project_root)
-                report_lines.append(f"# {ws_name}")
-                report_lines.append(f"cd {rel_path}")
-                report_lines.append(f"pnpm remove {' '.join(deps)}")
-                report_lines.append("")
-
-            report_lines.extend([
-                "```",
-                "",
-                "---",
-                "",
-            ])
+                write(
+                    f"# {ws_name}\n"
+                    f"cd {workspaces_by_name[ws_name].rel_path}\n"
+                    f"pnpm remove {' '.join(deps)}\n"
+                    "\n"
+                )
+
+            write(
+                "```\n"
+                "\n"
+                "---\n"
+                "\n"
+            )
 
         # Metrics table
-        report_lines.extend([
-            "## Metrics",
-            "",
-            "| Metric | Value |",
-            "|--------|-------|",
-            f"| Total workspaces | {len(self.workspaces)} |",
-            f"| Total dependencies (prod) | {total_prod} |",
-            f"| Total dependencies (dev) | {total_dev} |",
-            f"| Unused dependencies | {len(unused_deps)} |",
-            f"| Dependency efficiency | {((total - len(unused_deps)) / total * 100):.1f}% |",
-            "",
-            "---",
-            "",
-        ])
+        write(
+            "## Metrics\n"
+            "\n"
+            "| Metric | Value |\n"
+            "|--------|-------|\n"
+            f"| Total workspaces | {len(self.workspaces)} |\n"
+            f"| Total dependencies (prod) | {total_prod} |\n"
+            f"| Total dependencies (dev) | {total_dev} |\n"
+            f"| Unused dependencies | {len(unused_deps)} |\n"
+            f"| Dependency efficiency | {((total - len(unused_deps)) / total * 100):.1f}% |\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
 
         # Recommendations
-        report_lines.extend([
-            "## Recommendations",
-            "",
-            "### Current Actions",
-            "",
-        ])
+        write(
+            "## Recommendations\n"
+            "\n"
+            "### Current Actions\n"
+            "\n"
+        )
 
         if unused_deps:
-            report_lines.append("1. ⚠️ Remove unused dependencies listed above")
-            report_lines.append("2. Run tests to ensure nothing breaks")
-            report_lines.append("3. Commit changes with descriptive message")
+            write(
+                "1. ⚠️ Remove unused dependencies listed above\n"
+                "2. Run tests to ensure nothing breaks\n"
+                "3. Commit changes with descriptive message\n"
+            )
         else:
-            report_lines.append("✅ No action needed - all dependencies are actively used")
-
-        report_lines.extend([
-            "",
-            "### Future Maintenance",
-            "",
-            "1. **Regular Audits:** Run this script quarterly or after major features",
-            "2. **Before Adding Deps:** Verify necessity and check for alternatives",
-            "3. **Security Updates:** Run `pnpm audit` regularly",
-            "4. **Bundle Analysis:** Monitor frontend bundle size with build tools",
-            "",
-            "---",
-            "",
-            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Status:** {'✅ Clean' if len(unused_deps) == 0 else '⚠️ Action Required'}",
-        ])
+            write("✅ No action needed - all dependencies are actively used\n")
+
+        write(
+            "\n"
+            "### Future Maintenance\n"
+            "\n"
+            "1. **Regular Audits:** Run this script quarterly or after major features\n"
+            "2. **Before Adding Deps:** Verify necessity and check for alternatives\n"
+            "3. **Security Updates:** Run `pnpm audit` regularly\n"
+            "4. **Bundle Analysis:** Monitor frontend bundle size with build tools\n"
+            "\n"
+            "---\n"
+            "\n"
+            f"**Generated:** {self.run_ts.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"**Status:** {'✅ Clean' if len(unused_deps) == 0 else '⚠️ Action Required'}\n"
+        )
 
         # Write report
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
+        output_file.write_text(buf.getvalue(), encoding='utf-8')
 
         print(f"📄 Report generated: {output_file}")
 
@@ -481,6 +683,17 @@ def main():
         default='docs/temp/DEPENDENCY_AUDIT_{date}.md',
         help='Output report file path (use {date} for current date)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of workspaces to scan in parallel (default: CPU count)'
+    )
+    parser.add_argument(
+        '--resolve',
+        action='store_true',
+        help='List installed dependencies with pnpm instead of reading package.json'
+    )
 
     args = parser.parse_args()
 
@@ -492,12 +705,18 @@ def main():
     print(f"📁 Project root: {project_root}")
     print()
 
+    auditor = DependencyAuditor(
+        project_root,
+        verbose=args.verbose,
+        jobs=args.jobs,
+        resolve=args.resolve
+    )
+
     # Generate output filename
-    output_path = args.output.format(date=datetime.now().strftime('%Y-%m-%d'))
+    output_path = args.output.format(date=auditor.run_ts.strftime('%Y-%m-%d'))
     output_file = project_root / output_path
 
     # Run audit
-    auditor = DependencyAuditor(project_root, verbose=args.verbose)
     auditor.audit_workspaces()
     unused_count = auditor.generate_report(output_file)
 
@@ -3,11 +3,11 @@
 Capture backend execution logs from production or local environment.
 
 This script downloads backend application logs from the production EC2 server
-via SSH/SCP or captures local logs from the development environment.
+via SSH or captures local logs from the development environment.
 
 Requirements:
     - SSH access to production server (via SSH key)
-    - scp command available
+    - tar available on the production server
 
 Usage:
     # Capture production logs
@@ -25,11 +25,14 @@ Usage:
 
 import os
 import sys
+import shlex
+import shutil
+import tarfile
 import subprocess
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 class BackendLogCapture:
@@ -40,16 +43,119 @@ class BackendLogCapture:
         self.server = server
         self.remote_log_dir = "/var/log/terrainsim"
         self.local_log_dir = Path("apps/simulation-api/logs")
+        # Single timestamp for the whole run (default date, status file names)
+        self.run_ts = datetime.now()
+
+        # All ssh calls share one multiplexed connection (OpenSSH ControlMaster)
+        # with log-manager.py and set-log-level.py: the socket lives in ~/.ssh
+        # and persists for 5 minutes, so a master that is already up (e.g.
+        # log-manager's, when run from it) is reused without a new handshake.
+        # The Windows OpenSSH client does not support it.
+        self.ssh_options = ["-o", "StrictHostKeyChecking=no"]
+        self.control_path: Optional[str] = None
+        self._master_checked = False
+        if os.name != "nt":
+            self.control_path = str(Path.home() / ".ssh" / "terrainsim-%C")
+            self.ssh_options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self.control_path}",
+                "-o", "ControlPersist=300",
+            ]
+
+    def _ensure_master(self) -> None:
+        """Start the shared SSH master connection unless one is already running."""
+        if self.control_path is None or self._master_checked:
+            return
+        self._master_checked = True
+
+        check = subprocess.run(
+            ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if check.returncode == 0:
+            return
+
+        # -f -N: authenticate, then keep the master in the background. Started
+        # with no pipes attached, so a captured ssh call never waits on a
+        # backgrounded master holding its stdout open.
+        try:
+            Path(self.control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        subprocess.run(
+            ["ssh", *self.ssh_options, "-f", "-N", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
 
     def run_ssh_command(self, command: str) -> tuple[str, str, int]:
         """Execute command on remote server via SSH."""
+        self._ensure_master()
         result = subprocess.run(
-            ["ssh", "-o", "StrictHostKeyChecking=no", self.server, command],
+            ["ssh", *self.ssh_options, self.server, command],
             capture_output=True,
             text=True
         )
         return result.stdout, result.stderr, result.returncode
 
+    def find_remote_files(self, filenames: list[str]) -> set[str]:
+        """Return which of the given files exist in the remote log dir (one SSH call)."""
+        quoted = " ".join(shlex.quote(name) for name in filenames)
+        check_cmd = (
+            f"cd {shlex.quote(self.remote_log_dir)} && "
+            f"for f in {quoted}; do [ -f \"$f\" ] && echo \"$f\"; done"
+        )
+        stdout, stderr, code = self.run_ssh_command(check_cmd)
+        return set(stdout.split())
+
+    def download_remote_files(
+        self,
+        filenames: list[str],
+        output_dir: Path,
+        prefix: str = ""
+    ) -> tuple[dict[str, int], str]:
+        """Download files from the remote log dir as one gzipped tar stream over SSH.
+
+        Replaces one scp (and one connection) per file. Each file is written to
+        output_dir as prefix + name. Returns the size of every file written,
+        keyed by remote name, and any error output.
+        """
+        self._ensure_master()
+        quoted = " ".join(shlex.quote(name) for name in filenames)
+        process = subprocess.Popen(
+            [
+                "ssh", *self.ssh_options, self.server,
+                f"tar czf - -C {shlex.quote(self.remote_log_dir)} {quoted}"
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        wanted = set(filenames)
+        downloaded: dict[str, int] = {}
+        error = ""
+        try:
+            with tarfile.open(fileobj=process.stdout, mode="r|gz") as archive:
+                for member in archive:
+                    if not member.isfile() or member.name not in wanted:
+                        continue
+                    local_path = output_dir / f"{prefix}{member.name}"
+                    with archive.extractfile(member) as src, open(local_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    downloaded[member.name] = member.size
+        except tarfile.TarError as e:
+            error = str(e)
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode(errors="replace")
+            process.wait()
+
+        return downloaded, (error or stderr).strip()
+
     def capture_production_logs(
         self,
         output_dir: Path,
@@ -64,7 +170,7 @@ class BackendLogCapture:
         if date:
             log_date = date
         else:
-            log_date = datetime.now().strftime("%Y-%m-%d")
+            log_date = self.run_ts.strftime("%Y-%m-%d")
 
         print(f"  Target date: {log_date}")
 
@@ -78,36 +184,26 @@ class BackendLogCapture:
         captured_count = 0
         missing_count = 0
 
-        for pattern in log_patterns:
-            remote_path = f"{self.remote_log_dir}/{pattern}"
-            local_path = output_dir / f"production-{pattern}"
+        # Check which files exist on server, then fetch them in one stream
+        existing = self.find_remote_files(log_patterns)
+        downloaded: dict[str, int] = {}
+        error = ""
+        if existing:
+            downloaded, error = self.download_remote_files(
+                [pattern for pattern in log_patterns if pattern in existing],
+                output_dir,
+                prefix="production-"
+            )
 
+        for pattern in log_patterns:
             print(f"  📁 Capturing {pattern}...")
 
-            # Check if file exists on server
-            check_cmd = f"test -f {remote_path} && echo 'exists' || echo 'missing'"
-            stdout, stderr, code = self.run_ssh_command(check_cmd)
-
-            if "exists" in stdout:
-                # Download file via SCP
-                result = subprocess.run(
-                    [
-                        "scp",
-                        "-o", "StrictHostKeyChecking=no",
-                        f"{self.server}:{remote_path}",
-                        str(local_path)
-                    ],
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.returncode == 0:
-                    file_size = local_path.stat().st_size
-                    print(f"    ✅ Captured {pattern} ({file_size:,} bytes)")
-                    captured_count += 1
-                else:
-                    print(f"    ❌ Failed to download {pattern}")
-                    print(f"       Error: {result.stderr}")
+            if pattern in downloaded:
+                print(f"    ✅ Captured {pattern} ({downloaded[pattern]:,} bytes)")
+                captured_count += 1
+            elif pattern in existing:
+                print(f"    ❌ Failed to download {pattern}")
+                print(f"       Error: {error}")
             else:
                 print(f"    ⚠️  File not found: {pattern}")
                 missing_count += 1
@@ -118,7 +214,7 @@ class BackendLogCapture:
 
         # Capture PM2 status
         print("\n📊 Capturing PM2 status...")
-        pm2_status_file = output_dir / f"pm2-status-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        pm2_status_file = output_dir / f"pm2-status-{self.run_ts.strftime('%Y%m%d-%H%M%S')}.json"
         stdout, stderr, code = self.run_ssh_command("pm2 jlist")
 
         if code == 0:
@@ -131,9 +227,16 @@ class BackendLogCapture:
     def capture_local_logs(
         self,
         output_dir: Path,
-        date: Optional[str] = None
+        date: Optional[str] = None,
+        hardlink: bool = False
     ) -> None:
-        """Capture logs from local development environment."""
+        """Capture logs from local development environment.
+
+        Files are copied with shutil.copyfile, which uses the kernel's
+        zero-copy path (sendfile/fcopyfile) where available. With hardlink,
+        they are linked instead when on the same filesystem; the capture then
+        keeps following the live log rather than being a snapshot.
+        """
         print("📥 Capturing backend logs from local environment...")
 
         if not self.local_log_dir.exists():
@@ -147,7 +250,7 @@ class BackendLogCapture:
         if date:
             log_date = date
         else:
-            log_date = datetime.now().strftime("%Y-%m-%d")
+            log_date = self.run_ts.strftime("%Y-%m-%d")
 
         print(f"  Target date: {log_date}")
 
@@ -166,9 +269,15 @@ class BackendLogCapture:
             dest_path = output_dir / f"local-{pattern}"
 
             if source_path.exists():
-                # Copy file
-                import shutil
-                shutil.copy2(source_path, dest_path)
+                # Link or copy file (contents only, metadata is not needed)
+                if hardlink:
+                    try:
+                        dest_path.unlink(missing_ok=True)
+                        os.link(source_path, dest_path)
+                    except OSError:
+                        shutil.copyfile(source_path, dest_path)
+                else:
+                    shutil.copyfile(source_path, dest_path)
 
                 file_size = dest_path.stat().st_size
                 print(f"  ✅ Captured {pattern} ({file_size:,} bytes)")
@@ -197,20 +306,25 @@ class BackendLogCapture:
         else:
             # List local logs
             if self.local_log_dir.exists():
-                log_files = sorted(self.local_log_dir.glob("*.log"))
+                # One scandir pass, one stat per entry for both size and mtime
+                with os.scandir(self.local_log_dir) as it:
+                    log_files = sorted(
+                        (entry.name, entry.stat())
+                        for entry in it
+                        if entry.name.endswith(".log") and entry.is_file()
+                    )
                 if log_files:
-                    for log_file in log_files:
-                        size = log_file.stat().st_size
-                        modified = datetime.fromtimestamp(log_file.stat().st_mtime)
-                        print(f"  {log_file.name:<30} {size:>10,} bytes  {modified:%Y-%m-%d %H:%M:%S}")
+                    for name, stat in log_files:
+                        modified = datetime.fromtimestamp(stat.st_mtime)
+                        print(f"  {name:<30} {stat.st_size:>10,} bytes  {modified:%Y-%m-%d %H:%M:%S}")
                 else:
                     print("  No log files found")
             else:
                 print(f"  ❌ Local log directory not found: {self.local_log_dir}")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Capture backend execution logs"
     )
@@ -240,8 +354,13 @@ def main():
         type=int,
         help="Capture logs from last N days"
     )
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="Hardlink local logs instead of copying them (same filesystem only)"
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     capture = BackendLogCapture()
     output_dir = Path(args.output)
@@ -264,7 +383,7 @@ def main():
         print(f"📅 Capturing logs from last {args.last_n_days} day(s)...\n")
 
         for i in range(args.last_n_days):
-            date_obj = datetime.now() - timedelta(days=i)
+            date_obj = capture.run_ts - timedelta(days=i)
             date_str = date_obj.strftime("%Y-%m-%d")
 
             print(f"\n{'='*60}")
@@ -274,13 +393,13 @@ def main():
             if args.environment == "production":
                 capture.capture_production_logs(output_dir, date_str)
             else:
-                capture.capture_local_logs(output_dir, date_str)
+                capture.capture_local_logs(output_dir, date_str, args.hardlink)
     else:
         # Capture single date
         if args.environment == "production":
             capture.capture_production_logs(output_dir, args.date)
         else:
-            capture.capture_local_logs(output_dir, args.date)
+            capture.capture_local_logs(output_dir, args.date, args.hardlink)
 
     print(f"\n📂 Logs saved to: {output_dir.resolve()}")
 
@@ -32,17 +32,58 @@ import os
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ Error: requests library not installed")
     print("Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
+
+def load_json(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Any, indent: bool = False) -> bytes:
+    """Encode JSON as UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Non-str keys are allowed to match json.dumps, which stringifies them
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 API timestamp, using ciso8601 when it is installed."""
+    if parse_datetime is not None:
+        return parse_datetime(value)
+    # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+    if sys.version_info < (3, 11) and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
 
 class CloudflareDeploymentLogCapture:
     """Capture Cloudflare Pages deployment logs."""
@@ -63,22 +104,59 @@ class CloudflareDeploymentLogCapture:
             "Content-Type": "application/json"
         }
 
-    def get_deployments(self, count: int = 10) -> List[Dict[str, Any]]:
-        """Fetch recent deployments."""
+        # One keep-alive session for every API call, so only the first request
+        # pays for the TCP + TLS handshake with api.cloudflare.com
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        ))
+
+    def get_deployments(
+        self,
+        count: int = 10,
+        cache_path: Optional[Path] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch recent deployments.
+
+        With cache_path, the list is fetched with a conditional GET against
+        the ETag of the previous response for the same project and count;
+        on 304 Not Modified the cached list is returned without re-parsing.
+        """
         print(f"📥 Fetching last {count} deployments for {self.project_name}...")
 
+        cached = self._read_deployments_cache(cache_path, count)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/deployments",
-                headers=self.headers,
                 params={"per_page": count},
+                headers=headers,
                 timeout=30
             )
+
+            if response.status_code == 304 and cached:
+                deployments = cached["deployments"]
+                print(f"✅ Found {len(deployments)} deployment(s) (unchanged, from cache)")
+                return deployments
+
             response.raise_for_status()
 
-            data = response.json()
+            data = load_json(response.content)
             deployments = data.get("result", [])
 
+            etag = response.headers.get("ETag")
+            if cache_path is not None and etag:
+                self._write_deployments_cache(cache_path, count, etag, deployments)
+
             print(f"✅ Found {len(deployments)} deployment(s)")
             return deployments
 
@@ -86,31 +164,81 @@ class CloudflareDeploymentLogCapture:
             print(f"❌ Error fetching deployments: {e}")
             return []
 
-    def get_deployment_logs(self, deployment_id: str) -> Optional[Dict[str, Any]]:
-        """Fetch logs for a specific deployment."""
-        print(f"📥 Fetching logs for deployment {deployment_id[:8]}...")
+    def _read_deployments_cache(
+        self,
+        cache_path: Optional[Path],
+        count: int
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached deployments entry if it matches this project and count."""
+        if cache_path is None:
+            return None
+        try:
+            cached = load_json(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("project_name") != self.project_name
+            or cached.get("count") != count
+            or not cached.get("etag")
+        ):
+            return None
+        return cached
 
+    def _write_deployments_cache(
+        self,
+        cache_path: Path,
+        count: int,
+        etag: str,
+        deployments: List[Dict[str, Any]]
+    ) -> None:
+        """Store the deployments list with its ETag for the next conditional GET."""
+        entry = {
+            "project_name": self.project_name,
+            "count": count,
+            "etag": etag,
+            "deployments": deployments
+        }
         try:
-            # Get deployment details
-            response = requests.get(
-                f"{self.base_url}/deployments/{deployment_id}",
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
+            cache_path.write_bytes(dump_json(entry))
+        except OSError as e:
+            print(f"⚠️  Could not write deployments cache: {e}")
 
-            deployment = response.json().get("result", {})
+    def get_deployment_logs(
+        self,
+        deployment_id: str,
+        deployment: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch logs for a specific deployment.
+
+        The list endpoint returns the same deployment objects as the detail
+        endpoint, so when one from get_deployments is passed in only the
+        build logs are fetched; it is copied, not modified.
+        """
+        print(f"📥 Fetching logs for deployment {deployment_id[:8]}...")
+
+        try:
+            if deployment is None:
+                # Get deployment details
+                response = self.session.get(
+                    f"{self.base_url}/deployments/{deployment_id}",
+                    timeout=30
+                )
+                response.raise_for_status()
+
+                deployment = load_json(response.content).get("result", {})
+            else:
+                deployment = dict(deployment)
 
             # Get build logs
             logs_url = f"{self.base_url}/deployments/{deployment_id}/history/logs"
-            logs_response = requests.get(
+            logs_response = self.session.get(
                 logs_url,
-                headers=self.headers,
                 timeout=30
             )
 
             if logs_response.status_code == 200:
-                logs_data = logs_response.json()
+                logs_data = load_json(logs_response.content)
                 deployment["build_logs"] = logs_data.get("result", {})
             else:
                 deployment["build_logs"] = None
@@ -127,42 +255,35 @@ class CloudflareDeploymentLogCapture:
         deployment: Dict[str, Any],
         output_dir: Path
     ) -> Optional[Path]:
-        """Save deployment logs to JSON file."""
-        output_dir.mkdir(parents=True, exist_ok=True)
-
+        """Save deployment logs to JSON file (output_dir must already exist)."""
         # Generate filename with timestamp and deployment ID
         deployment_id = deployment.get("id", "unknown")
         created_on = deployment.get("created_on", "")
 
         try:
-            timestamp = datetime.fromisoformat(created_on.replace("Z", "+00:00"))
+            timestamp = parse_timestamp(created_on)
             date_str = timestamp.strftime("%Y%m%d-%H%M%S")
-        except (ValueError, AttributeError):
+        except (ValueError, TypeError, AttributeError):
             date_str = datetime.now().strftime("%Y%m%d-%H%M%S")
 
         filename = f"cloudflare-deployment-{date_str}-{deployment_id[:8]}.json"
         filepath = output_dir / filename
 
-        # Prepare deployment summary
+        # Prepare deployment summary: a few scalar fields for quick reading,
+        # plus the deployment itself (stages, source, build config, build
+        # logs, ...) stored once rather than copied alongside it
         summary = {
             "captured_at": datetime.now().isoformat(),
             "deployment_id": deployment_id,
             "project_name": self.project_name,
             "created_on": created_on,
             "environment": deployment.get("environment", "unknown"),
-            "deployment_trigger": deployment.get("deployment_trigger", {}),
-            "latest_stage": deployment.get("latest_stage", {}),
-            "build_config": deployment.get("build_config", {}),
-            "source": deployment.get("source", {}),
             "url": deployment.get("url", ""),
-            "aliases": deployment.get("aliases", []),
-            "build_logs": deployment.get("build_logs", None),
-            "full_deployment_data": deployment
+            "deployment": deployment
         }
 
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        # Write to file (UTF-8 bytes straight to disk, no text layer)
+        filepath.write_bytes(dump_json(summary, indent=True))
 
         print(f"💾 Saved deployment logs to: {filepath}")
         return filepath
@@ -200,8 +321,8 @@ class CloudflareDeploymentLogCapture:
         print("=" * 60 + "\n")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Capture Cloudflare Pages deployment logs"
     )
@@ -229,12 +350,14 @@ def main():
         help="Cloudflare Pages project name (default: terrainsim)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Get credentials from environment
-    account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID")
-    api_token = os.getenv("CLOUDFLARE_API_TOKEN")
-    project_name = os.getenv("CLOUDFLARE_PROJECT_NAME", args.project)
+    # Blank values count as unset, so a misconfigured CI secret fails here
+    # rather than with a 401 after the first request
+    account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID", "").strip()
+    api_token = os.getenv("CLOUDFLARE_API_TOKEN", "").strip()
+    project_name = os.getenv("CLOUDFLARE_PROJECT_NAME", "").strip() or args.project
 
     if not account_id:
         print("❌ Error: CLOUDFLARE_ACCOUNT_ID environment variable not set")
@@ -256,6 +379,7 @@ def main():
     )
 
     output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     print("=" * 60)
     print("☁️  Cloudflare Pages Deployment Log Capture")
@@ -277,25 +401,32 @@ def main():
             sys.exit(1)
     else:
         # Capture recent deployments
-        deployments = capture.get_deployments(args.count)
+        deployments = capture.get_deployments(
+            args.count,
+            cache_path=output_dir / ".deployments.cache"
+        )
 
         if not deployments:
             print("\n❌ No deployments found")
             sys.exit(1)
 
+        listed = [d for d in deployments if d.get("id")]
+
+        # Fetch build logs concurrently (I/O bound, sharing the session's
+        # connection pool); the listed deployments already carry every other
+        # field. Results are reported in the original order as they complete
         captured_count = 0
-        for deployment_summary in deployments:
-            deployment_id = deployment_summary.get("id")
-            if not deployment_id:
-                continue
-
-            # Fetch full deployment details with logs
-            deployment = capture.get_deployment_logs(deployment_id)
-            if deployment:
-                capture.print_deployment_summary(deployment)
-                capture.save_deployment_logs(deployment, output_dir)
-                captured_count += 1
-                print()
+        if listed:
+            with ThreadPoolExecutor(max_workers=min(8, len(listed))) as executor:
+                results = executor.map(
+                    lambda d: capture.get_deployment_logs(d["id"], d), listed
+                )
+                for deployment in results:
+                    if deployment:
+                        capture.print_deployment_summary(deployment)
+                        capture.save_deployment_logs(deployment, output_dir)
+                        captured_count += 1
+                        print()
 
         print(f"\n✅ Captured {captured_count}/{len(deployments)} deployment log(s)")
 
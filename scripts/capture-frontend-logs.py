@@ -23,63 +23,235 @@ Usage:
 import os
 import sys
 import json
+import mmap
+import shlex
+import tempfile
 import subprocess
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(data) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 
 class FrontendLogCapture:
     """Extract frontend logs from backend simulation logs."""
 
+    # Every frontend entry contains this token (as the "source" value);
+    # matching it on raw bytes avoids JSON-decoding the backend entries
+    FRONTEND_NEEDLE = b'"frontend"'
+
+    # Precedes each date's lines in the multi-date SSH stream
+    DATE_MARKER = b"==> "
+
+    # Simulation logs at least this large are scanned through mmap
+    MMAP_THRESHOLD = 8 << 20
+
     def __init__(self, server: str = "ubuntu@54.242.131.12"):
         """Initialize with server connection info."""
         self.server = server
         self.remote_log_dir = "/var/log/terrainsim"
         self.local_log_dir = Path("apps/simulation-api/logs")
 
+        # All ssh calls share one multiplexed connection (OpenSSH ControlMaster)
+        # with log-manager.py and set-log-level.py: the socket lives in ~/.ssh
+        # and persists for 5 minutes, so a master that is already up (e.g.
+        # log-manager's, when run from it) is reused without a new handshake.
+        # The Windows OpenSSH client does not support it.
+        self.ssh_options = ["-o", "StrictHostKeyChecking=no"]
+        self.control_path: Optional[str] = None
+        self._master_checked = False
+        if os.name != "nt":
+            self.control_path = str(Path.home() / ".ssh" / "terrainsim-%C")
+            self.ssh_options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self.control_path}",
+                "-o", "ControlPersist=300",
+            ]
+
+    def _ensure_master(self) -> None:
+        """Start the shared SSH master connection unless one is already running."""
+        if self.control_path is None or self._master_checked:
+            return
+        self._master_checked = True
+
+        check = subprocess.run(
+            ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if check.returncode == 0:
+            return
+
+        # -f -N: authenticate, then keep the master in the background. Started
+        # with no pipes attached, so a captured ssh call never waits on a
+        # backgrounded master holding its stdout open.
+        try:
+            Path(self.control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        subprocess.run(
+            ["ssh", *self.ssh_options, "-f", "-N", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
     def run_ssh_command(self, command: str) -> tuple[str, str, int]:
         """Execute command on remote server via SSH."""
+        self._ensure_master()
         result = subprocess.run(
-            ["ssh", "-o", "StrictHostKeyChecking=no", self.server, command],
+            ["ssh", *self.ssh_options, self.server, command],
             capture_output=True,
             text=True
         )
         return result.stdout, result.stderr, result.returncode
 
+    def filter_frontend_lines(self, lines: Iterable[bytes]) -> List[bytes]:
+        """Return the (stripped) raw lines that are frontend log entries."""
+        frontend_logs: List[bytes] = []
+
+        for line in lines:
+            # Cheap byte scan first: only lines that mention "frontend"
+            # at all are worth decoding as JSON
+            if self.FRONTEND_NEEDLE not in line:
+                continue
+
+            line = line.strip()
+            try:
+                log_entry = load_json(line)
+                # Check if this is a frontend log
+                if log_entry.get('source') == 'frontend':
+                    frontend_logs.append(line)
+            except (ValueError, AttributeError):
+                # Skip malformed lines
+                continue
+
+        return frontend_logs
+
+    @staticmethod
+    def write_lines(output_path: Path, lines: List[bytes]) -> None:
+        """Write raw lines, newline-terminated, through one 1 MiB buffered writer."""
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.writelines([line + b'\n' for line in lines])
+
+    def _iter_needle_lines(self, mm: mmap.mmap) -> Iterator[bytes]:
+        """Yield only the lines of a mapped file that contain FRONTEND_NEEDLE.
+
+        Jumps from one needle match to the next with mmap.find, so the
+        lines in between are never copied out of the page cache.
+        """
+        size = len(mm)
+        pos = 0
+        while (hit := mm.find(self.FRONTEND_NEEDLE, pos)) != -1:
+            start = mm.rfind(b'\n', 0, hit) + 1
+            end = mm.find(b'\n', hit)
+            if end == -1:
+                end = size
+            yield mm[start:end]
+            pos = end + 1
+
     def extract_frontend_logs(
         self,
         simulation_log_path: Path,
         output_path: Path
     ) -> int:
         """Extract frontend logs from simulation log file."""
-        if not simulation_log_path.exists():
+        # Raw lines of the matching entries, written back out verbatim
+        try:
+            with open(simulation_log_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= self.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        frontend_logs = self.filter_frontend_lines(
+                            self._iter_needle_lines(mm)
+                        )
+                else:
+                    frontend_logs = self.filter_frontend_lines(f)
+        except FileNotFoundError:
             print(f"  ⚠️  File not found: {simulation_log_path}")
             return 0
 
-        frontend_logs: List[Dict[str, Any]] = []
+        if frontend_logs:
+            # Write extracted logs to output file
+            self.write_lines(output_path, frontend_logs)
 
-        with open(simulation_log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        return len(frontend_logs)
+
+    def fetch_frontend_lines(
+        self,
+        dates: List[str]
+    ) -> Tuple[Dict[str, List[bytes]], str]:
+        """Grep the simulation logs of the given dates on the server in one SSH stream.
+
+        Only candidate lines (containing FRONTEND_NEEDLE) cross the wire;
+        each existing date's lines are preceded by a DATE_MARKER line.
+        Returns the raw candidate lines keyed by date (dates without a log
+        are absent) and the error output if the command failed.
+        """
+        marker = self.DATE_MARKER.decode()
+        needle = shlex.quote(self.FRONTEND_NEEDLE.decode())
+        quoted = " ".join(shlex.quote(d) for d in dates)
+        command = (
+            f"cd {shlex.quote(self.remote_log_dir)} || exit 1; "
+            f"for d in {quoted}; do f=simulation-$d.log; "
+            f"[ -f \"$f\" ] || continue; echo \"{marker}$d\"; grep -aF {needle} \"$f\"; "
+            f"done; exit 0"
+        )
 
-                try:
-                    log_entry = json.loads(line)
-                    # Check if this is a frontend log
-                    if log_entry.get('source') == 'frontend':
-                        frontend_logs.append(log_entry)
-                except json.JSONDecodeError:
-                    # Skip malformed lines
-                    continue
+        self._ensure_master()
+        # stderr goes to a temp file so a chatty server cannot block the pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                ["ssh", *self.ssh_options, self.server, command],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            )
+
+            # Group the streamed lines by date
+            lines_by_date: Dict[str, List[bytes]] = {}
+            current: Optional[List[bytes]] = None
+            with process.stdout:
+                for line in process.stdout:
+                    if line.startswith(self.DATE_MARKER):
+                        current = lines_by_date.setdefault(
+                            line[len(self.DATE_MARKER):].strip().decode(), []
+                        )
+                    elif current is not None:
+                        current.append(line)
+            process.wait()
+
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                return {}, stderr_file.read().decode(errors="replace").strip() or "ssh failed"
+
+        return lines_by_date, ""
+
+    def save_frontend_logs(self, lines: List[bytes], output_file: Path) -> int:
+        """Write the frontend entries among lines to output_file and report the result."""
+        frontend_logs = self.filter_frontend_lines(lines)
 
         if frontend_logs:
-            # Write extracted logs to output file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for log in frontend_logs:
-                    f.write(json.dumps(log) + '\n')
+            self.write_lines(output_file, frontend_logs)
+            file_size = output_file.stat().st_size
+            print(f"    ✅ Extracted {len(frontend_logs)} frontend log(s) ({file_size:,} bytes)")
+        else:
+            print(f"    ⚠️  No frontend logs found")
+            # Remove output left over from an earlier run
+            output_file.unlink(missing_ok=True)
 
         return len(frontend_logs)
 
@@ -101,56 +273,50 @@ class FrontendLogCapture:
 
         print(f"  Target date: {log_date}")
 
-        # Download simulation log (contains frontend logs)
-        remote_log = f"{self.remote_log_dir}/simulation-{log_date}.log"
-        temp_log = output_dir / f"temp-simulation-{log_date}.log"
-
-        print(f"  📁 Downloading simulation log...")
+        # Existence check, server-side filtering and transfer in one SSH call
+        print(f"  🔍 Extracting frontend logs...")
+        lines_by_date, error = self.fetch_frontend_lines([log_date])
 
-        # Check if file exists on server
-        check_cmd = f"test -f {remote_log} && echo 'exists' || echo 'missing'"
-        stdout, stderr, code = self.run_ssh_command(check_cmd)
+        if error:
+            print(f"    ❌ Failed to read simulation log")
+            print(f"       Error: {error}")
+            return
 
-        if "exists" not in stdout:
+        if log_date not in lines_by_date:
             print(f"    ⚠️  Simulation log not found on server for {log_date}")
             return
 
-        # Download file via SCP
-        result = subprocess.run(
-            [
-                "scp",
-                "-o", "StrictHostKeyChecking=no",
-                f"{self.server}:{remote_log}",
-                str(temp_log)
-            ],
-            capture_output=True,
-            text=True
+        self.save_frontend_logs(
+            lines_by_date[log_date], output_dir / f"frontend-{log_date}.log"
         )
 
-        if result.returncode != 0:
-            print(f"    ❌ Failed to download simulation log")
-            print(f"       Error: {result.stderr}")
-            return
+    def capture_production_logs_range(
+        self,
+        dates: List[str],
+        output_dir: Path
+    ) -> None:
+        """Capture frontend logs for several dates from production in one SSH stream."""
+        print(f"📥 Capturing frontend logs from production ({self.server})...")
+        print(f"  Target dates: {dates[-1]} to {dates[0]}")
 
-        print(f"    ✅ Downloaded simulation log")
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Extract frontend logs
-        output_file = output_dir / f"frontend-{log_date}.log"
-        print(f"  🔍 Extracting frontend logs...")
+        lines_by_date, error = self.fetch_frontend_lines(dates)
 
-        count = self.extract_frontend_logs(temp_log, output_file)
+        if error:
+            print(f"  ❌ Failed to read simulation logs")
+            print(f"     Error: {error}")
+            return
 
-        if count > 0:
-            file_size = output_file.stat().st_size
-            print(f"    ✅ Extracted {count} frontend log(s) ({file_size:,} bytes)")
-        else:
-            print(f"    ⚠️  No frontend logs found")
-            # Remove empty file
-            if output_file.exists():
-                output_file.unlink()
+        for log_date in dates:
+            print(f"  📁 {log_date}:")
+            if log_date not in lines_by_date:
+                print(f"    ⚠️  Simulation log not found on server for {log_date}")
+                continue
 
-        # Clean up temp file
-        temp_log.unlink()
+            self.save_frontend_logs(
+                lines_by_date[log_date], output_dir / f"frontend-{log_date}.log"
+            )
 
     def capture_local_logs(
         self,
@@ -160,13 +326,6 @@ class FrontendLogCapture:
         """Capture frontend logs from local development environment."""
         print("📥 Capturing frontend logs from local environment...")
 
-        if not self.local_log_dir.exists():
-            print(f"❌ Local log directory not found: {self.local_log_dir}")
-            print("  Make sure the backend has been run at least once.")
-            return
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         # Determine date to capture
         if date:
             log_date = date
@@ -178,10 +337,20 @@ class FrontendLogCapture:
         # Find simulation log
         simulation_log = self.local_log_dir / f"simulation-{log_date}.log"
 
-        if not simulation_log.exists():
-            print(f"  ⚠️  Simulation log not found: simulation-{log_date}.log")
+        # One stat answers both "is there a log dir" and "is there a log";
+        # the directory is only looked at again to pick the error message
+        try:
+            simulation_log.stat()
+        except FileNotFoundError:
+            if not self.local_log_dir.is_dir():
+                print(f"❌ Local log directory not found: {self.local_log_dir}")
+                print("  Make sure the backend has been run at least once.")
+            else:
+                print(f"  ⚠️  Simulation log not found: simulation-{log_date}.log")
             return
 
+        output_dir.mkdir(parents=True, exist_ok=True)
+
         # Extract frontend logs
         output_file = output_dir / f"frontend-{log_date}.log"
         print(f"  🔍 Extracting frontend logs...")
@@ -193,32 +362,49 @@ class FrontendLogCapture:
             print(f"    ✅ Extracted {count} frontend log(s) ({file_size:,} bytes)")
         else:
             print(f"    ⚠️  No frontend logs found")
-            # Remove empty file
-            if output_file.exists():
-                output_file.unlink()
+            # Remove output left over from an earlier run
+            output_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        """Count lines by counting newlines in 1 MiB binary chunks (no decoding)."""
+        count = 0
+        with open(path, 'rb', buffering=0) as f:
+            while chunk := f.read(1 << 20):
+                count += chunk.count(b'\n')
+        return count
 
     def generate_summary(self, output_dir: Path) -> None:
         """Generate summary of captured frontend logs."""
         print("\n📊 Frontend Log Summary:")
 
-        log_files = sorted(output_dir.glob("frontend-*.log"))
+        # One scandir pass gives name and size without a separate stat call
+        log_files = []
+        if output_dir.is_dir():
+            with os.scandir(output_dir) as it:
+                log_files = sorted(
+                    (entry.name, entry.path, entry.stat().st_size)
+                    for entry in it
+                    if entry.name.startswith("frontend-")
+                    and entry.name.endswith(".log")
+                    and entry.is_file()
+                )
 
         if not log_files:
             print("  No frontend logs captured")
             return
 
         total_entries = 0
-        for log_file in log_files:
-            count = sum(1 for _ in open(log_file, 'r'))
-            size = log_file.stat().st_size
-            print(f"  {log_file.name:<30} {count:>6} entries  {size:>10,} bytes")
+        for name, path, size in log_files:
+            count = self._count_lines(path)
+            print(f"  {name:<30} {count:>6} entries  {size:>10,} bytes")
             total_entries += count
 
         print(f"\n  Total: {total_entries} frontend log entries")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Capture frontend logs from backend simulation logs"
     )
@@ -244,7 +430,7 @@ def main():
         help="Capture logs from last N days"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     capture = FrontendLogCapture()
     output_dir = Path(args.output)
@@ -261,17 +447,22 @@ def main():
         # Capture multiple days
         print(f"📅 Capturing logs from last {args.last_n_days} day(s)...\n")
 
-        for i in range(args.last_n_days):
-            date_obj = datetime.now() - timedelta(days=i)
-            date_str = date_obj.strftime("%Y-%m-%d")
+        # One clock read, so the dates stay consistent across midnight
+        today = datetime.now()
+        dates = [
+            (today - timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(args.last_n_days)
+        ]
 
-            print(f"\n{'='*60}")
-            print(f"Capturing logs for {date_str}")
-            print('='*60)
+        if args.environment == "production":
+            # All dates in one SSH stream rather than one download per date
+            capture.capture_production_logs_range(dates, output_dir)
+        else:
+            for date_str in dates:
+                print(f"\n{'='*60}")
+                print(f"Capturing logs for {date_str}")
+                print('='*60)
 
-            if args.environment == "production":
-                capture.capture_production_logs(output_dir, date_str)
-            else:
                 capture.capture_local_logs(output_dir, date_str)
     else:
         # Capture single date
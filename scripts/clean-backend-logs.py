@@ -32,7 +32,7 @@ import argparse
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class BackendLogCleaner:
@@ -46,10 +46,56 @@ class BackendLogCleaner:
         # SSH key path for Windows
         self.ssh_key = r"C:\Users\l-cruz\.ssh\terrainsim-key.pem"
 
+        # All ssh calls share one multiplexed connection (OpenSSH ControlMaster)
+        # with log-manager.py and set-log-level.py: the socket lives in ~/.ssh
+        # and persists for 5 minutes, so a master that is already up (e.g.
+        # log-manager's, when run from it) is reused without a new handshake.
+        # The Windows OpenSSH client does not support it.
+        self.ssh_options = ["-i", self.ssh_key, "-o", "StrictHostKeyChecking=no"]
+        self.control_path: Optional[str] = None
+        self._master_checked = False
+        if os.name != "nt":
+            self.control_path = str(Path.home() / ".ssh" / "terrainsim-%C")
+            self.ssh_options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self.control_path}",
+                "-o", "ControlPersist=300",
+            ]
+
+    def _ensure_master(self) -> None:
+        """Start the shared SSH master connection unless one is already running."""
+        if self.control_path is None or self._master_checked:
+            return
+        self._master_checked = True
+
+        check = subprocess.run(
+            ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if check.returncode == 0:
+            return
+
+        # -f -N: authenticate, then keep the master in the background. Started
+        # with no pipes attached, so a captured ssh call never waits on a
+        # backgrounded master holding its stdout open.
+        try:
+            Path(self.control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        subprocess.run(
+            ["ssh", *self.ssh_options, "-f", "-N", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
     def run_ssh_command(self, command: str) -> tuple[str, str, int]:
         """Execute command on remote server via SSH."""
+        self._ensure_master()
         result = subprocess.run(
-            ["ssh", "-i", self.ssh_key, "-o", "StrictHostKeyChecking=no", self.server, command],
+            ["ssh", *self.ssh_options, self.server, command],
             capture_output=True,
             text=True,
             encoding='utf-8',
@@ -67,59 +113,77 @@ class BackendLogCleaner:
         print(f"  Retention: {retention_days} days")
         print(f"  Mode: {'DRY RUN' if dry_run else 'DELETE'}\n")
 
-        # Build find command to locate old files
-        find_cmd = f"""
-cd {self.remote_log_dir}
-echo "📁 Current log directory size:"
+        # Size, listing and (unless dry run) deletion all happen in one
+        # SSH session; each part of the output is preceded by a marker line
+        find_args = f'{self.remote_log_dir} -name "*.log" -type f -mtime +{retention_days}'
+        delete_step = "" if dry_run else f"""
+find {find_args} -delete
+echo "---AFTER---"
 du -sh {self.remote_log_dir}
-echo ""
-echo "📋 Log files older than {retention_days} days:"
-find {self.remote_log_dir} -name "*.log" -type f -mtime +{retention_days} -exec ls -lh {{}} \\;
 """
+        script = f"""
+cd {self.remote_log_dir} || exit 1
+echo "---SIZE---"
+du -sh {self.remote_log_dir}
+echo "---FILES---"
+find {find_args} -printf "%TY-%Tm-%Td %s %p\\n"
+{delete_step}"""
 
-        stdout, stderr, code = self.run_ssh_command(find_cmd)
+        stdout, stderr, code = self.run_ssh_command(script)
 
         if code != 0:
-            print(f"❌ Error listing files: {stderr}")
+            print(f"❌ Error cleaning files: {stderr}")
             return
 
-        if stdout:
-            print(stdout)
+        sections = self._parse_sections(stdout)
 
-        if not stdout or "No such file or directory" in stdout or not stdout.strip():
-            print("✅ No old log files to clean")
-            return
+        print("📁 Current log directory size:")
+        print(sections.get("SIZE", ""))
+        print(f"\n📋 Log files older than {retention_days} days:")
 
-        # Count files to delete
-        count_cmd = f"find {self.remote_log_dir} -name '*.log' -type f -mtime +{retention_days} | wc -l"
-        count_out, _, _ = self.run_ssh_command(count_cmd)
-        file_count = int(count_out.strip()) if count_out.strip().isdigit() else 0
+        # Each listing line is "<modified date> <size in bytes> <path>"
+        file_count = 0
+        total_size = 0
+        for line in sections.get("FILES", "").splitlines():
+            parts = line.split(" ", 2)
+            if len(parts) != 3 or not parts[1].isdigit():
+                continue
+            modified, size, path = parts[0], int(parts[1]), parts[2]
+            print(f"  {modified}  {size:>12,} bytes  {path}")
+            file_count += 1
+            total_size += size
 
         if file_count == 0:
             print("✅ No old log files to clean")
             return
 
-        print(f"\n🗑️  Found {file_count} file(s) to delete")
+        print(f"\n🗑️  Found {file_count} file(s) to delete ({total_size / (1024*1024):.2f} MB)")
 
         if dry_run:
             print("  (Dry run - no files deleted)")
             return
 
-        # Delete old files
-        delete_cmd = f"""
-find {self.remote_log_dir} -name "*.log" -type f -mtime +{retention_days} -delete
-echo "✅ Deleted {file_count} old log file(s)"
-echo ""
-echo "📁 New log directory size:"
-du -sh {self.remote_log_dir}
-"""
-
-        stdout, stderr, code = self.run_ssh_command(delete_cmd)
-
-        if code == 0:
-            print(stdout)
-        else:
-            print(f"❌ Error deleting files: {stderr}")
+        print(f"✅ Deleted {file_count} old log file(s)")
+        print("\n📁 New log directory size:")
+        print(sections.get("AFTER", ""))
+
+    @staticmethod
+    def _parse_sections(output: str) -> dict[str, str]:
+        """Split marker-delimited (---NAME---) script output into named sections."""
+        sections: dict[str, str] = {}
+        current = None
+        lines: List[str] = []
+        for line in output.splitlines():
+            if line.startswith("---") and line.endswith("---") and len(line) > 6:
+                if current:
+                    sections[current] = "\n".join(lines).strip()
+                current = line.strip("-")
+                lines = []
+            elif current:
+                lines.append(line)
+        if current:
+            sections[current] = "\n".join(lines).strip()
+        return sections
 
     def clean_local_logs(
         self,
@@ -142,15 +206,22 @@ du -sh {self.remote_log_dir}
         print(f"  Directory: {self.local_log_dir}")
         print(f"  Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        # Find old log files
-        old_files: List[Tuple[Path, datetime]] = []
-
-        for log_file in self.local_log_dir.glob("*.log"):
-            if log_file.is_file():
-                mtime = log_file.stat().st_mtime
-                if mtime < cutoff_time:
-                    modified_date = datetime.fromtimestamp(mtime)
-                    old_files.append((log_file, modified_date))
+        # Find old log files in one scandir pass, keeping (path, mtime, size)
+        # from a single stat per entry; totals over all log files give the
+        # "remaining" figures later without another directory pass
+        old_files: List[Tuple[Path, float, int]] = []
+        all_count = 0
+        all_size = 0
+
+        with os.scandir(self.local_log_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".log") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                all_count += 1
+                all_size += stat.st_size
+                if stat.st_mtime < cutoff_time:
+                    old_files.append((Path(entry.path), stat.st_mtime, stat.st_size))
 
         if not old_files:
             print("✅ No old log files to clean")
@@ -161,10 +232,10 @@ du -sh {self.remote_log_dir}
 
         print(f"📋 Files to delete ({len(old_files)}):")
         total_size = 0
-        for log_file, modified_date in old_files:
-            size = log_file.stat().st_size
+        now = datetime.now()
+        for log_file, mtime, size in old_files:
             total_size += size
-            age_days = (datetime.now() - modified_date).days
+            age_days = (now - datetime.fromtimestamp(mtime)).days
             print(f"  {log_file.name:<30} {size:>10,} bytes  {age_days:>3} days old")
 
         print(f"\n  Total size: {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
@@ -175,24 +246,26 @@ du -sh {self.remote_log_dir}
 
         # Delete files
         deleted_count = 0
-        for log_file, _ in old_files:
+        deleted_size = 0
+        for log_file, _, size in old_files:
             try:
                 log_file.unlink()
                 deleted_count += 1
+                deleted_size += size
             except OSError as e:
                 print(f"  ⚠️  Failed to delete {log_file.name}: {e}")
 
         print(f"\n✅ Deleted {deleted_count}/{len(old_files)} file(s)")
 
         # Show remaining space
-        remaining_files = list(self.local_log_dir.glob("*.log"))
-        if remaining_files:
-            remaining_size = sum(f.stat().st_size for f in remaining_files)
-            print(f"📁 Remaining: {len(remaining_files)} file(s), {remaining_size:,} bytes ({remaining_size / (1024*1024):.2f} MB)")
+        remaining_count = all_count - deleted_count
+        if remaining_count:
+            remaining_size = all_size - deleted_size
+            print(f"📁 Remaining: {remaining_count} file(s), {remaining_size:,} bytes ({remaining_size / (1024*1024):.2f} MB)")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Clean old backend log files"
     )
@@ -212,7 +285,7 @@ def main():
         help="Show what would be deleted without actually deleting"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set default retention based on environment
     if args.days:
@@ -23,17 +23,49 @@ Usage:
     python scripts/clean-frontend-logs.py --dir logs/captured/frontend
 """
 
+import os
 import sys
 import argparse
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 
 class FrontendLogCleaner:
     """Clean old frontend log files."""
 
+    @staticmethod
+    def _unlink_names(
+        log_dir: Path,
+        names: List[str]
+    ) -> Iterator[Tuple[str, Optional[OSError]]]:
+        """Delete files by name from log_dir, yielding (name, error or None).
+
+        Where supported (not on Windows), unlinks relative to one open
+        directory fd (unlinkat) so the directory path is resolved once
+        rather than for every file.
+        """
+        if os.unlink not in os.supports_dir_fd:
+            for name in names:
+                try:
+                    (log_dir / name).unlink()
+                    yield name, None
+                except OSError as e:
+                    yield name, e
+            return
+
+        dir_fd = os.open(log_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            for name in names:
+                try:
+                    os.unlink(name, dir_fd=dir_fd)
+                    yield name, None
+                except OSError as e:
+                    yield name, e
+        finally:
+            os.close(dir_fd)
+
     def clean_captured_logs(
         self,
         log_dir: Path,
@@ -52,35 +84,44 @@ class FrontendLogCleaner:
             return
 
         # Calculate cutoff time
-        cutoff_time = time.time() - (retention_days * 86400)
+        now = time.time()
+        cutoff_time = now - (retention_days * 86400)
         cutoff_date = datetime.fromtimestamp(cutoff_time)
 
         print(f"  Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        # Find old frontend log files
-        old_files: List[Tuple[Path, datetime]] = []
-
-        for log_file in log_dir.glob("frontend-*.log"):
-            if log_file.is_file():
-                mtime = log_file.stat().st_mtime
-                if mtime < cutoff_time:
-                    modified_date = datetime.fromtimestamp(mtime)
-                    old_files.append((log_file, modified_date))
+        # Find old frontend log files in one scandir pass, keeping
+        # (name, size, mtime) from a single stat per entry; totals over all
+        # frontend log files give the "remaining" figures later without
+        # another directory pass
+        old_files: List[Tuple[str, int, float]] = []
+        total_size = 0
+        all_count = 0
+        all_size = 0
+
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith("frontend-") and name.endswith(".log")) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                all_count += 1
+                all_size += stat.st_size
+                if stat.st_mtime < cutoff_time:
+                    old_files.append((name, stat.st_size, stat.st_mtime))
+                    total_size += stat.st_size
 
         if not old_files:
             print("✅ No old frontend log files to clean")
             return
 
         # Sort by modification time
-        old_files.sort(key=lambda x: x[1])
+        old_files.sort(key=lambda x: x[2])
 
         print(f"📋 Files to delete ({len(old_files)}):")
-        total_size = 0
-        for log_file, modified_date in old_files:
-            size = log_file.stat().st_size
-            total_size += size
-            age_days = (datetime.now() - modified_date).days
-            print(f"  {log_file.name:<30} {size:>10,} bytes  {age_days:>3} days old")
+        for name, size, mtime in old_files:
+            age_days = int((now - mtime) / 86400)
+            print(f"  {name:<30} {size:>10,} bytes  {age_days:>3} days old")
 
         print(f"\n  Total size: {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
 
@@ -90,24 +131,26 @@ class FrontendLogCleaner:
 
         # Delete files
         deleted_count = 0
-        for log_file, _ in old_files:
-            try:
-                log_file.unlink()
+        deleted_size = 0
+        sizes = {name: size for name, size, _ in old_files}
+        for name, error in self._unlink_names(log_dir, list(sizes)):
+            if error is None:
                 deleted_count += 1
-            except OSError as e:
-                print(f"  ⚠️  Failed to delete {log_file.name}: {e}")
+                deleted_size += sizes[name]
+            else:
+                print(f"  ⚠️  Failed to delete {name}: {error}")
 
         print(f"\n✅ Deleted {deleted_count}/{len(old_files)} file(s)")
 
         # Show remaining space
-        remaining_files = list(log_dir.glob("frontend-*.log"))
-        if remaining_files:
-            remaining_size = sum(f.stat().st_size for f in remaining_files)
-            print(f"📁 Remaining: {len(remaining_files)} file(s), {remaining_size:,} bytes ({remaining_size / (1024*1024):.2f} MB)")
+        remaining_count = all_count - deleted_count
+        if remaining_count:
+            remaining_size = all_size - deleted_size
+            print(f"📁 Remaining: {remaining_count} file(s), {remaining_size:,} bytes ({remaining_size / (1024*1024):.2f} MB)")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Clean old frontend log files"
     )
@@ -129,7 +172,7 @@ def main():
         help="Show what would be deleted without actually deleting"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     log_dir = Path(args.dir)
     cleaner = FrontendLogCleaner()
@@ -6,15 +6,40 @@ Compares current benchmark results with baseline to detect performance regressio
 """
 
 import json
+import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# A non-empty table cell, without surrounding whitespace
+_CELL = r'([^|\s](?:[^|\n]*[^|\s])?)'
+# First two non-empty cells of a markdown table row; header rows (containing
+# "Operation") and separator rows (containing "---") are skipped
+TABLE_ROW_RE = re.compile(
+    r'^[^\S\n]*(?![^\n]*(?:Operation|---))\|(?:[^\S\n]*\|)*[^\S\n]*' + _CELL +
+    r'[^\S\n]*\|(?:[^\S\n]*\|)*[^\S\n]*' + _CELL,
+    re.MULTILINE
+)
+
+# A time value such as "~50 μs" or "<1.2 ms": optional "~"/"<" prefix, the
+# number, then its unit (longer units first, so "ms" is never read as "s")
+TIME_RE = re.compile(r'[~<\s]*(\d+(?:\.\d*)?|\.\d+)\s*(μs|us|ms|sec|s)')
+# Microseconds per unit
+TIME_UNIT_US = {'μs': 1.0, 'us': 1.0, 'ms': 1e3, 'sec': 1e6, 's': 1e6}
 
 
 def load_json_results(filepath: Path) -> Dict:
-    """Load benchmark results from JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    """Load benchmark results from JSON file (with orjson when installed)."""
+    data = filepath.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def parse_baseline_md(filepath: Path) -> Dict[str, float]:
@@ -29,51 +54,31 @@ def parse_baseline_md(filepath: Path) -> Dict[str, float]:
     """
     baselines = {}
 
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
-    # Simple parser - look for markdown tables with timing data
-    in_table = False
-    for line in lines:
-        line = line.strip()
+    text = filepath.read_text()
 
-        # Detect table rows (ignore header and separator)
-        if line.startswith('|') and 'Operation' not in line and '---' not in line:
-            parts = [p.strip() for p in line.split('|') if p.strip()]
+    # One pass over the whole file: every table row (header and separator
+    # rows excluded) yields its first two non-empty cells
+    for match in TABLE_ROW_RE.finditer(text):
+        operation, time_str = match.groups()
 
-            if len(parts) >= 2:
-                operation = parts[0]
-                time_str = parts[1]
-
-                # Parse time value (e.g., "~50 μs", "~1.2 ms", "~1.75 sec")
-                try:
-                    time_value = parse_time_string(time_str)
-                    if time_value:
-                        baselines[operation] = time_value
-                except:
-                    pass
+        # Parse time value (e.g., "~50 μs", "~1.2 ms", "~1.75 sec")
+        time_value = parse_time_string(time_str)
+        if time_value:
+            baselines[operation] = time_value
 
     return baselines
 
 
-def parse_time_string(time_str: str) -> float:
+def parse_time_string(time_str: str) -> Optional[float]:
     """
     Convert time string to microseconds.
     Examples: "~50 μs" -> 50.0, "~1.2 ms" -> 1200.0, "~1.75 sec" -> 1750000.0
     """
-    time_str = time_str.replace('~', '').replace('<', '').strip()
-
-    if 'μs' in time_str or 'us' in time_str:
-        value = float(time_str.split('μs')[0].split('us')[0].strip())
-        return value
-    elif 'ms' in time_str:
-        value = float(time_str.split('ms')[0].strip())
-        return value * 1000  # Convert to μs
-    elif 'sec' in time_str or 's' in time_str:
-        value = float(time_str.split('sec')[0].split('s')[0].strip())
-        return value * 1000000  # Convert to μs
-
-    return None
+    match = TIME_RE.match(time_str)
+    if match is None:
+        return None
+    value, unit = match.groups()
+    return float(value) * TIME_UNIT_US[unit]
 
 
 def compare_benchmarks(
@@ -97,15 +102,20 @@ def compare_benchmarks(
     else:
         current_benchmarks = []
 
+    # Lower-cased once up front rather than on every (benchmark, baseline) pair
+    baseline_lower = [(baseline_name.lower(), baseline_time) for baseline_name, baseline_time in baseline.items()]
+
     for bench in current_benchmarks:
         name = bench.get('name', '')
         current_time = bench.get('real_time', 0)  # Time in nanoseconds
         current_time_us = current_time / 1000  # Convert to microseconds
 
-        # Try to match with baseline (simplified matching)
+        # Try to match with baseline (simplified matching): the first
+        # baseline, in table order, whose name appears in the benchmark name
+        name_lower = name.lower()
         baseline_time_us = None
-        for baseline_name, baseline_time in baseline.items():
-            if baseline_name.lower() in name.lower():
+        for baseline_name, baseline_time in baseline_lower:
+            if baseline_name in name_lower:
                 baseline_time_us = baseline_time
                 break
 
@@ -19,18 +19,266 @@ Exit codes:
 
 import argparse
 import json
+import mmap
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 import re
 
+# Module specifiers of static imports/re-exports (`from '...'`, `import '...'`)
+# and dynamic imports (`import('...')`)
+IMPORT_RE = re.compile(rb"""(?:\bfrom\s+|\bimport\s*\(?\s*)['"]([^'"\n]+)['"]""")
+
+# Files scanned for imports when building the import index
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+
+# One line of ts-unused-exports output: "<file>: <export>, <export>, ..."
+UNUSED_EXPORT_RE = re.compile(r'(.+?):\s*(.+)')
+
+# TypeScript sources checked by the detectors
+TS_EXTENSIONS = ('.ts', '.tsx')
+
+# Directories never descended into: dependencies and build output
+PRUNED_DIRS = frozenset({'node_modules', 'dist', 'build', 'coverage', '.next'})
+
+# A commented line "looks like code" if it contains any of these
+CODE_KEYWORDS = (
+    'const ', 'let ', 'var ', 'function ', 'import ', 'export ',
+    'if (', 'for (', 'while (', 'return ', '= ', '=> ', '.push(',
+    '.map(', '.filter(', 'console.', 'logger.'
+)
+# All keywords in one alternation: a single scan per line instead of one
+# substring search per keyword (matched on raw bytes)
+CODE_RE = re.compile(b'|'.join(re.escape(keyword.encode()) for keyword in CODE_KEYWORDS))
+
+# A `//` or `/*` comment line, excluding `///` and `/**` (JSDoc)
+COMMENT_LINE_RE = re.compile(rb'\s*(?://(?!/)|/\*(?!\*))')
+
+# Source files at least this large are scanned through mmap
+MMAP_THRESHOLD = 1 << 20
+
+def module_stem(specifier: str) -> str:
+    """File stem an import specifier refers to: './foo.types' -> 'foo.types', './api.ts' -> 'api'
+
+    Only a source extension is removed, so dotted module names match the
+    file-side os.path.splitext() stem.
+    """
+    name = specifier.rstrip('/').rsplit('/', 1)[-1]
+    if name.endswith(SOURCE_EXTENSIONS):
+        name = os.path.splitext(name)[0]
+    return name
+
+def iter_lines(buffer) -> Iterator[bytes]:
+    """Yield the lines of a bytes-like buffer (bytes or mmap), without line endings
+    
+    Lines are located with find(b'\\n') on the buffer itself; a trailing
+    '\\r' is left in place (callers strip).
+    """
+    pos = 0
+    end = len(buffer)
+    while pos < end:
+        newline = buffer.find(b'\n', pos)
+        if newline == -1:
+            yield buffer[pos:]
+            return
+        yield buffer[pos:newline]
+        pos = newline + 1
+
+def find_commented_blocks(path: str, rel_path: str) -> Tuple[List[Dict], str]:
+    """Find runs of more than 5 commented-out code lines in one file.
+    
+    Module-level so it can run in worker processes. Returns the blocks and
+    an error message ("" if the file was read fine).
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return scan_commented_lines(iter_lines(mm), rel_path), ""
+            data = f.read()
+    except (OSError, ValueError) as e:
+        return [], str(e)
+    
+    return scan_commented_lines(iter_lines(data), rel_path), ""
+
+def scan_commented_lines(lines: Iterator[bytes], rel_path: str) -> List[Dict]:
+    """Collect blocks of more than 5 consecutive commented-out code lines"""
+    blocks = []
+    
+    # Track consecutive commented lines
+    comment_start = None
+    consecutive_comments: List[bytes] = []
+    
+    i = 0
+    for i, line in enumerate(lines, 1):
+        # A comment line that looks like code (has keywords, operators, etc.);
+        # the keyword search only runs on comment lines
+        code = line.rstrip() if COMMENT_LINE_RE.match(line) else None
+        
+        if code is not None and CODE_RE.search(code):
+            if comment_start is None:
+                comment_start = i
+            consecutive_comments.append(code)
+        else:
+            # End of comment block
+            if comment_start is not None and len(consecutive_comments) > 5:
+                blocks.append(_commented_block(rel_path, comment_start, i - 1, consecutive_comments))
+            comment_start = None
+            consecutive_comments = []
+    
+    # Check last block
+    if comment_start is not None and len(consecutive_comments) > 5:
+        blocks.append(_commented_block(rel_path, comment_start, i, consecutive_comments))
+    
+    return blocks
+
+def _commented_block(rel_path: str, start: int, end: int, lines: List[bytes]) -> Dict:
+    """Report entry for one block; only its preview lines are decoded"""
+    return {
+        'file': rel_path,
+        'start_line': start,
+        'end_line': end,
+        'line_count': len(lines),
+        'preview': b'\n'.join(lines[:3]).decode('utf-8', 'replace') + '\n...'
+    }
+
 class DeadCodeDetector:
-    def __init__(self, repo_root: Path, verbose: bool = False):
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 200
+    # Cached tool results, relative to the repository root
+    CACHE_DIR = Path(".cache") / "dead-code"
+    # Bumped whenever the import index format or the stem rules change, so
+    # an index.json written by an older version is rebuilt
+    INDEX_VERSION = 2
+    
+
+    def __init__(self, repo_root: Path, verbose: bool = False, jobs: int = 1):
         self.repo_root = repo_root
         self.verbose = verbose
+        self.jobs = max(1, jobs)
         self.issues: List[Dict] = []
+        # Raw contents of every source file read so far, shared by the detectors
+        self._sources: Dict[Path, bytes] = {}
+        self._unused_exports_cmd: Optional[List[str]] = None
+        # Every source file under apps/, from the one directory walk per run
+        self._source_entries: Optional[List[os.DirEntry]] = None
+        
+    def read_source(self, file_path: Path) -> bytes:
+        """Return a file's bytes, reading it at most once per run"""
+        data = self._sources.get(file_path)
+        if data is None:
+            data = self._sources[file_path] = file_path.read_bytes()
+        return data
+    
+    def iter_source_files(self, search_dir: Path, extensions: Tuple[str, ...] = TS_EXTENSIONS) -> Iterator[os.DirEntry]:
+        """Yield directory entries of files under search_dir with the given extensions
+        
+        A top-down os.scandir walk (same order as os.walk). PRUNED_DIRS are
+        never listed, and directory entries use the file type the kernel
+        already returned instead of a stat per entry.
+        """
+        stack = [str(search_dir)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            
+            subdirs = []
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNED_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(extensions) and entry.is_file():
+                        yield entry
+            
+            stack.extend(reversed(subdirs))
+    
+    def source_entries(self) -> List[os.DirEntry]:
+        """All SOURCE_EXTENSIONS files under apps/, walked once and shared by the detectors"""
+        if self._source_entries is None:
+            self._source_entries = list(self.iter_source_files(self.repo_root / "apps", SOURCE_EXTENSIONS))
+        return self._source_entries
+    
+    def source_files_under(self, directory: Path, extensions: Tuple[str, ...] = TS_EXTENSIONS) -> List[os.DirEntry]:
+        """Files below directory with the given extensions, taken from the shared walk"""
+        prefix = os.path.join(str(directory), "")
+        return [
+            entry for entry in self.source_entries()
+            if entry.path.startswith(prefix) and entry.name.endswith(extensions)
+        ]
+    
+    def build_imported_stems(self) -> Set[str]:
+        """Collect the stem of every module imported anywhere under apps/
+        
+        Per-file results are kept in CACHE_DIR/index.json keyed by path,
+        mtime_ns and size, so only files changed since the last run are
+        read again; entries for files that no longer exist are dropped.
+        """
+        index_file = self.repo_root / self.CACHE_DIR / "index.json"
+        try:
+            stored = json.loads(index_file.read_text(encoding='utf-8'))
+            cached = stored.get("files") if stored.get("version") == self.INDEX_VERSION else None
+            if not isinstance(cached, dict):
+                cached = {}
+        except (OSError, ValueError, AttributeError):
+            cached = {}
+        
+        index: Dict[str, Dict] = {}
+        changed = False
+        
+        for entry in self.source_entries():
+            rel_path = os.path.relpath(entry.path, self.repo_root)
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                self.log(f"Error reading {entry.path}: {e}")
+                continue
+            
+            previous = cached.get(rel_path)
+            if (isinstance(previous, dict)
+                    and previous.get("mtime_ns") == stat.st_mtime_ns
+                    and previous.get("size") == stat.st_size):
+                index[rel_path] = previous
+                continue
+            
+            file_path = Path(entry.path)
+            try:
+                data = self.read_source(file_path)
+            except OSError as e:
+                self.log(f"Error reading {file_path}: {e}")
+                continue
+            stems = {
+                module_stem(match.group(1).decode('utf-8', 'replace'))
+                for match in IMPORT_RE.finditer(data)
+            }
+            index[rel_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "stems": sorted(stems),
+            }
+            changed = True
+        
+        if changed or index.keys() != cached.keys():
+            try:
+                index_file.parent.mkdir(parents=True, exist_ok=True)
+                index_file.write_text(
+                    json.dumps({"version": self.INDEX_VERSION, "files": index}),
+                    encoding='utf-8'
+                )
+            except OSError as e:
+                self.log(f"Could not write import index: {e}")
+        
+        imported_stems: Set[str] = set()
+        for record in index.values():
+            imported_stems.update(record["stems"])
+        return imported_stems
         
     def log(self, message: str):
         """Print message if verbose mode enabled"""
@@ -42,6 +290,7 @@ class DeadCodeDetector:
         self.log("Searching for commented-out code blocks...")
         
         commented_blocks = []
+        file_paths: List[Tuple[str, str]] = []
         
         # Search in apps/ directory
         search_dirs = [
@@ -50,132 +299,129 @@ class DeadCodeDetector:
         ]
         
         for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-                
-            for file_path in search_dir.rglob("*.ts*"):
-                # Skip test files and node_modules
-                if "node_modules" in str(file_path) or ".test." in str(file_path):
+            for entry in self.source_files_under(search_dir):
+                # Skip test files
+                if ".test." in entry.name:
                     continue
                 
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                    
-                    # Track consecutive commented lines
-                    comment_start = None
-                    consecutive_comments = []
-                    
-                    for i, line in enumerate(lines, 1):
-                        stripped = line.strip()
-                        
-                        # Check if line is a comment
-                        is_comment = (
-                            stripped.startswith('//') and not stripped.startswith('///')  # Not JSDoc
-                            or (stripped.startswith('/*') and not stripped.startswith('/**'))  # Not JSDoc block
-                        )
-                        
-                        # Check if it looks like code (has keywords, operators, etc.)
-                        looks_like_code = any(keyword in stripped for keyword in [
-                            'const ', 'let ', 'var ', 'function ', 'import ', 'export ',
-                            'if (', 'for (', 'while (', 'return ', '= ', '=> ', '.push(',
-                            '.map(', '.filter(', 'console.', 'logger.'
-                        ])
-                        
-                        if is_comment and looks_like_code:
-                            if comment_start is None:
-                                comment_start = i
-                            consecutive_comments.append(line.rstrip())
-                        else:
-                            # End of comment block
-                            if comment_start is not None and len(consecutive_comments) > 5:
-                                commented_blocks.append({
-                                    'file': str(file_path.relative_to(self.repo_root)),
-                                    'start_line': comment_start,
-                                    'end_line': i - 1,
-                                    'line_count': len(consecutive_comments),
-                                    'preview': '\n'.join(consecutive_comments[:3]) + '\n...'
-                                })
-                            comment_start = None
-                            consecutive_comments = []
-                    
-                    # Check last block
-                    if comment_start is not None and len(consecutive_comments) > 5:
-                        commented_blocks.append({
-                            'file': str(file_path.relative_to(self.repo_root)),
-                            'start_line': comment_start,
-                            'end_line': len(lines),
-                            'line_count': len(consecutive_comments),
-                            'preview': '\n'.join(consecutive_comments[:3]) + '\n...'
-                        })
-                        
-                except Exception as e:
-                    self.log(f"Error reading {file_path}: {e}")
+                file_paths.append((entry.path, os.path.relpath(entry.path, self.repo_root)))
+        
+        # Files are independent; scan them in worker processes when there
+        # are enough of them to outweigh the pool's startup cost
+        jobs = min(self.jobs, len(file_paths))
+        if jobs > 1 and len(file_paths) >= self.PARALLEL_MIN_FILES:
+            try:
+                executor = ProcessPoolExecutor(max_workers=jobs)
+            except (OSError, NotImplementedError):
+                executor = ThreadPoolExecutor(max_workers=jobs)
+            with executor:
+                results = list(executor.map(find_commented_blocks, *zip(*file_paths), chunksize=32))
+        else:
+            results = [find_commented_blocks(path, rel_path) for path, rel_path in file_paths]
+        
+        for (path, _), (blocks, error) in zip(file_paths, results):
+            if error:
+                self.log(f"Error reading {path}: {error}")
+            commented_blocks.extend(blocks)
         
         self.log(f"Found {len(commented_blocks)} large commented code blocks")
         return commented_blocks
     
+    def _unused_exports_command(self) -> List[str]:
+        """Resolve the ts-unused-exports command once per run
+        
+        Prefers a locally installed binary, which skips npx's package
+        resolution on every call.
+        """
+        if self._unused_exports_cmd is None:
+            search_path = os.pathsep.join([
+                str(self.repo_root / "node_modules" / ".bin"),
+                os.environ.get("PATH", ""),
+            ])
+            binary = shutil.which("ts-unused-exports", path=search_path)
+            if binary:
+                self._unused_exports_cmd = [binary]
+            else:
+                self._unused_exports_cmd = [shutil.which("npx") or "npx", "ts-unused-exports"]
+        return self._unused_exports_cmd
+    
+    def _source_fingerprint(self, project_dir: Path) -> List[int]:
+        """Count, total size and newest mtime of the TypeScript sources under project_dir"""
+        count = size = newest = 0
+        for entry in self.source_files_under(project_dir):
+            stat = entry.stat()
+            count += 1
+            size += stat.st_size
+            newest = max(newest, stat.st_mtime_ns)
+        return [count, size, newest]
+    
+    def _run_unused_exports(self, tsconfig: Path) -> Dict[str, List[str]]:
+        """Run ts-unused-exports for one tsconfig, reusing the cached result if nothing changed"""
+        cache_key = str(tsconfig.relative_to(self.repo_root))
+        key = [tsconfig.stat().st_mtime_ns, *self._source_fingerprint(tsconfig.parent)]
+        
+        cache_file = self.repo_root / self.CACHE_DIR / "unused-exports.json"
+        try:
+            cache = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            cache = {}
+        
+        entry = cache.get(cache_key)
+        if isinstance(entry, dict) and entry.get("key") == key:
+            self.log(f"Using cached unused exports for {cache_key}")
+            return entry["result"]
+        
+        result = subprocess.run(
+            [*self._unused_exports_command(), str(tsconfig), "--excludePathsFromReport=test"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        
+        unused_exports = {}
+        if result.returncode != 0 and result.stdout:
+            # Parse output
+            for line in result.stdout.strip().split('\n'):
+                if line.strip() and not line.startswith('Need to install'):
+                    match = UNUSED_EXPORT_RE.match(line)
+                    if match:
+                        file_path = match.group(1).strip()
+                        exports = match.group(2).strip()
+                        unused_exports[file_path] = exports.split(', ')
+        
+        # Only cache real answers: a clean run, or one that reported exports
+        # (a failed npx/tool start must not be remembered as "no unused exports")
+        if result.returncode == 0 or unused_exports:
+            cache[cache_key] = {"key": key, "result": unused_exports}
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(cache), encoding='utf-8')
+            except OSError as e:
+                self.log(f"Could not write unused exports cache: {e}")
+        
+        return unused_exports
+    
     def detect_unused_exports(self) -> Dict[str, List[str]]:
         """Detect unused exports using ts-unused-exports"""
         self.log("Detecting unused exports...")
         
         unused_exports = {}
         
-        # Check frontend
-        frontend_config = self.repo_root / "apps" / "web" / "tsconfig.json"
-        if frontend_config.exists():
-            try:
-                result = subprocess.run(
-                    ["npx", "ts-unused-exports", str(frontend_config), "--excludePathsFromReport=test"],
-                    cwd=self.repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode != 0 and result.stdout:
-                    # Parse output
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line.strip() and not line.startswith('Need to install'):
-                            match = re.match(r'(.+?):\s*(.+)', line)
-                            if match:
-                                file_path = match.group(1).strip()
-                                exports = match.group(2).strip()
-                                unused_exports[file_path] = exports.split(', ')
-                                
-            except subprocess.TimeoutExpired:
-                self.log("Frontend unused exports check timed out")
-            except Exception as e:
-                self.log(f"Error checking frontend exports: {e}")
+        projects = [
+            ("Frontend", self.repo_root / "apps" / "web" / "tsconfig.json"),
+            ("Backend", self.repo_root / "apps" / "simulation-api" / "tsconfig.json"),
+        ]
         
-        # Check backend
-        backend_config = self.repo_root / "apps" / "simulation-api" / "tsconfig.json"
-        if backend_config.exists():
+        for label, config in projects:
+            if not config.exists():
+                continue
             try:
-                result = subprocess.run(
-                    ["npx", "ts-unused-exports", str(backend_config), "--excludePathsFromReport=test"],
-                    cwd=self.repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode != 0 and result.stdout:
-                    # Parse output
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line.strip() and not line.startswith('Need to install'):
-                            match = re.match(r'(.+?):\s*(.+)', line)
-                            if match:
-                                file_path = match.group(1).strip()
-                                exports = match.group(2).strip()
-                                unused_exports[file_path] = exports.split(', ')
-                                
+                unused_exports.update(self._run_unused_exports(config))
             except subprocess.TimeoutExpired:
-                self.log("Backend unused exports check timed out")
+                self.log(f"{label} unused exports check timed out")
             except Exception as e:
-                self.log(f"Error checking backend exports: {e}")
+                self.log(f"Error checking {label.lower()} exports: {e}")
         
         self.log(f"Found {len(unused_exports)} files with unused exports")
         return unused_exports
@@ -192,12 +438,9 @@ class DeadCodeDetector:
             self.repo_root / "apps" / "simulation-api" / "src"
         ]
         
-        all_files: Set[Path] = set()
+        all_files: List[os.DirEntry] = []
         for search_dir in search_dirs:
-            if search_dir.exists():
-                for file_path in search_dir.rglob("*.ts*"):
-                    if "node_modules" not in str(file_path):
-                        all_files.add(file_path)
+            all_files.extend(self.source_files_under(search_dir))
         
         # Files that should be excluded from unused check
         exclude_patterns = [
@@ -211,46 +454,24 @@ class DeadCodeDetector:
             'ecosystem.config',  # Config files
         ]
         
-        for file_path in all_files:
-            file_name = file_path.name
+        # One pass over all sources instead of two `grep -r` runs per file
+        imported_stems = self.build_imported_stems()
+        
+        for entry in all_files:
+            file_name = entry.name
             
             # Skip excluded patterns
             if any(pattern in file_name for pattern in exclude_patterns):
                 continue
             
-            # Search for imports of this file
-            file_stem = file_path.stem
-            import_patterns = [
-                f"from ['\"].*{file_stem}",
-                f"import ['\"].*{file_stem}",
-            ]
-            
-            found_import = False
-            for pattern in import_patterns:
-                try:
-                    result = subprocess.run(
-                        ["grep", "-r", "-l", pattern, "apps/"],
-                        cwd=self.repo_root,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        # Filter out self-imports
-                        imports = [f for f in result.stdout.strip().split('\n') 
-                                 if f and str(file_path) not in f]
-                        if imports:
-                            found_import = True
-                            break
-                except:
-                    pass
+            found_import = os.path.splitext(file_name)[0] in imported_stems
             
             if not found_import:
-                # Get file size and age
-                stat = file_path.stat()
+                # Get file size and age (only for files being reported;
+                # DirEntry.stat() is free on Windows and cached afterwards)
+                stat = entry.stat()
                 unused_files.append({
-                    'file': str(file_path.relative_to(self.repo_root)),
+                    'file': os.path.relpath(entry.path, self.repo_root),
                     'size_bytes': stat.st_size,
                     'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d')
                 })
@@ -368,6 +589,12 @@ def main():
         type=Path,
         help='Output path for markdown report (default: docs/temp/DEAD_CODE_REPORT_<date>.md)',
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for scanning source files (default: CPU count)',
+    )
     
     args = parser.parse_args()
     
@@ -386,7 +613,7 @@ def main():
     print(f"=" * 60)
     
     try:
-        detector = DeadCodeDetector(repo_root, verbose=args.verbose)
+        detector = DeadCodeDetector(repo_root, verbose=args.verbose, jobs=args.jobs)
         report = detector.generate_report(args.output)
         
         # Print summary
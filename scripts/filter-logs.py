@@ -29,66 +29,343 @@ Usage:
 
     # Save results to file
     python scripts/filter-logs.py production level error --output errors.json
+
+    # Run several filters concurrently in one process
+    python scripts/filter-logs.py production --multi '[{"level": "error"}, {"source": "frontend"}]'
+
+    # Send several filters in one batch request (JSON file with a list of filters)
+    python scripts/filter-logs.py production --filters-file filters.json
 """
 
 import sys
 import json
+import time
 import argparse
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import HTTPError as Urllib3Error
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ Error: requests library not installed")
     print("Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Any, indent: bool = False) -> bytes:
+    """Encode JSON as UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Non-str keys are allowed to match json.dumps, which stringifies them
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 
 class LogFilter:
     """Filter logs using backend API."""
 
-    def __init__(self, api_url: str):
-        """Initialize with API base URL."""
+    # Color codes for levels
+    LEVEL_COLORS = {
+        "ERROR": "\033[91m",  # Red
+        "WARN": "\033[93m",   # Yellow
+        "INFO": "\033[92m",   # Green
+        "DEBUG": "\033[94m",  # Blue
+        "TRACE": "\033[90m"   # Gray
+    }
+    RESET = "\033[0m"
+    # Fields printed for every entry; --full prints the rest too
+    SUMMARY_FIELDS = frozenset({"level", "timestamp", "message", "source"})
+    # Entries formatted per stdout write
+    PRINT_BATCH = 256
+    # Streamed responses: NDJSON preferred, a plain JSON document accepted
+    NDJSON = "application/x-ndjson"
+    STREAM_ACCEPT = f"{NDJSON}, application/json;q=0.9"
+
+    def __init__(self, api_url: str, cache_ttl: float = 10.0):
+        """Initialize with API base URL.
+
+        Identical queries within cache_ttl seconds are answered from memory
+        (0 disables the cache).
+        """
         self.api_url = api_url
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, dict]] = {}
         self.filter_endpoint = f"{api_url}/api/logs/filter"
+        self.batch_endpoint = f"{api_url}/api/logs/filter/batch"
+
+        # One keep-alive session for all API calls, so only the first request
+        # pays for the TCP + TLS handshake; transient gateway errors are retried
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
     def filter_logs(
         self,
         filter_params: dict,
-        limit: int = 500
+        limit: int = 500,
+        fields: Optional[List[str]] = None
     ) -> Optional[dict]:
-        """Query logs with filters."""
-        params = {**filter_params, "limit": limit}
+        """Query logs with filters.
+
+        With fields, the API returns only those fields of each entry.
+        """
+        try:
+            print(f"🔍 Filtering logs...")
+            print(f"  API: {self.filter_endpoint}")
+            print(f"  Filters: {json.dumps(filter_params, indent=2)}")
+            print(f"  Limit: {limit}\n")
+
+            return self._query(filter_params, limit, fields)
 
+        except requests.exceptions.RequestException as e:
+            self._report_error(e)
+            return None
+
+    def filter_logs_stream(
+        self,
+        filter_params: dict,
+        limit: int = 500,
+        fields: Optional[List[str]] = None
+    ) -> Optional[dict]:
+        """Query logs with filters, parsing the response as it arrives.
+
+        "logs" in the returned dict is an iterator that parses entries off the
+        connection as they are consumed, so memory stays flat for large limits
+        and the first entry can be printed before the whole body has been
+        received. The API is asked for NDJSON (one entry per line, sent as
+        each match is found); a server that only answers with a JSON document
+        is read with ijson if installed, or all at once otherwise.
+
+        For an NDJSON response "count" is None until print_results has
+        consumed the entries.
+        """
         try:
             print(f"🔍 Filtering logs...")
             print(f"  API: {self.filter_endpoint}")
             print(f"  Filters: {json.dumps(filter_params, indent=2)}")
             print(f"  Limit: {limit}\n")
 
-            response = requests.get(
+            response = self.session.get(
                 self.filter_endpoint,
-                params=params,
-                timeout=30
+                params=self._params(filter_params, limit, fields),
+                headers={"Accept": self.STREAM_ACCEPT},
+                timeout=(5, 30),  # (connect, read)
+                stream=True
+            )
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith(self.NDJSON):
+                return {"count": None, "logs": self._ndjson_items(response)}
+            if ijson is None:
+                with response:
+                    return self._decode(response)
+
+        except requests.exceptions.RequestException as e:
+            self._report_error(e)
+            return None
+
+        # Undo any Content-Encoding while reading the raw stream
+        response.raw.decode_content = True
+        events = ijson.parse(response.raw, use_float=True)
+
+        # The API sends "count" ahead of "logs"; read up to the logs array
+        data: Dict[str, Any] = {}
+        for prefix, event, value in events:
+            if prefix == "count" and event == "number":
+                data["count"] = value
+            elif prefix == "logs" and event == "start_array":
+                break
+
+        data["logs"] = self._stream_items(response, events)
+        if "count" not in data:
+            data["logs"] = list(data["logs"])
+            data["count"] = len(data["logs"])
+        return data
+
+    @staticmethod
+    def _ndjson_items(response: "requests.Response") -> Iterator[dict]:
+        """Yield one log entry per non-empty line, then release the connection."""
+        try:
+            for line in response.iter_lines(chunk_size=64 * 1024):
+                if line:
+                    try:
+                        yield load_json(line)
+                    except ValueError as e:
+                        raise requests.exceptions.RequestException(f"Invalid JSON in response: {e}") from e
+        finally:
+            response.close()
+
+    @staticmethod
+    def _stream_items(response: "requests.Response", events: Iterator) -> Iterator[dict]:
+        """Yield log entries from the remaining parse events, then release the connection."""
+        try:
+            yield from ijson.items(events, "logs.item")
+        finally:
+            response.close()
+
+    def filter_many(
+        self,
+        filters: List[dict],
+        limit: int = 500,
+        fields: Optional[List[str]] = None
+    ) -> List[Optional[dict]]:
+        """Run several filter queries concurrently.
+
+        The queries share the session's connection pool, so N filters take
+        roughly one round trip instead of N. Results are returned in the
+        order of filters, None for a query that failed.
+        """
+        print(f"🔍 Filtering logs ({len(filters)} queries)...")
+        print(f"  API: {self.filter_endpoint}")
+        print(f"  Limit: {limit}\n")
+
+        if not filters:
+            return []
+
+        # Identical filters are sent once and share the result
+        keys = [json.dumps(f, sort_keys=True) for f in filters]
+        with ThreadPoolExecutor(max_workers=min(len(set(keys)), 8)) as executor:
+            futures = {}
+            for key, filter_params in zip(keys, filters):
+                if key not in futures:
+                    futures[key] = executor.submit(self._query, filter_params, limit, fields)
+
+        results: List[Optional[dict]] = []
+        for filter_params, key in zip(filters, keys):
+            try:
+                results.append(futures[key].result())
+            except requests.exceptions.RequestException as e:
+                print(f"  Filters: {json.dumps(filter_params)}")
+                self._report_error(e)
+                results.append(None)
+        return results
+
+    def filter_batch(
+        self,
+        filters: List[dict],
+        limit: int = 500,
+        fields: Optional[List[str]] = None
+    ) -> Optional[List[dict]]:
+        """Run several filter queries in one batch request.
+
+        The server answers all of them from a single scan of the log files.
+        Returns one result per filter (in order), or None if the request failed.
+        """
+        try:
+            print(f"🔍 Filtering logs ({len(filters)} queries, one batch request)...")
+            print(f"  API: {self.batch_endpoint}")
+            print(f"  Limit: {limit}\n")
+
+            body: Dict[str, Any] = {"queries": filters, "limit": limit}
+            if fields:
+                body["fields"] = fields
+
+            response = self.session.post(
+                self.batch_endpoint,
+                json=body,
+                timeout=(5, 30)  # (connect, read)
             )
 
             response.raise_for_status()
-            return response.json()
+            return self._decode(response).get("results", [])
 
-        except requests.exceptions.ConnectionError:
+        except requests.exceptions.RequestException as e:
+            self._report_error(e)
+            return None
+
+    @staticmethod
+    def _params(filter_params: dict, limit: int, fields: Optional[List[str]]) -> dict:
+        """Query string for the filter endpoint."""
+        params = {**filter_params, "limit": limit}
+        if fields:
+            params["fields"] = ",".join(fields)
+        return params
+
+    def _query(self, filter_params: dict, limit: int, fields: Optional[List[str]] = None) -> dict:
+        """GET the filter endpoint once; raises on request or HTTP errors.
+
+        Successful responses are memoized per (filters, limit, fields) for
+        cache_ttl seconds.
+        """
+        params = self._params(filter_params, limit, fields)
+        key = json.dumps(params, sort_keys=True)
+
+        if self.cache_ttl > 0:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+
+        response = self.session.get(
+            self.filter_endpoint,
+            params=params,
+            timeout=(5, 30)  # (connect, read)
+        )
+
+        response.raise_for_status()
+        data = self._decode(response)
+
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic(), data)
+        return data
+
+    @staticmethod
+    def _decode(response: "requests.Response") -> Any:
+        """Parse a JSON response body; a malformed body fails like any other request error."""
+        try:
+            return load_json(response.content)
+        except ValueError as e:
+            raise requests.exceptions.RequestException(f"Invalid JSON in response: {e}") from e
+
+    def _report_error(self, error: requests.exceptions.RequestException) -> None:
+        """Print why a filter query failed."""
+        if isinstance(error, requests.exceptions.ConnectionError):
             print(f"❌ Error: Could not connect to API at {self.api_url}")
             print("   Make sure the backend is running")
-            return None
-        except requests.exceptions.Timeout:
+        elif isinstance(error, requests.exceptions.Timeout):
             print("❌ Error: Request timed out")
-            return None
-        except requests.exceptions.HTTPError as e:
-            print(f"❌ HTTP Error: {e}")
-            print(f"   Response: {e.response.text if e.response else 'No response'}")
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error: {e}")
-            return None
+        elif isinstance(error, requests.exceptions.HTTPError):
+            print(f"❌ HTTP Error: {error}")
+            print(f"   Response: {error.response.text if error.response else 'No response'}")
+        else:
+            print(f"❌ Error: {error}")
 
     def print_results(self, data: dict, show_full: bool = False) -> None:
         """Print filtered log results."""
@@ -96,51 +373,70 @@ class LogFilter:
         logs = data.get("logs", [])
 
         print("=" * 80)
-        print(f"📊 Filter Results: {count} log(s) found")
+        if count is None:
+            # Streamed NDJSON: the total is only known once every entry is read
+            print("📊 Filter Results (streaming)")
+        else:
+            print(f"📊 Filter Results: {count} log(s) found")
         print("=" * 80)
 
         if count == 0:
             print("\nNo logs match the filter criteria")
             return
 
+        # No escape codes when the output is piped or redirected
+        colors = self.LEVEL_COLORS if sys.stdout.isatty() else {}
+        reset = self.RESET if colors else ""
+
+        # Entries are formatted into one buffer and written PRINT_BATCH at a
+        # time instead of several print() calls per entry
+        out: List[str] = []
+        i = 0
         for i, log in enumerate(logs, 1):
             level = log.get("level", "unknown").upper()
             timestamp = log.get("timestamp", "")
             message = log.get("message", "")
             source = log.get("source", "backend")
+            color = colors.get(level, "")
 
-            # Color codes for levels
-            level_colors = {
-                "ERROR": "\033[91m",  # Red
-                "WARN": "\033[93m",   # Yellow
-                "INFO": "\033[92m",   # Green
-                "DEBUG": "\033[94m",  # Blue
-                "TRACE": "\033[90m"   # Gray
-            }
-            reset = "\033[0m"
-            color = level_colors.get(level, "")
-
-            print(f"\n{i}. {color}[{level}]{reset} {timestamp}")
-            print(f"   Source: {source}")
-            print(f"   Message: {message}")
+            out.append(
+                f"\n{i}. {color}[{level}]{reset} {timestamp}\n"
+                f"   Source: {source}\n"
+                f"   Message: {message}\n"
+            )
 
             if show_full:
                 # Show additional fields
-                for key, value in log.items():
-                    if key not in ["level", "timestamp", "message", "source"]:
-                        print(f"   {key}: {value}")
-
-        print("\n" + "=" * 80)
+                out.extend(
+                    f"   {key}: {value}\n"
+                    for key, value in log.items()
+                    if key not in self.SUMMARY_FIELDS
+                )
+
+            if i % self.PRINT_BATCH == 0:
+                sys.stdout.write("".join(out))
+                out.clear()
+
+        if count is None:
+            count = data["count"] = i
+            if count == 0:
+                print("\nNo logs match the filter criteria")
+                return
+            out.append(f"\n📊 {count} log(s) found\n")
+
+        out.append("\n" + "=" * 80 + "\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def save_results(self, data: dict, output_file: str) -> None:
         """Save results to JSON file."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(dump_json(data, indent=True))
         print(f"\n💾 Results saved to: {output_file}")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Filter and search logs via backend API"
     )
@@ -151,13 +447,28 @@ def main():
     )
     parser.add_argument(
         "filter_type",
+        nargs="?",
         choices=["level", "source", "search", "session", "date"],
         help="Filter type"
     )
     parser.add_argument(
         "filter_value",
+        nargs="?",
         help="Filter value (e.g., 'error' for level, 'frontend' for source)"
     )
+    parser.add_argument(
+        "--multi",
+        type=str,
+        help="JSON list of filter objects to run concurrently, e.g. "
+             "'[{\"level\": \"error\"}, {\"source\": \"frontend\"}]' "
+             "(replaces filter_type/filter_value)"
+    )
+    parser.add_argument(
+        "--filters-file",
+        type=str,
+        help="JSON file with a list of filter objects, sent as one batch "
+             "request (replaces filter_type/filter_value)"
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -169,13 +480,40 @@ def main():
         type=str,
         help="Save results to JSON file"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API, even for a filter repeated within the last 10 seconds"
+    )
     parser.add_argument(
         "--full",
         action="store_true",
         help="Show all log fields (verbose output)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    multi_filters = None
+    if args.multi is not None and args.filters_file is not None:
+        parser.error("--multi and --filters-file cannot be combined")
+    if args.multi is not None:
+        try:
+            multi_filters = json.loads(args.multi)
+        except ValueError as e:
+            parser.error(f"--multi is not valid JSON: {e}")
+        if not isinstance(multi_filters, list) or not all(isinstance(f, dict) for f in multi_filters):
+            parser.error("--multi must be a JSON list of objects")
+    elif args.filters_file is not None:
+        try:
+            with open(args.filters_file, encoding='utf-8') as f:
+                multi_filters = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not read --filters-file: {e}")
+        if (not isinstance(multi_filters, list) or not multi_filters
+                or not all(isinstance(f, dict) for f in multi_filters)):
+            parser.error("--filters-file must contain a non-empty JSON list of objects")
+    elif args.filter_type is None or args.filter_value is None:
+        parser.error("filter_type and filter_value are required unless --multi or --filters-file is given")
 
     # Determine API URL
     if args.environment == "production":
@@ -199,7 +537,11 @@ def main():
         filter_params["startDate"] = args.filter_value
 
     # Create filter and execute
-    log_filter = LogFilter(api_url)
+    log_filter = LogFilter(api_url, cache_ttl=0 if args.no_cache else 10.0)
+
+    if multi_filters is not None:
+        run_multi(log_filter, args, multi_filters, batch=args.filters_file is not None)
+        return
 
     print("=" * 80)
     print("🔍 Log Filter")
@@ -210,19 +552,90 @@ def main():
     print(f"  Result Limit: {args.limit}")
     print("=" * 80 + "\n")
 
-    data = log_filter.filter_logs(filter_params, args.limit)
-
-    if data:
-        log_filter.print_results(data, show_full=args.full)
-
+    # A streamed body is read from urllib3 directly, so its errors are not
+    # wrapped in requests exceptions
+    stream_errors = (requests.exceptions.RequestException, Urllib3Error) + ((ijson.JSONError,) if ijson else ())
+    try:
         if args.output:
-            log_filter.save_results(data, args.output)
+            data = log_filter.filter_logs(filter_params, args.limit)
+        else:
+            # Nothing to save: print entries as they are parsed off the wire
+            data = log_filter.filter_logs_stream(filter_params, args.limit, summary_fields(args))
+
+        if data:
+            log_filter.print_results(data, show_full=args.full)
+
+            if args.output:
+                log_filter.save_results(data, args.output)
+    except stream_errors as e:
+        print(f"\n❌ Error while reading results: {e}")
+        data = None
+    finally:
+        log_filter.close()
 
+    if data:
         print(f"\n✅ Filter complete: {data.get('count', 0)} result(s)")
     else:
         print("\n❌ Filter failed")
         sys.exit(1)
 
 
+def summary_fields(args: argparse.Namespace) -> Optional[List[str]]:
+    """Entry fields to request from the API: only the printed ones, unless
+    --full or --output needs every field."""
+    if args.full or args.output:
+        return None
+    return sorted(LogFilter.SUMMARY_FIELDS)
+
+
+def run_multi(
+    log_filter: LogFilter,
+    args: argparse.Namespace,
+    filters: List[dict],
+    batch: bool = False
+) -> None:
+    """Run several queries (concurrently, or as one batch request) and print each result."""
+    print("=" * 80)
+    print("🔍 Log Filter")
+    print("=" * 80)
+    print(f"  Environment: {args.environment}")
+    print(f"  Queries: {len(filters)}")
+    print(f"  Result Limit: {args.limit}")
+    print("=" * 80 + "\n")
+
+    try:
+        if batch:
+            # Queries the server did not answer count as failed
+            results = list(log_filter.filter_batch(filters, args.limit, summary_fields(args)) or [])
+            results += [None] * (len(filters) - len(results))
+        else:
+            results = log_filter.filter_many(filters, args.limit, summary_fields(args))
+    finally:
+        log_filter.close()
+
+    for i, (filter_params, data) in enumerate(zip(filters, results), 1):
+        print(f"\n▶ Query {i}: {json.dumps(filter_params)}")
+        if data:
+            log_filter.print_results(data, show_full=args.full)
+        else:
+            print("❌ Filter failed")
+
+    if args.output:
+        log_filter.save_results(
+            {"queries": [
+                {"query": filter_params, "result": data}
+                for filter_params, data in zip(filters, results)
+            ]},
+            args.output
+        )
+
+    succeeded = [data for data in results if data]
+    total = sum(data.get("count", 0) for data in succeeded)
+    if len(succeeded) < len(results):
+        print(f"\n❌ {len(results) - len(succeeded)} of {len(results)} filter(s) failed")
+        sys.exit(1)
+    print(f"\n✅ Filter complete: {total} result(s) across {len(results)} queries")
+
+
 if __name__ == "__main__":
     main()
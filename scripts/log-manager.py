@@ -24,6 +24,8 @@ Actions:
     status                             Show logging system status
     help                               Show this help
 
+    --daemon                           Serve later runs from one warm process
+
 Examples:
     python scripts/log-manager.py status
     python scripts/log-manager.py capture-execution production backend
@@ -33,43 +35,191 @@ Examples:
     python scripts/log-manager.py view production backend
 """
 
+import io
+import os
 import sys
+import json
+import time
+import signal
+import socket
+import tempfile
+import contextlib
+import socketserver
+import functools
+import threading
 import subprocess
+import importlib.util
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import ModuleType
+from typing import Optional
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+
+@functools.lru_cache(maxsize=32)
+def _read_env_lines(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Lines of an env file, read once per (path, mtime, size) in this process."""
+    with open(path) as f:
+        return tuple(f)
 
 
 class LogManager:
     """Unified log management CLI."""
 
+    # Seconds a cached remote status result stays valid
+    SSH_CACHE_TTL = 5.0
+
     def __init__(self):
         """Initialize log manager."""
         self.scripts_dir = Path("scripts")
         self.server = "ubuntu@54.242.131.12"
+        # Scripts already loaded in this process, by file name
+        self._modules: dict[str, ModuleType] = {}
+        # command -> (time it ran, (stdout, stderr, exit code))
+        self._ssh_cache: dict[str, tuple[float, tuple[str, str, int]]] = {}
+
+        # SSH calls share one multiplexed connection (OpenSSH ControlMaster).
+        # The socket lives in ~/.ssh and persists for 5 minutes, so later
+        # log-manager runs (status, view, ...) skip the handshake as well.
+        # The Windows OpenSSH client does not support it.
+        self.ssh_options = ["-o", "StrictHostKeyChecking=no"]
+        self.control_path: Optional[str] = None
+        self._master_checked = False
+        if os.name != "nt":
+            ssh_dir = Path.home() / ".ssh"
+            self.control_path = str(ssh_dir / "terrainsim-%C")
+            self.ssh_options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self.control_path}",
+                "-o", "ControlPersist=300",
+            ]
+
+    def _ensure_master(self) -> None:
+        """Start the shared SSH master connection unless one is already running."""
+        if self.control_path is None or self._master_checked:
+            return
+        self._master_checked = True
+
+        control = ["-o", f"ControlPath={self.control_path}"]
+        check = subprocess.run(
+            ["ssh", *control, "-O", "check", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if check.returncode == 0:
+            return
+
+        # -f -N: authenticate, then keep the master in the background. Started
+        # explicitly (with no pipes attached) so that a captured ssh call
+        # never waits on a backgrounded master holding its stdout open.
+        try:
+            Path(self.control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        subprocess.run(
+            ["ssh", *self.ssh_options, "-f", "-N", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _load_script(self, script_path: Path) -> ModuleType:
+        """Import a script (hyphenated file name) as a module, once per run."""
+        module = self._modules.get(script_path.name)
+        if module is None:
+            module_name = "terrainsim_" + script_path.stem.replace("-", "_")
+            spec = importlib.util.spec_from_file_location(module_name, script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._modules[script_path.name] = module
+        return module
 
     def run_script(self, script_name: str, args: list) -> int:
-        """Run a Python script with arguments."""
+        """Run a Python script with arguments.
+
+        The script is imported and its main(argv) called in this interpreter,
+        instead of starting a new Python process (and re-importing requests
+        etc.) for every action.
+        """
         script_path = self.scripts_dir / script_name
 
         if not script_path.exists():
             print(f"❌ Error: Script not found: {script_path}")
             return 1
 
-        result = subprocess.run(
-            [sys.executable, str(script_path)] + args,
-            text=True
-        )
-        return result.returncode
+        # Usage and error messages from argparse name the script, not log-manager
+        saved_argv = sys.argv
+        sys.argv = [str(script_path)] + args
+        try:
+            self._load_script(script_path).main(args)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception as e:
+            print(f"❌ Error running {script_name}: {e}")
+            return 1
+        finally:
+            sys.argv = saved_argv
+        return 0
 
     def run_ssh_command(self, command: str) -> tuple[str, str, int]:
         """Execute command on remote server via SSH."""
+        self._ensure_master()
         result = subprocess.run(
-            ["ssh", "-o", "StrictHostKeyChecking=no", self.server, command],
+            ["ssh", *self.ssh_options, self.server, command],
             capture_output=True,
             text=True
         )
         return result.stdout, result.stderr, result.returncode
 
+    def stream_ssh_command(self, command: str, cache: bool = False) -> tuple[bool, str, int]:
+        """Execute command on remote server via SSH, printing its output as it arrives.
+
+        Returns (whether anything was printed, stderr, exit code). stderr goes
+        to a temporary file so a chatty stderr cannot block the stdout reader.
+        With cache, a successful result is replayed for SSH_CACHE_TTL seconds
+        instead of running the command again (repeated status under --daemon).
+        """
+        if cache:
+            cached = self._ssh_cache.get(command)
+            if cached is not None and time.monotonic() - cached[0] < self.SSH_CACHE_TTL:
+                output, stderr, code = cached[1]
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                return bool(output), stderr, code
+
+        self._ensure_master()
+        started = time.monotonic()
+        output = []
+        with tempfile.TemporaryFile() as err:
+            with subprocess.Popen(
+                ["ssh", *self.ssh_options, self.server, command],
+                stdout=subprocess.PIPE,
+                stderr=err,
+                text=True,
+                encoding="utf-8",
+                errors="replace"
+            ) as proc:
+                for line in proc.stdout:
+                    sys.stdout.write(line)
+                    output.append(line)
+            sys.stdout.flush()
+            err.seek(0)
+            stderr = err.read().decode("utf-8", "replace")
+
+        if cache and proc.returncode == 0:
+            self._ssh_cache[command] = (started, ("".join(output), stderr, proc.returncode))
+        return bool(output), stderr, proc.returncode
+
     def capture_deployment_logs(self, deployment_type: str) -> None:
         """Capture deployment logs from GitHub Actions or direct."""
         print(f"📥 Capturing {deployment_type} deployment logs...\n")
@@ -108,6 +258,12 @@ class LogManager:
             print(f"❌ Unknown component: {component}")
             print("   Valid components: backend, frontend")
 
+    def _clean_logs_action(self, environment: str, component: str, days: Optional[str] = None) -> None:
+        """CLI form of clean_logs: days as text, defaulting per component."""
+        if days is None:
+            days = 14 if component == "backend" else 3
+        self.clean_logs(environment, component, int(days))
+
     def set_log_level(self, environment: str, component: str, level: str) -> None:
         """Set log level."""
         print(f"📊 Setting {component} log level to '{level}' on {environment}...\n")
@@ -136,7 +292,8 @@ class LogManager:
                 print(f"❌ Unknown component: {component}")
                 return
 
-            subprocess.run(["ssh", "-o", "StrictHostKeyChecking=no", self.server, cmd])
+            self._ensure_master()
+            subprocess.run(["ssh", *self.ssh_options, self.server, cmd])
 
         else:  # local
             if component == "backend":
@@ -153,13 +310,102 @@ class LogManager:
 
             if component == "frontend":
                 # Filter for frontend logs
-                subprocess.run(
-                    ["powershell", "-Command",
-                     f"Get-Content {log_file} -Wait | Where-Object {{ $_ -match '\"source\":\"frontend\"' }}"],
-                    shell=True
-                )
+                self._tail_local(Path(log_file), '"source":"frontend"')
             else:
-                subprocess.run(["powershell", "-Command", f"Get-Content {log_file} -Wait"], shell=True)
+                self._tail_local(Path(log_file))
+
+    @staticmethod
+    def _tail_local(path: Path, filter_substr: Optional[str] = None, initial_lines: int = 10) -> None:
+        """Follow a local log file like `tail -f`, optionally keeping only lines containing filter_substr.
+
+        Prints the last initial_lines lines, then each new line as it is
+        appended. With watchdog installed, new data is picked up on
+        file-system change events; otherwise the file is polled.
+        """
+        needle = filter_substr.encode("utf-8") if filter_substr else None
+
+        def emit(lines: list[bytes]) -> None:
+            out = [line.decode("utf-8", "replace") + "\n" for line in lines if needle is None or needle in line]
+            if out:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
+
+        changed = threading.Event()
+        observer = None
+        if Observer is not None:
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    changed.set()
+
+            observer = Observer()
+            observer.schedule(_Handler(), str(path.parent), recursive=False)
+            observer.start()
+
+        try:
+            with open(path, "rb") as f:
+                # Start from the last few lines, like tail -f
+                end = f.seek(0, os.SEEK_END)
+                f.seek(max(0, end - 64 * 1024))
+                tail = f.read().split(b"\n")
+                pending = tail.pop()
+                emit(tail[-initial_lines:] if initial_lines else [])
+
+                while True:
+                    chunk = f.read()
+                    if chunk:
+                        lines = (pending + chunk).split(b"\n")
+                        pending = lines.pop()
+                        emit(lines)
+                    elif observer is not None:
+                        # Wake on the next change event (the timeout is only a safety net)
+                        changed.wait(1.0)
+                        changed.clear()
+                    else:
+                        time.sleep(0.5)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+    @staticmethod
+    def _walk_sizes(root: Path, suffix: str = "", recursive: bool = True) -> tuple[int, int]:
+        """Count files under root (optionally only names ending in suffix) and total their size.
+
+        One os.scandir pass per directory: file types come from the directory
+        listing and each counted file is stat'ed once. Symlinked directories
+        are not descended into.
+        """
+        count = 0
+        total_size = 0
+        stack = [root]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file():
+                            total_size += entry.stat().st_size
+                            count += 1
+                    except OSError:
+                        # Removed (or unreadable) while walking
+                        continue
+        return count, total_size
+
+    @staticmethod
+    def _env_settings(env_file: Path, prefix: str) -> Optional[list[str]]:
+        """Stripped lines of env_file that start with prefix, or None if it does not exist."""
+        try:
+            stat = env_file.stat()
+        except OSError:
+            return None
+        lines = _read_env_lines(str(env_file), stat.st_mtime_ns, stat.st_size)
+        return [line.strip() for line in lines if line.startswith(prefix)]
 
     def show_status(self) -> None:
         """Show logging system status."""
@@ -167,9 +413,36 @@ class LogManager:
         print("📊 TerrainSim Logging System Status")
         print("=" * 70)
 
-        # Backend Production
-        print("\n🔧 Backend (Production):")
-        status_script = '''
+        local_log_dir = Path("apps/simulation-api/logs")
+        env_file = Path("apps/simulation-api/.env.development")
+        frontend_envs = [
+            ("Production", Path("apps/web/.env.production")),
+            ("Development", Path("apps/web/.env.development")),
+        ]
+        captured_dir = Path("logs/captured")
+
+        # The local sections (env files, log directory walks) are gathered in
+        # worker threads while the production status streams over SSH below
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            backend_settings = pool.submit(self._env_settings, env_file, "LOG_LEVEL")
+            local_sizes = None
+            if local_log_dir.exists():
+                local_sizes = pool.submit(self._walk_sizes, local_log_dir, ".log", False)
+            frontend_settings = [
+                (label, pool.submit(self._env_settings, env, "VITE_LOG"))
+                for label, env in frontend_envs
+            ]
+            captured_sizes = None
+            if captured_dir.exists():
+                captured_sizes = [
+                    (subdir, pool.submit(self._walk_sizes, captured_dir / subdir))
+                    for subdir in ["backend", "frontend", "deployments"]
+                    if (captured_dir / subdir).exists()
+                ]
+
+            # Backend Production
+            print("\n🔧 Backend (Production):")
+            status_script = '''
 echo "  Server: 54.242.131.12"
 echo "  Log Directory: /var/log/terrainsim"
 if [ -f /var/www/terrainsim/.env ]; then
@@ -181,31 +454,26 @@ if [ -d /var/log/terrainsim ]; then
     ls -lht /var/log/terrainsim/*.log 2>/dev/null | head -3 | awk '{print "    " $9 " - " $5}'
 fi
 '''
-        stdout, stderr, code = self.run_ssh_command(status_script)
-        if stdout:
-            print(stdout)
-        elif code != 0:
-            print(f"  ⚠️  Could not connect to production server")
+            printed, stderr, code = self.stream_ssh_command(status_script, cache=True)
+            if printed:
+                print()
+            elif code != 0:
+                print(f"  ⚠️  Could not connect to production server")
 
         # Backend Local
         print("🔧 Backend (Local):")
-        local_log_dir = Path("apps/simulation-api/logs")
-        env_file = Path("apps/simulation-api/.env.development")
-
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.startswith("LOG_LEVEL"):
-                        print(f"  {line.strip()}")
+        settings = backend_settings.result()
+        if settings is not None:
+            for line in settings:
+                print(f"  {line}")
         else:
             print("  Log Level: not configured")
 
-        if local_log_dir.exists():
-            log_files = list(local_log_dir.glob("*.log"))
-            if log_files:
-                total_size = sum(f.stat().st_size for f in log_files)
+        if local_sizes is not None:
+            file_count, total_size = local_sizes.result()
+            if file_count:
                 print(f"  Log Directory: {local_log_dir}")
-                print(f"  Log Files: {len(log_files)}")
+                print(f"  Log Files: {file_count}")
                 print(f"  Total Size: {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
             else:
                 print("  No log files found")
@@ -214,35 +482,20 @@ fi
 
         # Frontend
         print("\n🌐 Frontend:")
-        prod_env = Path("apps/web/.env.production")
-        dev_env = Path("apps/web/.env.development")
-
-        if prod_env.exists():
-            print("  Production:")
-            with open(prod_env) as f:
-                for line in f:
-                    if line.startswith("VITE_LOG"):
-                        print(f"    {line.strip()}")
-
-        if dev_env.exists():
-            print("  Development:")
-            with open(dev_env) as f:
-                for line in f:
-                    if line.startswith("VITE_LOG"):
-                        print(f"    {line.strip()}")
+        for label, future in frontend_settings:
+            settings = future.result()
+            if settings is not None:
+                print(f"  {label}:")
+                for line in settings:
+                    print(f"    {line}")
 
         # Captured Logs
         print("\n📦 Captured Logs:")
-        captured_dir = Path("logs/captured")
-        if captured_dir.exists():
-            for subdir in ["backend", "frontend", "deployments"]:
-                subpath = captured_dir / subdir
-                if subpath.exists():
-                    files = list(subpath.rglob("*"))
-                    files = [f for f in files if f.is_file()]
-                    if files:
-                        total_size = sum(f.stat().st_size for f in files)
-                        print(f"  {subdir}: {len(files)} file(s), {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
+        if captured_sizes is not None:
+            for subdir, future in captured_sizes:
+                file_count, total_size = future.result()
+                if file_count:
+                    print(f"  {subdir}: {file_count} file(s), {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
         else:
             print("  No captured logs directory")
 
@@ -295,6 +548,10 @@ Actions:
   help
       Show this help message
 
+  --daemon
+      Keep one log manager process running in the background; later
+      runs (except view) are handed to it instead of starting up again
+
 ═══════════════════════════════════════════════════════════════════════
 
 Examples:
@@ -327,80 +584,189 @@ Examples:
 """)
 
 
-def main():
-    """Main entry point."""
-    if len(sys.argv) < 2:
+# action -> (LogManager method, required args, accepted args, missing-args message)
+ACTIONS: dict[str, tuple[str, int, int, str]] = {
+    "capture-deployment": ("capture_deployment_logs", 1, 1, "Missing deployment type"),
+    "capture-execution": ("capture_execution_logs", 2, 2, "Missing environment or component"),
+    "clean": ("_clean_logs_action", 2, 3, "Missing environment or component"),
+    "set-level": ("set_log_level", 3, 3, "Missing environment, component, or level"),
+    "filter": ("filter_logs", 3, 3, "Missing environment, type, or value"),
+    "view": ("view_logs", 2, 2, "Missing environment or component"),
+    "status": ("show_status", 0, 0, ""),
+    "help": ("show_help", 0, 0, ""),
+}
+
+USAGE = {
+    "capture-deployment": "capture-deployment <type>",
+    "capture-execution": "capture-execution <env> <component>",
+    "clean": "clean <env> <component> [days]",
+    "set-level": "set-level <env> <component> <level>",
+    "filter": "filter <env> <type> <value>",
+    "view": "view <env> <component>",
+}
+
+
+# Actions that always run in the calling process: view follows a log until
+# interrupted, which a daemon cannot be told about
+LOCAL_ACTIONS = {"view"}
+
+DAEMON_SOCKET = Path.home() / ".terrainsim" / "logmgr.sock"
+
+
+def dispatch(argv: list[str], manager: Optional[LogManager] = None) -> int:
+    """Run one log-manager action and return its exit code."""
+    if not argv:
+        (manager or LogManager()).show_help()
+        return 0
+
+    action = argv[0]
+    args = argv[1:]
+
+    spec = ACTIONS.get(action)
+    if spec is None:
+        print(f"❌ Unknown action: {action}")
+        print("Run 'python scripts/log-manager.py help' for usage information")
+        return 1
+
+    method_name, required, accepted, missing = spec
+    if len(args) < required:
+        print(f"❌ Error: {missing}")
+        print(f"Usage: python scripts/log-manager.py {USAGE[action]}")
+        return 1
+
+    if manager is None:
         manager = LogManager()
-        manager.show_help()
-        sys.exit(0)
-
-    action = sys.argv[1]
-    args = sys.argv[2:]
-
-    manager = LogManager()
 
     try:
-        if action == "capture-deployment":
-            if len(args) < 1:
-                print("❌ Error: Missing deployment type")
-                print("Usage: python scripts/log-manager.py capture-deployment <type>")
-                sys.exit(1)
-            manager.capture_deployment_logs(args[0])
-
-        elif action == "capture-execution":
-            if len(args) < 2:
-                print("❌ Error: Missing environment or component")
-                print("Usage: python scripts/log-manager.py capture-execution <env> <component>")
-                sys.exit(1)
-            manager.capture_execution_logs(args[0], args[1])
-
-        elif action == "clean":
-            if len(args) < 2:
-                print("❌ Error: Missing environment or component")
-                print("Usage: python scripts/log-manager.py clean <env> <component> [days]")
-                sys.exit(1)
-            days = int(args[2]) if len(args) > 2 else (14 if args[1] == "backend" else 3)
-            manager.clean_logs(args[0], args[1], days)
-
-        elif action == "set-level":
-            if len(args) < 3:
-                print("❌ Error: Missing environment, component, or level")
-                print("Usage: python scripts/log-manager.py set-level <env> <component> <level>")
-                sys.exit(1)
-            manager.set_log_level(args[0], args[1], args[2])
-
-        elif action == "filter":
-            if len(args) < 3:
-                print("❌ Error: Missing environment, type, or value")
-                print("Usage: python scripts/log-manager.py filter <env> <type> <value>")
-                sys.exit(1)
-            manager.filter_logs(args[0], args[1], args[2])
-
-        elif action == "view":
-            if len(args) < 2:
-                print("❌ Error: Missing environment or component")
-                print("Usage: python scripts/log-manager.py view <env> <component>")
-                sys.exit(1)
-            manager.view_logs(args[0], args[1])
-
-        elif action == "status":
-            manager.show_status()
-
-        elif action == "help":
-            manager.show_help()
-
-        else:
-            print(f"❌ Unknown action: {action}")
-            print("Run 'python scripts/log-manager.py help' for usage information")
-            sys.exit(1)
+        getattr(manager, method_name)(*args[:accepted])
 
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")
-        sys.exit(0)
     except Exception as e:
         print(f"\n❌ Error: {e}")
+        return 1
+    return 0
+
+
+class _ClientStream(io.TextIOBase):
+    """Text stream that forwards everything written to a daemon client."""
+
+    def __init__(self, wfile, tty: bool):
+        self.wfile = wfile
+        self.tty = tty
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.tty
+
+    def write(self, text: str) -> int:
+        if text:
+            self.wfile.write(json.dumps({"out": text}).encode() + b"\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+
+def serve_daemon(socket_path: Path = DAEMON_SOCKET) -> None:
+    """Serve log-manager actions over a Unix socket from one warm interpreter.
+
+    Each request is one JSON line {"argv", "cwd", "tty", "env"}; the reply is
+    a stream of {"out": text} lines followed by {"exit": code}. The action
+    runs with the client's environment (API tokens, SSH_AUTH_SOCK, ...) in
+    place of the daemon's. Requests are handled one at a time, with one
+    LogManager (and its loaded scripts) shared between them.
+    """
+    if not hasattr(socketserver, "UnixStreamServer"):
+        print("❌ Daemon mode needs Unix domain sockets")
         sys.exit(1)
 
+    manager = LogManager()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            stream = _ClientStream(self.wfile, bool(request.get("tty")))
+            saved_environ = dict(os.environ)
+            try:
+                os.chdir(request["cwd"])
+                os.environ.clear()
+                os.environ.update(request["env"])
+                with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                    code = dispatch(request["argv"], manager)
+                self.wfile.write(json.dumps({"exit": code}).encode() + b"\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                os.environ.clear()
+                os.environ.update(saved_environ)
+
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # A socket left behind by a daemon that did not shut down cleanly
+    socket_path.unlink(missing_ok=True)
+    with socketserver.UnixStreamServer(str(socket_path), Handler) as server:
+        print(f"🚀 Log manager daemon listening on {socket_path}")
+        # Stop on SIGTERM (kill) the same way as on Ctrl+C, removing the socket
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def forward_to_daemon(argv: list[str], socket_path: Path = DAEMON_SOCKET) -> Optional[int]:
+    """Run an action in the daemon, if one is listening; None when there is none."""
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return None
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "tty": sys.stdout.isatty(),
+            "env": dict(os.environ),
+        }
+        sock.sendall(json.dumps(request).encode() + b"\n")
+
+        for line in sock.makefile("rb"):
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            sys.stdout.write(message["out"])
+            sys.stdout.flush()
+
+    # The daemon went away mid-action
+    print("\n❌ Error: log manager daemon closed the connection")
+    return 1
+
+
+def main():
+    """Main entry point.
+
+    With --daemon, serve actions over DAEMON_SOCKET instead; later runs
+    forward their action to that daemon when it is up.
+    """
+    argv = sys.argv[1:]
+
+    if argv[:1] == ["--daemon"]:
+        serve_daemon()
+        return
+
+    if argv and argv[0] not in LOCAL_ACTIONS:
+        code = forward_to_daemon(argv)
+        if code is not None:
+            sys.exit(code)
+
+    sys.exit(dispatch(argv))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Batched remote commands for the production test scripts
+
+Runs several shell commands in a single SSH session and splits the output
+back into (stdout, stderr, exit code) per command. Used by test-production.py
+and test-production-ssh.py.
+"""
+
+import re
+import subprocess
+
+# One section of the batched output: the command's stdout between the BEGIN
+# and END markers (the END marker carries its exit code), then its stderr
+SECTION_PATTERN = re.compile(
+    r'^---BEGIN:(\w+)---\n(.*?)\n---END:\1:(\d+)---\n(.*?)(?=^---BEGIN:|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+
+
+def build_script(commands):
+    """Bash script running each command of {name: command}, framed with marker lines
+
+    Each command gets /dev/null as stdin, so none can read the rest of the
+    script. Its stdout and stderr are kept apart (stderr is captured through fd 3).
+    """
+    return ''.join(
+        f"""echo '---BEGIN:{name}---'
+{{ err=$( {{ {command}; }} </dev/null 2>&1 1>&3 ); }} 3>&1
+code=$?
+echo
+echo "---END:{name}:$code---"
+[ -n "$err" ] && printf '%s\\n' "$err"
+"""
+        for name, command in commands.items()
+    )
+
+
+def run_batched(ssh_command, commands, timeout):
+    """Run {name: command} in one SSH session, returning (stdout, stderr, code) by name
+
+    ssh_command is the ssh invocation without the remote command. The script
+    is sent to 'bash -s' as bytes: in text mode Python would write its line
+    endings as os.linesep, and bash on the server fails on CRLF lines.
+    """
+    try:
+        result = subprocess.run(
+            [*ssh_command, 'bash -s'],
+            input=build_script(commands).encode(),
+            capture_output=True,
+            timeout=timeout
+        )
+        stdout = result.stdout.decode(errors='replace')
+        stderr = result.stderr.decode(errors='replace')
+        code = result.returncode
+    except subprocess.TimeoutExpired:
+        stdout, stderr, code = '', 'Command timed out', 1
+    except Exception as e:
+        stdout, stderr, code = '', str(e), 1
+
+    results = {
+        match.group(1): (match.group(2), match.group(4), int(match.group(3)))
+        for match in SECTION_PATTERN.finditer(stdout)
+    }
+    # Commands that never ran (e.g. the connection failed) get the ssh error
+    for name in commands:
+        results.setdefault(name, ('', stderr or 'Remote command did not run', code or 1))
+    return results
@@ -13,15 +13,26 @@ Usage:
     python scripts/run-ci-locally.py --steps 1,2        # Run specific steps
     python scripts/run-ci-locally.py --skip-backend     # Skip backend tests
     python scripts/run-ci-locally.py --verbose          # Show detailed output
+    python scripts/run-ci-locally.py --no-parallel      # Run every step one after another
+    python scripts/run-ci-locally.py --no-cache         # Re-run steps whose inputs are unchanged
 """
 
 import argparse
+import hashlib
+import io
+import json
 import os
 import platform
+import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
 
 
 class Colors:
@@ -44,13 +55,77 @@ class Colors:
         )
 
 
+class ThreadOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr while steps run in the background
+
+    Writes from a thread that has a buffer registered go to that buffer;
+    everything else goes to the original stream.
+    """
+
+    def __init__(self, stream, buffers: Dict[int, io.StringIO]):
+        self._stream = stream
+        self._buffers = buffers
+
+    def write(self, text: str) -> int:
+        return self._buffers.get(threading.get_ident(), self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 class CIRunner:
     """Runs CI steps locally to mimic GitHub Actions behavior"""
 
-    def __init__(self, workspace_root: Path, verbose: bool = False):
+    # Steps that can run in the background while earlier steps run: they share
+    # nothing with the pnpm steps (the C++ build only touches libs/core/build)
+    BACKGROUND_STEPS = (3,)
+
+    # Tools each step needs on PATH, checked once before any step runs
+    REQUIRED_TOOLS = {
+        1: ('pnpm',),
+        2: ('pnpm',),
+        3: ('cmake', 'ctest'),
+        4: ('pnpm',),
+    }
+
+    # Where passing steps record the hash of their inputs (under the workspace root)
+    CACHE_DIR = Path('.cache') / 'ci'
+    # Directories never hashed as step inputs: dependencies and build output
+    CACHE_SKIP_DIRS = frozenset({'node_modules', 'dist', 'build', '.cache', 'test-results', 'playwright-report'})
+    # Inputs of the cached steps, relative to the workspace root
+    FRONTEND_INPUTS = ('apps/web', 'package.json', 'pnpm-lock.yaml', 'pnpm-workspace.yaml')
+    BACKEND_INPUTS = ('libs/core',)
+    # BASE_PATH of the production web build (GitHub Pages project path)
+    BUILD_BASE_PATH = '/TerrainSim'
+    # Lines of a command's output kept to show when it fails
+    OUTPUT_TAIL_LINES = 200
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        verbose: bool = False,
+        parallel: bool = True,
+        use_cache: bool = True
+    ):
         self.workspace_root = workspace_root
         self.verbose = verbose
+        # Skip steps whose inputs are unchanged since they last passed
+        self.use_cache = use_cache
+        # Live output (--verbose) cannot be held back, so it forces serial runs
+        self.parallel = parallel and not verbose
         self.colors_enabled = Colors.is_supported()
+        # Per-thread output buffers of steps running in the background
+        self._buffers: Dict[int, io.StringIO] = {}
+        # Set when a step fails, so background steps stop at their next command
+        self._abort = threading.Event()
+        # Command name -> its full path, or None if it is not on PATH
+        self._command_cache: Dict[str, Optional[str]] = {}
+        # Set once `pnpm install` has run in this session
+        self._dependencies_installed = False
 
     def _colorize(self, text: str, color: str) -> str:
         """Apply color to text if colors are enabled"""
@@ -92,64 +167,190 @@ class CIRunner:
             env: Environment variables to pass to the command
 
         Returns:
-            CompletedProcess instance
+            CompletedProcess instance (stdout holds at most the last
+            OUTPUT_TAIL_LINES lines of combined output; None with --verbose)
         """
         if cwd is None:
             cwd = self.workspace_root
 
+        if self._abort.is_set():
+            raise subprocess.CalledProcessError(-1, command)
+
         if self.verbose:
             cmd_str = ' '.join(command)
             print(self._colorize(f"Running: {cmd_str}", Colors.GRAY))
             print(self._colorize(f"Working directory: {cwd}", Colors.GRAY))
 
-        # On Windows, use shell=True for better command resolution
-        use_shell = platform.system() == 'Windows'
+        # Windows only finds .exe files by bare name (pnpm is pnpm.cmd), so
+        # resolve the full path through PATHEXT rather than going through cmd.exe
+        if platform.system() == 'Windows':
+            command = [self._which(command[0]) or command[0], *command[1:]]
 
-        try:
-            result = subprocess.run(
+        if self.verbose:
+            # Output goes straight to the terminal
+            return subprocess.run(
                 command,
                 cwd=cwd,
-                capture_output=not self.verbose,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
                 check=check,
-                shell=use_shell,
                 env=env
             )
-            return result
-        except subprocess.CalledProcessError as e:
-            if not self.verbose and e.stdout:
-                print(e.stdout)
-            if not self.verbose and e.stderr:
-                print(e.stderr, file=sys.stderr)
-            raise
+
+        # Read the combined output as it is produced, keeping only the last
+        # OUTPUT_TAIL_LINES lines to show on failure, instead of holding the
+        # whole (possibly very long) build log in memory
+        tail: Deque[str] = deque(maxlen=self.OUTPUT_TAIL_LINES)
+        line_count = 0
+        with subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=env
+        ) as process:
+            for line in process.stdout:
+                tail.append(line)
+                line_count += 1
+
+        output = ''.join(tail)
+        if check and process.returncode != 0:
+            if line_count > len(tail):
+                print(self._colorize(f"... (last {len(tail)} of {line_count} lines of output)", Colors.GRAY))
+            if output:
+                print(output)
+            raise subprocess.CalledProcessError(process.returncode, command, output=output)
+        return subprocess.CompletedProcess(command, process.returncode, stdout=output)
+
+    def _which(self, command: str) -> Optional[str]:
+        """Full path of a command on PATH, or None (looked up once per run)"""
+        if command not in self._command_cache:
+            # shutil.which honours PATHEXT on Windows (pnpm.cmd, cmake.exe, ...)
+            self._command_cache[command] = shutil.which(command)
+        return self._command_cache[command]
 
     def _check_command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
+        return self._which(command) is not None
+
+    def _inputs_hash(self, inputs: Tuple[str, ...], extra: str = '') -> str:
+        """
+        Hash the contents of the given files and directory trees
+
+        Directories are walked with os.scandir, skipping CACHE_SKIP_DIRS and
+        dot-directories; files are hashed in path order, together with their
+        relative paths, so renames and deletions change the hash too.
+        """
+        files = []
+        for name in inputs:
+            path = self.workspace_root / name
+            if path.is_file():
+                files.append(name)
+                continue
+            stack = [path]
+            while stack:
+                try:
+                    it = os.scandir(stack.pop())
+                except OSError:
+                    continue
+                with it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.CACHE_SKIP_DIRS and not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(os.path.relpath(entry.path, self.workspace_root).replace(os.sep, '/'))
+
+        digest = hashlib.blake2b(extra.encode())
+        for rel_path in sorted(files):
+            digest.update(b'\0' + rel_path.encode() + b'\0')
+            with open(self.workspace_root / rel_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def _cache_file(self, name: str) -> Path:
+        return self.workspace_root / self.CACHE_DIR / f'{name}.json'
+
+    def _cached_entry(self, name: str, inputs_hash: str) -> Optional[dict]:
+        """The cache entry of step `name` if it last passed with exactly these inputs"""
+        if not self.use_cache:
+            return None
         try:
-            # On Windows, try both .cmd and .exe extensions
-            if platform.system() == 'Windows':
-                # Try with shell=True to let Windows find the right executable
-                subprocess.run(
-                    f'{command} --version',
-                    capture_output=True,
-                    check=True,
-                    shell=True,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-            else:
-                subprocess.run(
-                    [command, '--version'],
-                    capture_output=True,
-                    check=True,
-                    encoding='utf-8',
-                    errors='replace'
-                )
+            with open(self._cache_file(name), encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('input_hash') != inputs_hash or cached.get('status') != 'ok':
+            return None
+        return cached
+
+    def _record_pass(self, name: str, inputs_hash: str, **extra: str):
+        """Remember that step `name` passed with these inputs"""
+        cache_file = self._cache_file(name)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'input_hash': inputs_hash, 'status': 'ok', **extra}, f)
+        except OSError:
+            pass
+
+    def _workspace_manifests(self) -> List[str]:
+        """Root and workspace package.json files, from the globs in pnpm-workspace.yaml"""
+        manifests = ['package.json']
+        try:
+            lines = (self.workspace_root / 'pnpm-workspace.yaml').read_text(encoding='utf-8').splitlines()
+        except OSError:
+            return manifests
+        for line in lines:
+            line = line.strip()
+            if not line.startswith('- '):
+                continue
+            pattern = line[2:].strip().strip('\'"')
+            if pattern.startswith('!'):
+                continue
+            manifests.extend(
+                os.path.relpath(path, self.workspace_root).replace(os.sep, '/')
+                for path in self.workspace_root.glob(f'{pattern.rstrip("/")}/package.json')
+            )
+        return manifests
+
+    def _install_stamp(self) -> Optional[str]:
+        """Hash of everything `pnpm install` depends on, or None if there is nothing installed
+
+        Covers pnpm-lock.yaml, pnpm-workspace.yaml and every workspace
+        package.json (a dependency added without updating the lockfile still
+        needs an install), plus the (mtime_ns, size) of node_modules/.modules.yaml,
+        which pnpm rewrites on every install.
+        """
+        if not (self.workspace_root / 'pnpm-lock.yaml').is_file():
+            return None
+        try:
+            modules_stat = (self.workspace_root / 'node_modules' / '.modules.yaml').stat()
+        except OSError:
+            return None
+        return self._inputs_hash(
+            ('pnpm-lock.yaml', 'pnpm-workspace.yaml', *self._workspace_manifests()),
+            extra=f'{modules_stat.st_mtime_ns}:{modules_stat.st_size}'
+        )
+
+    def _dependencies_current(self) -> bool:
+        """Whether `pnpm install` can be skipped: already run this session, or
+        none of its inputs changed since the last install"""
+        if self._dependencies_installed:
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        install_stamp = self._install_stamp()
+        if install_stamp is None:
             return False
+        return self._cached_entry('pnpm-install', install_stamp) is not None
+
+    def _record_install(self):
+        """Remember a successful `pnpm install` (which may itself update the lockfile)"""
+        self._dependencies_installed = True
+        install_stamp = self._install_stamp()
+        if install_stamp is not None:
+            self._record_pass('pnpm-install', install_stamp)
 
     def step_test_frontend(self) -> bool:
         """
@@ -159,22 +360,37 @@ class CIRunner:
         """
         self._print_step(1, 5, "Test Frontend")
 
-        try:
-            # Check if pnpm is installed
-            if not self._check_command_exists('pnpm'):
-                self._print_error("pnpm is not installed. Please install it first.")
-                return False
-
-            # TypeScript type checking
-            print("Running TypeScript type check...")
-            self._run_command(['pnpm', '--filter', '@terrain/web', 'run', 'typecheck'])
-            self._print_success("TypeScript type check passed")
-
-            # Run Vitest
-            print("\nRunning Vitest unit tests...")
-            self._run_command(['pnpm', '--filter', '@terrain/web', 'run', 'test'])
-            self._print_success("Frontend tests passed")
+        inputs_hash = self._inputs_hash(self.FRONTEND_INPUTS)
+        if self._cached_entry('test-frontend', inputs_hash):
+            self._print_success("Frontend tests passed (cached: no input changed since the last passing run)")
+            return True
 
+        try:
+            test_command = ['pnpm', '--filter', '@terrain/web', 'run', 'test']
+            if not self.verbose:
+                # Only the tail of the output is ever shown (on failure), so
+                # skip the per-test report; the dot reporter still ends with
+                # the failure details
+                test_command.append('--reporter=dot')
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Vitest does not depend on the type check, so it runs
+                # alongside it; its output is held back until its turn
+                tests = self._start_command(executor, test_command) if self.parallel else None
+
+                # TypeScript type checking
+                print("Running TypeScript type check...")
+                self._run_command(['pnpm', '--filter', '@terrain/web', 'run', 'typecheck'])
+                self._print_success("TypeScript type check passed")
+
+                # Run Vitest
+                print("\nRunning Vitest unit tests...")
+                if tests is not None:
+                    self._finish_command(tests)
+                else:
+                    self._run_command(test_command)
+                self._print_success("Frontend tests passed")
+
+            self._record_pass('test-frontend', inputs_hash)
             return True
 
         except subprocess.CalledProcessError:
@@ -190,11 +406,6 @@ class CIRunner:
         self._print_step(2, 5, "Test E2E & Visual Regression")
 
         try:
-            # Check if pnpm is installed
-            if not self._check_command_exists('pnpm'):
-                self._print_error("pnpm is not installed. Please install it first.")
-                return False
-
             # Run E2E tests (excluding slow visual tests)
             print("Running E2E tests...")
             self._run_command(['pnpm', 'exec', 'playwright', 'test', 'e2e/terrain.spec.ts'])
@@ -220,42 +431,63 @@ class CIRunner:
         """
         self._print_step(3, 5, "Test Backend (C++ Core)")
 
-        try:
-            # Check if CMake is installed
-            if not self._check_command_exists('cmake'):
-                self._print_error("CMake is not installed. Please install it first.")
-                return False
+        inputs_hash = self._inputs_hash(self.BACKEND_INPUTS)
+        if self._cached_entry('test-backend', inputs_hash):
+            self._print_success("Backend tests passed (cached: no input changed since the last passing run)")
+            return True
 
+        try:
             core_dir = self.workspace_root / 'libs' / 'core'
             build_dir = core_dir / 'build'
 
             # Configure CMake
             print("Configuring CMake...")
-            self._run_command([
+            configure_command = [
                 'cmake',
                 '-S', str(core_dir),
                 '-B', str(build_dir),
                 '-DCMAKE_BUILD_TYPE=Release'
-            ])
+            ]
+            # Ninja and ccache, where installed (not on Windows, where Ninja
+            # needs a Visual Studio developer prompt to find the compiler).
+            # An existing build directory keeps its generator: CMake refuses
+            # to switch generators in place.
+            if platform.system() != 'Windows':
+                if self._check_command_exists('ninja') and not (build_dir / 'CMakeCache.txt').exists():
+                    configure_command += ['-G', 'Ninja']
+                if self._check_command_exists('ccache'):
+                    configure_command += [
+                        '-DCMAKE_C_COMPILER_LAUNCHER=ccache',
+                        '-DCMAKE_CXX_COMPILER_LAUNCHER=ccache'
+                    ]
+            self._run_command(configure_command)
             self._print_success("CMake configuration successful")
 
+            # Build and test on every core, unless the job count is already
+            # set through CMake's own environment variables
+            jobs = str(os.cpu_count() or 2)
+
             # Build C++ core
             print("\nBuilding C++ core library...")
-            self._run_command([
+            build_command = [
                 'cmake',
                 '--build', str(build_dir),
                 '--config', 'Release'
-            ])
+            ]
+            if 'CMAKE_BUILD_PARALLEL_LEVEL' not in os.environ:
+                build_command += ['--parallel', jobs]
+            self._run_command(build_command)
             self._print_success("C++ build successful")
 
             # Run CTest
             print("\nRunning C++ tests...")
-            self._run_command(
-                ['ctest', '--output-on-failure', '-C', 'Release'],
-                cwd=build_dir
-            )
+            test_command = ['ctest', '--output-on-failure', '-C', 'Release']
+            if 'CTEST_PARALLEL_LEVEL' not in os.environ:
+                test_command += ['--parallel', jobs]
+            self._run_command(test_command, cwd=build_dir)
             self._print_success("Backend tests passed")
 
+            self._record_pass('test-backend', inputs_hash)
             return True
 
         except subprocess.CalledProcessError:
@@ -270,21 +502,30 @@ class CIRunner:
         """
         self._print_step(3, 4, "Build Web App")
 
-        try:
-            # Check if pnpm is installed
-            if not self._check_command_exists('pnpm'):
-                self._print_error("pnpm is not installed. Please install it first.")
-                return False
+        # The build is reused only if dist/ is still the output it produced
+        # (a manual build with another BASE_PATH would replace it)
+        dist_dir = self.workspace_root / 'apps' / 'web' / 'dist'
+        inputs_hash = self._inputs_hash(self.FRONTEND_INPUTS, extra=f'BASE_PATH={self.BUILD_BASE_PATH}')
+        cached = self._cached_entry('build', inputs_hash)
+        if cached and dist_dir.exists() and cached.get('output_hash') == self._inputs_hash(('apps/web/dist',)):
+            self._print_success("Web app build successful (cached: no input changed since the last build)")
+            print(f"Build output: {dist_dir}")
+            return True
 
+        try:
             # Install dependencies (if needed)
             print("Ensuring dependencies are installed...")
-            self._run_command(['pnpm', 'install'])
-            self._print_success("Dependencies installed")
+            if self._dependencies_current():
+                self._print_success("Dependencies up to date (pnpm-lock.yaml unchanged since the last install)")
+            else:
+                self._run_command(['pnpm', 'install', '--prefer-offline'])
+                self._record_install()
+                self._print_success("Dependencies installed")
 
             # Build web app
             print("\nBuilding web app for production...")
             build_env = os.environ.copy()
-            build_env['BASE_PATH'] = '/TerrainSim'
+            build_env['BASE_PATH'] = self.BUILD_BASE_PATH
 
             self._run_command(
                 ['pnpm', '--filter', '@terrain/web', 'run', 'build'],
@@ -293,18 +534,42 @@ class CIRunner:
             self._print_success("Web app build successful")
 
             # Check if dist directory was created
-            dist_dir = self.workspace_root / 'apps' / 'web' / 'dist'
             if not dist_dir.exists():
                 self._print_error(f"Build output directory not found: {dist_dir}")
                 return False
 
             print(f"Build output: {dist_dir}")
+            self._record_pass('build', inputs_hash, output_hash=self._inputs_hash(('apps/web/dist',)))
             return True
 
         except subprocess.CalledProcessError:
             self._print_error("Build failed!")
             return False
 
+    @staticmethod
+    def _dist_files(dist_dir: Path) -> Tuple[List[Tuple[Tuple[str, ...], int]], bool]:
+        """
+        List the files under dist_dir as (relative path parts, size)
+
+        One os.scandir pass per directory: file types come from the directory
+        entries and each file is stat'ed once. Also returns whether dist_dir
+        has no entries at all.
+        """
+        files = []
+        empty = True
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(str(dist_dir), ())]
+        while stack:
+            path, parts = stack.pop()
+            with os.scandir(path) as it:
+                for entry in it:
+                    empty = False
+                    entry_parts = parts + (entry.name,)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, entry_parts))
+                    elif entry.is_file():
+                        files.append((entry_parts, entry.stat().st_size))
+        return files, empty
+
     def step_deploy_check(self) -> bool:
         """
         Step 5: Deploy Check (Deploy workflow - dry run)
@@ -324,16 +589,18 @@ class CIRunner:
 
             # List contents
             print("Build artifacts ready for deployment:")
-            files = list(dist_dir.rglob('*'))
-            if files:
-                for file in sorted(files):
-                    if file.is_file():
-                        rel_path = file.relative_to(dist_dir)
-                        size = file.stat().st_size
-                        print(f"  - {rel_path} ({size:,} bytes)")
-            else:
+            files, empty = self._dist_files(dist_dir)
+            if empty:
                 self._print_error("No files found in dist directory")
                 return False
+            total_size = sum(size for _, size in files)
+            # The full listing only with --verbose, written in one go
+            if self.verbose:
+                sys.stdout.write(''.join(
+                    f"  - {os.path.join(*rel_parts)} ({size:,} bytes)\n"
+                    for rel_parts, size in sorted(files)
+                ))
+            print(f"  {len(files)} file(s), {total_size:,} bytes ({total_size / (1024*1024):.2f} MB)")
 
             self._print_success("Deploy check passed")
             print(self._colorize(
@@ -347,6 +614,33 @@ class CIRunner:
             self._print_error(f"Deploy check failed: {e}")
             return False
 
+    def _run_buffered(self, func: Callable[[], T]) -> Tuple[T, str]:
+        """Run a step (or command) in this background thread, returning its result and output"""
+        buffer = io.StringIO()
+        self._buffers[threading.get_ident()] = buffer
+        try:
+            return func(), buffer.getvalue()
+        finally:
+            del self._buffers[threading.get_ident()]
+
+    def _start_command(self, executor: ThreadPoolExecutor, command: List[str]) -> Future:
+        """Start a command on executor; _finish_command prints its output and raises on failure"""
+        def run() -> Optional[subprocess.CalledProcessError]:
+            try:
+                self._run_command(command)
+            except subprocess.CalledProcessError as e:
+                return e
+            return None
+
+        return executor.submit(self._run_buffered, run)
+
+    def _finish_command(self, future: Future):
+        """Wait for a command started with _start_command, as if it had run here"""
+        error, output = future.result()
+        sys.stdout.write(output)
+        if error is not None:
+            raise error
+
     def run_all_steps(self, steps: Optional[List[int]] = None, skip_backend: bool = False) -> bool:
         """
         Run all CI steps or specific steps
@@ -379,21 +673,61 @@ class CIRunner:
             steps_to_run.remove(3)
             print(self._colorize("⚠️  Skipping backend tests (--skip-backend)\n", Colors.YELLOW))
 
-        # Run steps
-        results = {}
-        for step_num in steps_to_run:
-            if step_num not in step_functions:
-                print(self._colorize(f"Invalid step number: {step_num}", Colors.RED))
-                continue
-
-            step_name, step_func = step_functions[step_num]
-            success = step_func()
-            results[step_num] = success
+        # Fail before any (long) step runs if a tool needed later is missing
+        missing = sorted({
+            tool
+            for step_num in steps_to_run
+            for tool in self.REQUIRED_TOOLS.get(step_num, ())
+            if not self._check_command_exists(tool)
+        })
+        if missing:
+            self._print_error(f"Required tool(s) not installed: {', '.join(missing)}. Please install them first.")
+            return False
 
-            if not success:
-                print(f"\n{self._colorize('=== ❌ CI checks failed! ===', Colors.RED)}")
-                print(self._colorize(f"Step {step_num} ({step_name}) failed.", Colors.RED))
-                return False
+        # Steps run in order, except that background steps that do not come
+        # first are started right away; their output is buffered and printed
+        # at their place in the sequence, so the log reads as a serial run
+        background_steps = []
+        if self.parallel:
+            background_steps = [
+                step_num for step_num in steps_to_run[1:]
+                if step_num in self.BACKGROUND_STEPS and step_num in step_functions
+            ]
+
+        saved_streams = sys.stdout, sys.stderr
+        sys.stdout = ThreadOutput(sys.stdout, self._buffers)
+        sys.stderr = ThreadOutput(sys.stderr, self._buffers)
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(background_steps), 1)) as executor:
+                futures = {
+                    step_num: executor.submit(self._run_buffered, step_functions[step_num][1])
+                    for step_num in background_steps
+                }
+
+                # Run steps
+                results = {}
+                for step_num in steps_to_run:
+                    if step_num not in step_functions:
+                        print(self._colorize(f"Invalid step number: {step_num}", Colors.RED))
+                        continue
+
+                    step_name, step_func = step_functions[step_num]
+                    if step_num in futures:
+                        success, output = futures[step_num].result()
+                        sys.stdout.write(output)
+                    else:
+                        success = step_func()
+                    results[step_num] = success
+
+                    if not success:
+                        # Leaving the executor waits for background steps,
+                        # which stop before their next command
+                        self._abort.set()
+                        print(f"\n{self._colorize('=== ❌ CI checks failed! ===', Colors.RED)}")
+                        print(self._colorize(f"Step {step_num} ({step_name}) failed.", Colors.RED))
+                        return False
+        finally:
+            sys.stdout, sys.stderr = saved_streams
 
         # All steps passed
         print(f"\n{self._colorize('=== ✨ All CI checks passed! ===', Colors.GREEN + Colors.BOLD)}")
@@ -412,6 +746,8 @@ Examples:
   python scripts/run-ci-locally.py --steps 1,2        # Run steps 1 and 2 only
   python scripts/run-ci-locally.py --skip-backend     # Skip C++ backend tests
   python scripts/run-ci-locally.py --verbose          # Show detailed output
+  python scripts/run-ci-locally.py --no-parallel      # Run every step one after another
+  python scripts/run-ci-locally.py --no-cache         # Re-run steps whose inputs are unchanged
 
 Steps:
   1. Test Frontend    - TypeScript check + Vitest
@@ -437,7 +773,21 @@ Steps:
     parser.add_argument(
         '--verbose',
         action='store_true',
-        help='Show detailed command output'
+        help='Show detailed command output and every deploy artifact'
+    )
+
+    parser.add_argument(
+        '--no-parallel',
+        action='store_true',
+        help='Run every step one after another (by default the C++ backend '
+             'tests run alongside the frontend steps; --verbose implies this)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Run every step (and pnpm install) even if its inputs are '
+             'unchanged since it last passed (results are kept in .cache/ci/)'
     )
 
     args = parser.parse_args()
@@ -464,7 +814,12 @@ Steps:
             sys.exit(1)
 
     # Create runner and execute
-    runner = CIRunner(workspace_root, verbose=args.verbose)
+    runner = CIRunner(
+        workspace_root,
+        verbose=args.verbose,
+        parallel=not args.no_parallel,
+        use_cache=not args.no_cache
+    )
     success = runner.run_all_steps(steps=steps, skip_backend=args.skip_backend)
 
     sys.exit(0 if success else 1)
@@ -19,31 +19,89 @@ Usage:
     python scripts/set-log-level.py production backend debug --no-restart
 """
 
+import os
 import sys
+import shutil
 import subprocess
-import re
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 class LogLevelManager:
     """Manage log level configuration."""
 
+    # Separates the update output from the PM2 restart errors in the combined SSH script
+    RESTART_MARKER = "---RESTART---"
+
     def __init__(self, server: str = "ubuntu@54.242.131.12"):
         """Initialize with server connection info."""
         self.server = server
         self.valid_levels = ["trace", "debug", "info", "warn", "error"]
 
+        # Same multiplexed connection as log-manager.py (OpenSSH ControlMaster,
+        # socket in ~/.ssh, kept for 5 minutes), so repeated log level changes
+        # while debugging skip the SSH handshake. The Windows OpenSSH client
+        # does not support it.
+        self.ssh_options = ["-o", "StrictHostKeyChecking=no"]
+        self.control_path: Optional[str] = None
+        if os.name != "nt":
+            self.control_path = str(Path.home() / ".ssh" / "terrainsim-%C")
+            self.ssh_options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self.control_path}",
+                "-o", "ControlPersist=300",
+            ]
+
+    def _ensure_master(self) -> None:
+        """Start the shared SSH master connection unless one is already running."""
+        if self.control_path is None:
+            return
+
+        check = subprocess.run(
+            ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if check.returncode == 0:
+            return
+
+        # -f -N: authenticate, then keep the master in the background. Started
+        # with no pipes attached, so the captured ssh call below never waits
+        # on a backgrounded master holding its stdout open.
+        try:
+            Path(self.control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+        subprocess.run(
+            ["ssh", *self.ssh_options, "-f", "-N", self.server],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
     def run_ssh_command(self, command: str) -> tuple[str, str, int]:
         """Execute command on remote server via SSH."""
+        self._ensure_master()
         result = subprocess.run(
-            ["ssh", "-o", "StrictHostKeyChecking=no", self.server, command],
+            ["ssh", *self.ssh_options, self.server, command],
             capture_output=True,
             text=True
         )
         return result.stdout, result.stderr, result.returncode
 
+    @staticmethod
+    def env_value_is(file_path: Path, key: str, value: str) -> bool:
+        """Check whether every "KEY=" line in a .env file already sets value."""
+        if not file_path.exists():
+            return False
+
+        prefix = f'{key}='
+        with open(file_path, 'r', encoding='utf-8') as f:
+            values = {line[len(prefix):].rstrip('\r\n') for line in f if line.startswith(prefix)}
+        return values == {value}
+
     def update_env_file(
         self,
         file_path: Path,
@@ -59,22 +117,39 @@ class LogLevelManager:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Update or add the key
-        pattern = rf'^{re.escape(key)}=.*$'
+        # Update or add the key: every line starting with "KEY=" is replaced
+        prefix = f'{key}='
         replacement = f'{key}={value}'
 
-        if re.search(pattern, content, re.MULTILINE):
+        lines = content.split('\n')
+        found = False
+        for i, line in enumerate(lines):
+            if line.startswith(prefix):
+                lines[i] = replacement
+                found = True
+
+        if found:
             # Update existing
-            new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+            new_content = '\n'.join(lines)
             action = "Updated"
         else:
             # Add new
             new_content = content.rstrip() + f'\n{replacement}\n'
             action = "Added"
 
-        # Write back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        # Write to a temporary file next to it and rename it over the original,
+        # so an interrupted write never leaves a truncated .env behind
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         print(f"  ✅ {action} {key}={value} in {file_path}")
         return True
@@ -93,39 +168,58 @@ class LogLevelManager:
             update_script = f'''
 cd /var/www/terrainsim
 
-echo "📝 Current LOG_LEVEL:"
-grep LOG_LEVEL .env || echo "  (not set)"
-
-echo ""
-echo "📝 Updating LOG_LEVEL to {log_level}..."
-sed -i 's/^LOG_LEVEL=.*/LOG_LEVEL={log_level}/' .env
-
-# Add if doesn't exist
-if ! grep -q "^LOG_LEVEL=" .env; then
-    echo "LOG_LEVEL={log_level}" >> .env
+# .env is only rewritten when the level differs. The restart (if any) runs
+# either way: the process may not match .env after a --no-restart run or a
+# runtime change through POST /admin/log-level.
+if [ "$(grep '^LOG_LEVEL=' .env)" = "LOG_LEVEL={log_level}" ]; then
+    echo "📝 LOG_LEVEL is already {log_level}; .env left unchanged"
+else
+    echo "📝 Current LOG_LEVEL:"
+    grep LOG_LEVEL .env || echo "  (not set)"
+
+    echo ""
+    echo "📝 Updating LOG_LEVEL to {log_level}..."
+    sed -i 's/^LOG_LEVEL=.*/LOG_LEVEL={log_level}/' .env
+
+    # Add if doesn't exist
+    if ! grep -q "^LOG_LEVEL=" .env; then
+        echo "LOG_LEVEL={log_level}" >> .env
+    fi
+
+    echo "  ✅ Updated LOG_LEVEL={log_level}"
+
+    echo ""
+    echo "📝 New LOG_LEVEL:"
+    grep LOG_LEVEL .env
 fi
+'''
 
-echo "  ✅ Updated LOG_LEVEL={log_level}"
-
-echo ""
-echo "📝 New LOG_LEVEL:"
-grep LOG_LEVEL .env
+            # The PM2 restart runs in the same SSH session, after a marker
+            # line; its stderr is sent after the marker, so only it is
+            # reported if the restart fails
+            if restart:
+                update_script = f'''{{
+{update_script}
+}} || exit $?
+echo "{self.RESTART_MARKER}"
+restart_error=$({{ cd /var/www/terrainsim && pm2 restart terrainsim-api; }} 2>&1 >/dev/null)
+restart_code=$?
+[ -n "$restart_error" ] && printf '%s\n' "$restart_error"
+exit $restart_code
 '''
 
             stdout, stderr, code = self.run_ssh_command(update_script)
+            update_output, marker, restart_error = stdout.partition(f"{self.RESTART_MARKER}\n")
 
-            if code == 0:
-                print(stdout)
+            if marker or code == 0:
+                print(update_output)
 
                 if restart:
                     print("\n🔄 Restarting PM2...")
-                    restart_cmd = "cd /var/www/terrainsim && pm2 restart terrainsim-api"
-                    stdout, stderr, code = self.run_ssh_command(restart_cmd)
-
                     if code == 0:
                         print("  ✅ PM2 restarted successfully")
                     else:
-                        print(f"  ❌ Error restarting PM2: {stderr}")
+                        print(f"  ❌ Error restarting PM2: {restart_error}")
                 else:
                     print("\n⚠️  Backend not restarted. Restart manually to apply changes:")
                     print("   ssh ubuntu@54.242.131.12 'cd /var/www/terrainsim && pm2 restart terrainsim-api'")
@@ -139,7 +233,15 @@ grep LOG_LEVEL .env
             if not env_file.exists():
                 env_file = Path("apps/simulation-api/.env.development")
 
-            if self.update_env_file(env_file, "LOG_LEVEL", log_level):
+            # The file is left alone when it already has the level, but the
+            # running backend may not (e.g. changed through POST /admin/log-level)
+            if self.env_value_is(env_file, "LOG_LEVEL", log_level):
+                print(f"  ✅ LOG_LEVEL is already '{log_level}' in {env_file}; file left unchanged")
+                updated = True
+            else:
+                updated = self.update_env_file(env_file, "LOG_LEVEL", log_level)
+
+            if updated:
                 if restart:
                     print("\n⚠️  Local backend needs manual restart to apply changes")
                     print("   Run: pnpm --filter simulation-api dev")
@@ -167,8 +269,8 @@ grep LOG_LEVEL .env
                 print("   Restart dev server: pnpm --filter web dev")
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point (argv defaults to sys.argv[1:])."""
     parser = argparse.ArgumentParser(
         description="Set log level for backend or frontend"
     )
@@ -193,7 +295,7 @@ def main():
         help="Don't restart service after updating (backend only)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     manager = LogLevelManager()
 
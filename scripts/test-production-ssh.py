@@ -6,10 +6,17 @@ This test script validates the Winston logging deployment by testing endpoints
 directly on the production server via SSH, bypassing any external DNS/proxy issues.
 """
 
-import subprocess
+import shlex
 import json
 import sys
 
+from remote_batch import run_batched
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 SSH_KEY = r"C:\Users\l-cruz\.ssh\terrainsim-key.pem"
 SERVER = "ubuntu@54.242.131.12"
@@ -22,28 +29,62 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
-def run_ssh_command(command):
-    """Execute a command on the remote server via SSH"""
-    try:
-        result = subprocess.run(
-            ['ssh', '-i', SSH_KEY, SERVER, command],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.stdout, result.stderr, result.returncode
-    except subprocess.TimeoutExpired:
-        return '', 'Timeout', 1
-    except Exception as e:
-        return '', str(e), 1
-
-def curl_json(endpoint):
-    """Make a curl request and parse JSON response"""
-    stdout, stderr, code = run_ssh_command(f"curl -s {API_URL}{endpoint}")
+# No escape codes when the output is not a terminal (CI logs, files)
+if not sys.stdout.isatty():
+    GREEN = RED = YELLOW = BLUE = RESET = ''
+
+PASS_MARK = f"{GREEN}✓{RESET}"
+FAIL_MARK = f"{RED}✗{RESET}"
+
+FRONTEND_LOG_PAYLOAD = json.dumps({
+    'logs': [{
+        'level': 'info',
+        'message': 'Test log from production test suite',
+        'source': 'frontend',
+        'component': 'test-suite',
+        'sessionId': 'test-session-123',
+        'context': {'test': True, 'timestamp': '2026-01-23T14:00:00Z'}
+    }]
+})
+
+# Remote commands of all tests, in test order. They run in a single SSH
+# session (see run_remote_checks) and the tests read their results. Request
+# bodies are shell-quoted once, here, so any JSON content is passed as is.
+REMOTE_COMMANDS = {
+    'health': f"curl -s {API_URL}/health",
+    'log_level': f"curl -s {API_URL}/admin/log-level",
+    'set_debug': f"curl -s -X POST {API_URL}/admin/log-level -H 'Content-Type: application/json' -d {shlex.quote(json.dumps({'level': 'debug'}))}",
+    'reset_info': f"curl -s -X POST {API_URL}/admin/log-level -H 'Content-Type: application/json' -d {shlex.quote(json.dumps({'level': 'info'}))}",
+    'stats': f"curl -s {API_URL}/api/logs/stats",
+    'filter': f"curl -s '{API_URL}/api/logs/filter?level=info&limit=3'",
+    'frontend': f"curl -s -X POST {API_URL}/api/logs/frontend -H 'Content-Type: application/json' -d {shlex.quote(FRONTEND_LOG_PAYLOAD)}",
+    'log_files': "ls -lh /var/log/terrainsim/*.log",
+    'pm2': "pm2 jlist",
+}
+
+# Keys GET /admin/log-level must return
+LOG_LEVEL_KEYS = frozenset({'currentLevel', 'environment', 'logDir', 'fileLoggingEnabled', 'consoleLoggingEnabled'})
+
+# (stdout, stderr, exit code) of each remote command, filled in by main()
+REMOTE_RESULTS = {}
+
+def load_json(data):
+    """Decode JSON, using orjson when it is installed (its decode errors are json.JSONDecodeError too)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def run_remote_checks():
+    """Run all REMOTE_COMMANDS in one SSH session, returning (stdout, stderr, code) by name"""
+    return run_batched(['ssh', '-i', SSH_KEY, SERVER], REMOTE_COMMANDS, timeout=60)
+
+def curl_json(name):
+    """Parse the JSON response of a remote curl command"""
+    stdout, stderr, code = REMOTE_RESULTS[name]
     if code != 0:
         return None, stderr
     try:
-        return json.loads(stdout), None
+        return load_json(stdout), None
     except json.JSONDecodeError as e:
         return None, f"JSON parse error: {e}\n{stdout}"
 
@@ -55,7 +96,7 @@ def print_header(text):
 
 def print_result(test_name, success, details=''):
     """Print a test result"""
-    status = f"{GREEN}✓{RESET}" if success else f"{RED}✗{RESET}"
+    status = PASS_MARK if success else FAIL_MARK
     print(f"{status} {test_name}")
     if details:
         print(f"  {details}")
@@ -63,7 +104,7 @@ def print_result(test_name, success, details=''):
 def test_backend_health():
     """Test 1: Backend health check"""
     print_header("Test 1: Backend Health Check")
-    data, error = curl_json('/health')
+    data, error = curl_json('health')
     if error:
         print_result("Backend health check", False, error)
         return False
@@ -76,29 +117,30 @@ def test_backend_health():
 def test_admin_log_level_get():
     """Test 2: GET /admin/log-level"""
     print_header("Test 2: GET /admin/log-level")
-    data, error = curl_json('/admin/log-level')
+    data, error = curl_json('log_level')
     if error:
         print_result("GET /admin/log-level", False, error)
         return False
-    expected_keys = ['currentLevel', 'environment', 'logDir', 'fileLoggingEnabled', 'consoleLoggingEnabled']
-    if all(key in data for key in expected_keys):
+    missing = LOG_LEVEL_KEYS.difference(data)
+    if not missing:
         print_result("GET /admin/log-level", True,
                     f"Level: {data['currentLevel']}, Env: {data['environment']}, Dir: {data['logDir']}")
         return True
-    print_result("GET /admin/log-level", False, f"Missing keys in response: {data}")
+    print_result("GET /admin/log-level", False, f"Missing keys {', '.join(sorted(missing))} in response: {data}")
     return False
 
 def test_admin_log_level_post():
     """Test 3: POST /admin/log-level (Dynamic Change)"""
     print_header("Test 3: POST /admin/log-level (Dynamic Level Change)")
 
-    # Step 1: Change to debug
-    stdout, stderr, code = run_ssh_command(f"curl -s -X POST {API_URL}/admin/log-level -H 'Content-Type: application/json' -d '{{\"level\":\"debug\"}}'")
+    # Step 1: Change to debug (the response reports the logger's level after
+    # the update, so it also verifies the change)
+    stdout, stderr, code = REMOTE_RESULTS['set_debug']
     if code != 0:
         print_result("POST /admin/log-level (set debug)", False, stderr)
         return False
     try:
-        response = json.loads(stdout)
+        response = load_json(stdout)
         if response.get('success') and response.get('currentLevel') == 'debug':
             print_result("POST /admin/log-level (set debug)", True, "Level changed to debug")
         else:
@@ -108,15 +150,8 @@ def test_admin_log_level_post():
         print_result("POST /admin/log-level (set debug)", False, f"JSON parse error: {stdout}")
         return False
 
-    # Step 2: Verify change
-    data, error = curl_json('/admin/log-level')
-    if error or data.get('currentLevel') != 'debug':
-        print_result("Verify debug level", False, f"Level not updated: {data}")
-        return False
-    print_result("Verify debug level", True, "Level confirmed as debug")
-
-    # Step 3: Change back to info
-    stdout, stderr, code = run_ssh_command(f"curl -s -X POST {API_URL}/admin/log-level -H 'Content-Type: application/json' -d '{{\"level\":\"info\"}}'")
+    # Step 2: Change back to info
+    stdout, stderr, code = REMOTE_RESULTS['reset_info']
     if code != 0:
         print_result("POST /admin/log-level (reset info)", False, stderr)
         return False
@@ -127,7 +162,7 @@ def test_admin_log_level_post():
 def test_logs_stats():
     """Test 4: GET /api/logs/stats"""
     print_header("Test 4: GET /api/logs/stats")
-    data, error = curl_json('/api/logs/stats')
+    data, error = curl_json('stats')
     if error:
         print_result("GET /api/logs/stats", False, error)
         return False
@@ -142,7 +177,7 @@ def test_logs_stats():
 def test_logs_filter():
     """Test 5: GET /api/logs/filter"""
     print_header("Test 5: GET /api/logs/filter (Filter by Level)")
-    data, error = curl_json('/api/logs/filter?level=info&limit=3')
+    data, error = curl_json('filter')
     if error:
         print_result("GET /api/logs/filter", False, error)
         return False
@@ -159,23 +194,12 @@ def test_logs_filter():
 def test_frontend_logging():
     """Test 6: POST /api/logs/frontend (Frontend Log Ingestion)"""
     print_header("Test 6: POST /api/logs/frontend (Frontend Log Ingestion)")
-    log_payload = json.dumps({
-        'logs': [{
-            'level': 'info',
-            'message': 'Test log from production test suite',
-            'source': 'frontend',
-            'component': 'test-suite',
-            'sessionId': 'test-session-123',
-            'context': {'test': True, 'timestamp': '2026-01-23T14:00:00Z'}
-        }]
-    })
-    command = f"curl -s -X POST {API_URL}/api/logs/frontend -H 'Content-Type: application/json' -d '{log_payload}'"
-    stdout, stderr, code = run_ssh_command(command)
+    stdout, stderr, code = REMOTE_RESULTS['frontend']
     if code != 0:
         print_result("POST /api/logs/frontend", False, stderr)
         return False
     try:
-        response = json.loads(stdout)
+        response = load_json(stdout)
         if response.get('success'):
             print_result("POST /api/logs/frontend", True, response.get('message', 'Log received'))
             return True
@@ -188,7 +212,7 @@ def test_frontend_logging():
 def test_log_files():
     """Test 7: Verify log files exist and have content"""
     print_header("Test 7: Log Files Verification")
-    stdout, stderr, code = run_ssh_command("ls -lh /var/log/terrainsim/*.log")
+    stdout, stderr, code = REMOTE_RESULTS['log_files']
     if code != 0:
         print_result("Log files check", False, stderr)
         return False
@@ -201,12 +225,12 @@ def test_log_files():
 def test_pm2_status():
     """Test 8: PM2 process status"""
     print_header("Test 8: PM2 Process Status")
-    stdout, stderr, code = run_ssh_command("pm2 jlist")
+    stdout, stderr, code = REMOTE_RESULTS['pm2']
     if code != 0:
         print_result("PM2 status check", False, stderr)
         return False
     try:
-        processes = json.loads(stdout)
+        processes = load_json(stdout)
         terrainsim = next((p for p in processes if p['name'] == 'terrainsim-api'), None)
         if terrainsim:
             status = terrainsim['pm2_env']['status']
@@ -242,6 +266,9 @@ def main():
         ("PM2 Process Status", test_pm2_status),
     ]
 
+    # Every remote command runs up front, in one SSH session
+    REMOTE_RESULTS.update(run_remote_checks())
+
     results = []
     for name, test_func in tests:
         try:
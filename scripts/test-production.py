@@ -4,19 +4,56 @@ Production Testing Script for Phase 3.2
 Tests all logging infrastructure components in production environment
 """
 
+import io
 import sys
 import subprocess
+import threading
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from remote_batch import run_batched
+
 # Configuration
 PRODUCTION_API = "https://api.lmvcruz.work"
 PRODUCTION_SSH = "ubuntu@54.242.131.12"
 SSH_KEY = r"C:\Users\l-cruz\.ssh\terrainsim-key.pem"
 TEST_RESULTS = []
 
+# One keep-alive session for all API tests, so the TLS handshake with the
+# production API happens once; the pool lets the concurrent tests share it.
+# Only connection errors on GETs are retried: the tests check the status codes.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, allowed_methods=["GET"])
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Remote commands of the SSH tests. They run in a single SSH session, started
+# by whichever SSH test runs first (see remote_result)
+REMOTE_COMMANDS = {
+    'ssh_access': "echo 'SSH test successful'",
+    'log_directory': "ls -lhd /var/log/terrainsim",
+    'log_files': "ls -lh /var/log/terrainsim/*.log 2>/dev/null | wc -l",
+    'env_config': "cd /var/www/terrainsim && grep -E 'LOG_LEVEL|LOG_DIR|ENABLE' .env",
+}
+
+# (stdout, stderr, exit code) of each remote command, once they have run
+REMOTE_RESULTS = None
+_remote_lock = threading.Lock()
+
+# Output and results of tests running in worker threads, by thread id
+_buffers = {}
+_thread_results = {}
+
 # ANSI color codes
 class Colors:
     RESET = '\033[0m'
@@ -27,6 +64,38 @@ class Colors:
     CYAN = '\033[96m'
     WHITE = '\033[97m'
 
+# No escape codes when the output is not a terminal (CI logs, files)
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+class ThreadOutput:
+    """Stand-in for sys.stdout that sends writes from worker threads to their buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return _buffers.get(threading.get_ident(), self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def run_buffered(test_func, *args):
+    """Run a test in a worker thread, returning its printed output and recorded results"""
+    thread_id = threading.get_ident()
+    _buffers[thread_id] = io.StringIO()
+    _thread_results[thread_id] = []
+    try:
+        test_func(*args)
+        return _buffers[thread_id].getvalue(), _thread_results[thread_id]
+    finally:
+        del _buffers[thread_id]
+        del _thread_results[thread_id]
+
 def print_header(message):
     """Print test section header"""
     print(f"\n{Colors.CYAN}{'=' * 70}{Colors.RESET}")
@@ -35,7 +104,7 @@ def print_header(message):
 
 def add_test_result(name, status, details=""):
     """Record test result"""
-    TEST_RESULTS.append({
+    _thread_results.get(threading.get_ident(), TEST_RESULTS).append({
         "test": name,
         "status": status,
         "details": details
@@ -50,27 +119,32 @@ def add_test_result(name, status, details=""):
     elif status == "SKIP":
         print(f"{Colors.YELLOW}⊘{Colors.RESET} {name} (skipped)")
 
-def run_ssh_command(command):
-    """Execute SSH command on production server"""
-    try:
-        result = subprocess.run(
-            ['ssh', '-i', SSH_KEY, '-o', 'StrictHostKeyChecking=no', PRODUCTION_SSH, command],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.stdout, result.stderr, result.returncode
-    except subprocess.TimeoutExpired:
-        return "", "Command timed out", 1
-    except Exception as e:
-        return "", str(e), 1
+def run_remote_checks():
+    """Run all REMOTE_COMMANDS in one SSH session, returning (stdout, stderr, code) by name"""
+    return run_batched(
+        ['ssh', '-i', SSH_KEY, '-o', 'StrictHostKeyChecking=no', PRODUCTION_SSH],
+        REMOTE_COMMANDS,
+        timeout=30
+    )
+
+def remote_result(name):
+    """(stdout, stderr, code) of a REMOTE_COMMANDS entry
+
+    The SSH tests run concurrently: the first one to get here runs all the
+    remote commands, the others wait for its results.
+    """
+    global REMOTE_RESULTS
+    with _remote_lock:
+        if REMOTE_RESULTS is None:
+            REMOTE_RESULTS = run_remote_checks()
+    return REMOTE_RESULTS[name]
 
 def test_backend_health():
     """Test 1: Backend health check"""
     print_header("Test 1: Backend Health Check")
 
     try:
-        response = requests.get(f"{PRODUCTION_API}/health", timeout=10)
+        response = SESSION.get(f"{PRODUCTION_API}/health", timeout=10)
         if response.status_code == 200:
             data = response.json()
             add_test_result("Backend health check", "PASS", f"Status: {data.get('status', 'unknown')}")
@@ -87,7 +161,7 @@ def test_admin_log_level_get():
     print_header("Test 2: GET /admin/log-level")
 
     try:
-        response = requests.get(f"{PRODUCTION_API}/admin/log-level", timeout=10)
+        response = SESSION.get(f"{PRODUCTION_API}/admin/log-level", timeout=10)
         if response.status_code == 200:
             data = response.json()
             log_level = data.get('logLevel', 'unknown')
@@ -106,7 +180,7 @@ def test_admin_log_level_post():
 
     try:
         # Change to debug
-        response = requests.post(
+        response = SESSION.post(
             f"{PRODUCTION_API}/admin/log-level",
             json={"level": "debug"},
             timeout=10
@@ -115,16 +189,15 @@ def test_admin_log_level_post():
             add_test_result("POST /admin/log-level (set debug)", "FAIL", f"HTTP {response.status_code}")
             return False
 
-        # Verify change
-        response = requests.get(f"{PRODUCTION_API}/admin/log-level", timeout=10)
-        if response.status_code == 200 and response.json().get('logLevel') == 'debug':
+        # Verify change: the response reports the logger's level after the update
+        if response.json().get('currentLevel') == 'debug':
             add_test_result("POST /admin/log-level (set debug)", "PASS")
         else:
             add_test_result("POST /admin/log-level (set debug)", "FAIL", "Level not changed")
             return False
 
         # Change back to info
-        response = requests.post(
+        response = SESSION.post(
             f"{PRODUCTION_API}/admin/log-level",
             json={"level": "info"},
             timeout=10
@@ -145,7 +218,7 @@ def test_logs_stats():
     print_header("Test 4: GET /api/logs/stats")
 
     try:
-        response = requests.get(f"{PRODUCTION_API}/api/logs/stats", timeout=10)
+        response = SESSION.get(f"{PRODUCTION_API}/api/logs/stats", timeout=10)
         if response.status_code == 200:
             data = response.json()
             total_files = data.get('totalFiles', 0)
@@ -165,7 +238,7 @@ def test_logs_filter():
 
     try:
         # Test filter by level
-        response = requests.get(
+        response = SESSION.get(
             f"{PRODUCTION_API}/api/logs/filter",
             params={"level": "info", "limit": 10},
             timeout=10
@@ -197,7 +270,7 @@ def test_frontend_logging():
             }
         }
 
-        response = requests.post(
+        response = SESSION.post(
             f"{PRODUCTION_API}/api/logs/frontend",
             json=test_log,
             timeout=10
@@ -221,7 +294,7 @@ def test_ssh_access(skip_ssh=False):
         add_test_result("SSH access", "SKIP")
         return True
 
-    stdout, stderr, code = run_ssh_command("echo 'SSH test successful'")
+    stdout, stderr, code = remote_result('ssh_access')
 
     if code == 0 and "SSH test successful" in stdout:
         add_test_result("SSH access", "PASS")
@@ -238,7 +311,7 @@ def test_log_directory(skip_ssh=False):
         add_test_result("Log directory check", "SKIP")
         return True
 
-    stdout, stderr, code = run_ssh_command("ls -lhd /var/log/terrainsim")
+    stdout, stderr, code = remote_result('log_directory')
 
     if code == 0:
         add_test_result("Log directory check", "PASS", stdout.strip())
@@ -255,7 +328,7 @@ def test_log_files(skip_ssh=False):
         add_test_result("Log files check", "SKIP")
         return True
 
-    stdout, stderr, code = run_ssh_command("ls -lh /var/log/terrainsim/*.log 2>/dev/null | wc -l")
+    stdout, stderr, code = remote_result('log_files')
 
     if code == 0:
         file_count = int(stdout.strip() or 0)
@@ -277,9 +350,7 @@ def test_env_configuration(skip_ssh=False):
         add_test_result("Environment config check", "SKIP")
         return True
 
-    stdout, stderr, code = run_ssh_command(
-        "cd /var/www/terrainsim && grep -E 'LOG_LEVEL|LOG_DIR|ENABLE' .env"
-    )
+    stdout, stderr, code = remote_result('env_config')
 
     if code == 0:
         required_vars = ['LOG_LEVEL', 'LOG_DIR', 'ENABLE_FILE_LOGGING']
@@ -326,16 +397,19 @@ def print_summary():
     """Print test results summary"""
     print_header("Test Results Summary")
 
-    passed = sum(1 for r in TEST_RESULTS if r["status"] == "PASS")
-    failed = sum(1 for r in TEST_RESULTS if r["status"] == "FAIL")
-    skipped = sum(1 for r in TEST_RESULTS if r["status"] == "SKIP")
+    # One pass over the results for all three counts
+    counts = Counter(r["status"] for r in TEST_RESULTS)
+    passed = counts["PASS"]
+    failed = counts["FAIL"]
+    skipped = counts["SKIP"]
     total = len(TEST_RESULTS)
 
     print(f"\n{Colors.CYAN}{'Test':<50} {'Status':<10}{Colors.RESET}")
     print(f"{Colors.CYAN}{'-' * 60}{Colors.RESET}")
 
+    status_colors = {"PASS": Colors.GREEN, "FAIL": Colors.RED}
     for result in TEST_RESULTS:
-        status_color = Colors.GREEN if result["status"] == "PASS" else Colors.RED if result["status"] == "FAIL" else Colors.YELLOW
+        status_color = status_colors.get(result["status"], Colors.YELLOW)
         print(f"{result['test']:<50} {status_color}{result['status']:<10}{Colors.RESET}")
 
     print(f"\n{Colors.CYAN}{'=' * 60}{Colors.RESET}")
@@ -375,18 +449,33 @@ def main():
     if skip_ssh:
         print(f"{Colors.YELLOW}SSH tests will be skipped{Colors.RESET}")
 
-    # Run all tests
-    test_backend_health()
-    test_admin_log_level_get()
-    test_admin_log_level_post()
-    test_logs_stats()
-    test_logs_filter()
-    test_frontend_logging()
-    test_ssh_access(skip_ssh)
-    test_log_directory(skip_ssh)
-    test_log_files(skip_ssh)
-    test_env_configuration(skip_ssh)
-    test_python_log_manager()
+    # Run all tests. They are independent network round-trips, so they run
+    # at the same time; each test's output is printed in order once it is done
+    tests = [
+        (test_backend_health,),
+        (test_admin_log_level_get,),
+        (test_admin_log_level_post,),
+        (test_logs_stats,),
+        (test_logs_filter,),
+        (test_frontend_logging,),
+        (test_ssh_access, skip_ssh),
+        (test_log_directory, skip_ssh),
+        (test_log_files, skip_ssh),
+        (test_env_configuration, skip_ssh),
+        (test_python_log_manager,),
+    ]
+
+    saved_stdout = sys.stdout
+    sys.stdout = ThreadOutput(sys.stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(run_buffered, *test) for test in tests]
+            for future in futures:
+                output, results = future.result()
+                sys.stdout.write(output)
+                TEST_RESULTS.extend(results)
+    finally:
+        sys.stdout = saved_stdout
 
     # Print summary and return exit code
     success = print_summary()